@@ -0,0 +1,89 @@
+"""Throughput benchmark for the read-only JSON API.
+
+Starts the API in-process on an ephemeral port (standings from the last
+snapshot or the static fallback, so no network is needed) and hammers
+each route from keep-alive client threads::
+
+    python benchmarks/bench_api.py --threads 8 --seconds 3
+"""
+
+import argparse
+import http.client
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from picks_store import get_picks_store  # noqa: E402
+from pulse_live import SEASON_LABEL, SNAPSHOTS, get_fallback_standings  # noqa: E402
+from sweepstake_api import ApiState, start_api_server  # noqa: E402
+
+
+def _client(port: int, path: str, headers: dict, deadline: float, counts: list, errors: list):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    n = 0
+    try:
+        while time.perf_counter() < deadline:
+            conn.request("GET", path, headers=headers)
+            r = conn.getresponse()
+            r.read()
+            if r.status not in (200, 304):
+                errors.append(r.status)
+            n += 1
+    finally:
+        conn.close()
+        counts.append(n)
+
+
+def bench(port: int, path: str, headers: dict, threads: int, seconds: float) -> float:
+    counts: list[int] = []
+    errors: list[int] = []
+    deadline = time.perf_counter() + seconds
+    workers = [
+        threading.Thread(target=_client, args=(port, path, headers, deadline, counts, errors))
+        for _ in range(threads)
+    ]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    if errors:
+        raise RuntimeError(f"{path}: unexpected statuses {sorted(set(errors))}")
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    store = get_picks_store()
+    state = ApiState(store, SEASON_LABEL)
+    state.update(SNAPSHOTS.latest(SEASON_LABEL) or get_fallback_standings())
+    server = start_api_server(state, port=0)
+    port = server.server_address[1]
+    player = next(iter(store.group()["picks"]))
+    etag = state.get("leaderboard").etag
+
+    cases = [
+        ("/standings", {}),
+        ("/leaderboard", {}),
+        ("/leaderboard", {"Accept-Encoding": "gzip"}),
+        ("/leaderboard", {"If-None-Match": etag}),
+        (f"/players/{player}", {}),
+    ]
+    print(f"{'route':<28}{'headers':<26}{'req/s':>10}")
+    for path, headers in cases:
+        rate = bench(port, path, headers, args.threads, args.seconds)
+        label = ", ".join(headers) or "-"
+        print(f"{path:<28}{label:<26}{rate:>10,.0f}")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""Multi-session load test for the Streamlit app.
+
+Runs N simulated viewers of ``bottoms_sweepstake.py`` concurrently with
+Streamlit's ``AppTest`` against the local Pulse Live stand-in (recorded
+responses, no network). Each session loads the page and then performs a
+seeded mix of realistic actions -- plain reruns, Refresh clicks, what-if
+edits and headshot uploads -- and every rerun is timed. The report gives
+rerun latency percentiles per action, throughput, upstream requests made
+and Python heap per session::
+
+    python benchmarks/load_test.py --sessions 10 --actions 20
+    python benchmarks/load_test.py --sessions 25 --json load.json
+    python benchmarks/load_test.py --latency 0.3 --error-rate 0.05   # slow, flaky upstream
+
+``AppTest`` installs a process-global mock runtime for each run, so
+reruns are serialized through a lock. Sessions still interleave, and each
+rerun's *response* time includes waiting for the reruns queued ahead of
+it, as it would on a real server where CPU-bound reruns contend for the
+GIL; the *service* time is the rerun alone.
+
+Uploads and data files go to a temporary working directory, so the
+repository's headshots, snapshots and registry are left alone.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pulse_standin import start_standin  # noqa: E402
+from timing import RollingTimings  # noqa: E402
+
+APP = os.path.join(REPO, "bottoms_sweepstake.py")
+ACTION_WEIGHTS = {"rerun": 40, "what_if": 30, "refresh": 15, "upload": 15}
+RUN_TIMEOUT = 120
+_RUN_LOCK = threading.Lock()  # see the module docstring
+# A tiny valid PNG for uploads
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+def _app():
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(APP, default_timeout=RUN_TIMEOUT)
+
+
+def _timed(timings: RollingTimings, service: RollingTimings, action: str, fn):
+    start = time.perf_counter()
+    with _RUN_LOCK:
+        acquired = time.perf_counter()
+        fn()
+    end = time.perf_counter()
+    timings.record(action, end - start)
+    service.record(action, end - acquired)
+
+
+def _button(at, label: str):
+    return next(b for b in at.button if b.label.startswith(label))
+
+
+def perform(at, action: str, rng: random.Random):
+    """Run one user action against a loaded session."""
+    if action == "rerun":
+        at.run()
+    elif action == "refresh":
+        _button(at, "🔄 Refresh").click().run()
+    elif action == "what_if":
+        inputs = [n for n in at.number_input if n.key and n.key.startswith("pos_")]
+        # Distinct positions so the builder doesn't report conflicts
+        for widget, pos in zip(inputs, rng.sample(range(1, 21), len(inputs))):
+            widget.set_value(pos)
+        _button(at, "Calculate New Standings").click().run()
+    elif action == "upload":
+        at.sidebar.file_uploader[0].set_value((f"upload{rng.randrange(10**6)}.png", PNG, "image/png")).run()
+    else:
+        raise ValueError(action)
+    if at.exception:
+        raise RuntimeError(f"{action}: {at.exception[0].value}")
+
+
+def run_session(index: int, actions: int, seed: int, timings: RollingTimings,
+                service: RollingTimings, errors: list):
+    rng = random.Random(seed * 1000 + index)
+    try:
+        at = _app()
+        _timed(timings, service, "load", at.run)
+        names, weights = zip(*ACTION_WEIGHTS.items())
+        for _ in range(actions):
+            action = rng.choices(names, weights)[0]
+            _timed(timings, service, action, lambda: perform(at, action, rng))
+    except Exception as e:
+        errors.append(f"session {index}: {e}")
+
+
+def measure_session_memory(count: int) -> float:
+    """Average traced Python heap (bytes) held per loaded session."""
+    tracemalloc.start()
+    try:
+        warm = _app()
+        warm.run()  # imports, caches and worker threads aren't per-session
+        baseline = tracemalloc.get_traced_memory()[0]
+        sessions = []
+        for _ in range(count):
+            at = _app()
+            at.run()
+            sessions.append(at)
+        used = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    return used / count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the Streamlit app with simulated sessions.")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent sessions")
+    parser.add_argument("--actions", type=int, default=20, help="actions per session after the first load")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--memory-sessions", type=int, default=5, help="sessions for the heap measurement (0 = skip)")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in delay per response (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds, at random")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stand-in responses that fail")
+    args = parser.parse_args(argv)
+
+    # Sandbox: stand-in upstream, temp data dir and a working copy of the
+    # assets (uploads are written relative to the working directory)
+    workdir = tempfile.mkdtemp(prefix="sweepstake-load-")
+    shutil.copytree(os.path.join(REPO, "assets"), os.path.join(workdir, "assets"))
+    standin = start_standin(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=args.seed)
+    os.environ["SWEEPSTAKE_PULSE_URL"] = standin.url
+    os.environ["SWEEPSTAKE_DATA_DIR"] = os.path.join(workdir, "data")
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+
+    try:
+        # Warm-up: first import of the app and its modules isn't a viewer's cost
+        _app().run()
+        standin.requests.clear()
+        standin.statuses.clear()
+
+        timings = RollingTimings(window=10**6)
+        service = RollingTimings(window=10**6)
+        errors: list[str] = []
+        threads = [
+            threading.Thread(target=run_session, args=(i, args.actions, args.seed, timings, service, errors))
+            for i in range(args.sessions)
+        ]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - started
+        upstream = dict(standin.requests)
+        upstream_statuses = dict(standin.statuses)
+
+        per_session = measure_session_memory(args.memory_sessions) if args.memory_sessions else None
+    finally:
+        os.chdir(previous_cwd)
+        standin.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    rows = timings.summary()
+    service_p50 = {row["Stage"]: row["p50 (ms)"] for row in service.summary()}
+    for row in rows:
+        row["service p50 (ms)"] = service_p50[row["Stage"]]
+    reruns = sum(row["Samples"] for row in rows)
+    report = {
+        "sessions": args.sessions,
+        "actions_per_session": args.actions,
+        "seed": args.seed,
+        "wall_seconds": round(wall, 2),
+        "reruns": reruns,
+        "reruns_per_second": round(reruns / wall, 2),
+        "latency": rows,
+        "upstream_requests": upstream,
+        "upstream_statuses": upstream_statuses,
+        "heap_per_session_kib": round(per_session / 1024, 1) if per_session is not None else None,
+        "max_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "errors": errors,
+    }
+
+    print(f"{args.sessions} sessions x {args.actions} actions: {reruns} reruns in {wall:.1f}s "
+          f"({report['reruns_per_second']} reruns/s)")
+    print(f"{'action':<10}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'service p50':>13}")
+    for row in rows:
+        print(f"{row['Stage']:<10}{row['Samples']:>6}{row['p50 (ms)']:>10}{row['p95 (ms)']:>10}"
+              f"{row['p99 (ms)']:>10}{row['service p50 (ms)']:>13}")
+    print(f"upstream requests: {upstream}; statuses: {upstream_statuses}")
+    if per_session is not None:
+        print(f"heap per session: {report['heap_per_session_kib']} KiB; max RSS {report['max_rss_mib']} MiB")
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""Micro-benchmarks for the hot data paths, with regression budgets.
+
+Each benchmark times one path on recorded inputs (``fixtures/pulselive/``,
+the bundled picks and headshots), so runs are deterministic and need no
+network::
+
+    python benchmarks/micro.py                 # compare against the baselines
+    python benchmarks/micro.py --only what_if  # a subset
+    python benchmarks/micro.py --update        # record new baselines
+
+The ``cold_import_*`` benchmarks start a fresh interpreter, so they
+track startup cost: heavy dependencies that creep back into module-level
+imports show up there.
+
+Timings are normalised by a fixed pure-Python calibration loop timed in
+the same run, so a baseline recorded on one machine is still meaningful
+on a faster or slower one. A benchmark fails when its normalised time
+exceeds ``baseline * budget``; the exit status is then 1.
+"""
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from frames import compact_picks, compact_standings  # noqa: E402
+from headshots import HEADSHOT_DIR, headshot_path, image_data_uri  # noqa: E402
+from json_stream import iter_array_items  # noqa: E402
+from picks_store import PICKS_PATH, PicksStore  # noqa: E402
+from pulse_live import (  # noqa: E402
+    SEASON_FIELDS,
+    SEASON_LABEL,
+    SEASON_LIST_KEYS,
+    STREAM_CHUNK_SIZE,
+    _entries_frame,
+    _league_entries,
+    _project,
+    _project_entry,
+    select_comp_season,
+)
+from pulse_standin import FIXTURES_DIR  # noqa: E402
+from scoring import PickMatrix, leaderboard, merge_standings, position_conflicts, what_if_totals  # noqa: E402
+from scoring_rules import SCORING_RULES  # noqa: E402
+from team_registry import get_registry  # noqa: E402
+
+APP = os.path.join(REPO, "bottoms_sweepstake.py")
+BASELINES_PATH = os.path.join(REPO, "benchmarks", "baselines.json")
+DEFAULT_BUDGET = 1.5  # allowed slowdown factor over the baseline
+MIN_TIME = 0.2  # seconds per timing round
+REPEAT = 5
+
+BENCHMARKS: dict[str, dict] = {}
+
+
+def benchmark(name: str, budget: float = DEFAULT_BUDGET):
+    """Register a setup function that returns the callable to time."""
+    def register(setup):
+        BENCHMARKS[name] = {"setup": setup, "budget": budget, "doc": (setup.__doc__ or "").strip()}
+        return setup
+    return register
+
+
+# --- Inputs ---
+def _fixture_bytes(name: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def _chunks(data: bytes) -> list[bytes]:
+    """The body as ``iter_content`` would hand it over."""
+    return [data[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(data), STREAM_CHUNK_SIZE)]
+
+
+def _standings():
+    """The recorded table, compacted as the app's loader does."""
+    entries = json.loads(_fixture_bytes("standings.json"))["tables"][0]["entries"]
+    return compact_standings(_entries_frame([_project_entry(e) for e in entries]))
+
+
+def _group():
+    store = PicksStore.load(PICKS_PATH)
+    group_id = store.default_group
+    canonical = get_registry().canonical
+    matrix = PickMatrix({group_id: store.group(group_id)}, canonical=canonical)
+    return compact_picks(store.picks_frame(group_id), canonical), matrix, group_id
+
+
+# --- Benchmarks ---
+@benchmark("compseason_resolution")
+def bench_compseason_resolution():
+    """Stream and project the 360-record season list, pick the season."""
+    chunks = _chunks(_fixture_bytes("compseasons.json"))
+
+    def run():
+        seasons = [_project(s, SEASON_FIELDS) for s in iter_array_items(chunks, SEASON_LIST_KEYS)]
+        return select_comp_season(seasons, SEASON_LABEL)
+    return run
+
+
+@benchmark("standings_extraction")
+def bench_standings_extraction():
+    """Stream the league table's entries and build the standings frame."""
+    chunks = _chunks(_fixture_bytes("standings.json"))
+
+    def run():
+        return _entries_frame(_league_entries(chunks))
+    return run
+
+
+@benchmark("merge_and_score")
+def bench_merge_and_score():
+    """Merge the picks with the standings and score the group."""
+    standings_df = _standings()
+    picks_df, matrix, group_id = _group()
+
+    def run():
+        merged, missing = merge_standings(picks_df, standings_df)
+        return merged, matrix.group_totals(group_id, matrix.score_standings(standings_df))
+    return run
+
+
+@benchmark("scoring_rules")
+def bench_scoring_rules():
+    """Score the group under every scoring rule in one matrix product."""
+    standings_df = _standings()
+    _, matrix, group_id = _group()
+    matrix.team_counts  # built once per picks version in the app
+
+    def run():
+        return matrix.group_rule_totals(group_id, matrix.score_rules(standings_df), SCORING_RULES)
+    return run
+
+
+@benchmark("what_if")
+def bench_what_if():
+    """Re-score the group with five teams moved."""
+    picks_df, _, _ = _group()
+    merged, _ = merge_standings(picks_df, _standings())
+    teams = sorted(merged["Team"].unique())[:5]
+    moves = {team: pos for team, pos in zip(teams, (20, 1, 10, 15, 5))}
+
+    def run():
+        return position_conflicts(moves), what_if_totals(merged, moves)
+    return run
+
+
+# File reads dominate and vary with the page cache, so this one times the
+# whole leaderboard's headshots per call and gets a wider budget.
+@benchmark("image_base64", budget=2.0)
+def bench_image_base64():
+    """Inline every bundled headshot as a data URI (one leaderboard's worth)."""
+    players = sorted(os.path.splitext(name)[0] for name in os.listdir(HEADSHOT_DIR))
+    paths = [headshot_path(player, HEADSHOT_DIR) for player in players]
+
+    def run():
+        return [image_data_uri(path) for path in paths]
+    return run
+
+
+@benchmark("leaderboard_rank")
+def bench_leaderboard_rank():
+    """Rank and sort the group's totals."""
+    picks_df, matrix, group_id = _group()
+    totals = matrix.group_totals(group_id, matrix.score_standings(_standings()))
+
+    def run():
+        return leaderboard(totals)
+    return run
+
+
+def app_imports(path: str = APP) -> list[str]:
+    """Top-level modules the app script imports, in order."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def _cold_import(modules: list[str]):
+    """A fresh interpreter importing ``modules`` -- what a container restart pays."""
+    cmd = [sys.executable, "-c", "import " + ", ".join(modules)]
+
+    def run():
+        subprocess.run(cmd, cwd=REPO, check=True)
+    return run
+
+
+@benchmark("cold_import_app")
+def bench_cold_import_app():
+    """Start an interpreter and import everything the app script imports."""
+    return _cold_import(app_imports())
+
+
+@benchmark("cold_import_cli")
+def bench_cold_import_cli():
+    """Start an interpreter and import the headless CLI (tests, batch runs)."""
+    return _cold_import(["sweepstake_cli"])
+
+
+# --- Timing ---
+def _calibration():
+    total = 0
+    for i in range(20000):
+        total += i * i % 7
+    return total
+
+
+def time_call(fn, min_time: float = MIN_TIME, repeat: int = REPEAT) -> float:
+    """Best seconds per call: autorange to ``min_time``, then ``repeat`` rounds."""
+    fn()  # warm caches, lazy imports and compiled regexes
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed * 4 >= min_time else 10
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def run_benchmarks(names=None, min_time: float = MIN_TIME, repeat: int = REPEAT) -> dict:
+    """``{"calibration": s, "benchmarks": {name: {"seconds", "normalized"}}}``."""
+    calibration = time_call(_calibration, min_time, repeat)
+    results = {}
+    for name in names or BENCHMARKS:
+        seconds = time_call(BENCHMARKS[name]["setup"](), min_time, repeat)
+        results[name] = {"seconds": seconds, "normalized": seconds / calibration}
+    return {"calibration": calibration, "benchmarks": results}
+
+
+def load_baselines(path: str = BASELINES_PATH) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("benchmarks", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baselines(results: dict, path: str = BASELINES_PATH, merge: bool = True):
+    """Record ``results`` as the new baselines (keeping others when ``merge``)."""
+    benchmarks = load_baselines(path) if merge else {}
+    for name, result in results["benchmarks"].items():
+        benchmarks[name] = {"normalized": float(f"{result['normalized']:.6g}"), "seconds": round(result["seconds"], 9)}
+    payload = {
+        "version": 1,
+        "python": sys.version.split()[0],
+        "calibration_seconds": round(results["calibration"], 9),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def compare(results: dict, baselines: dict) -> list[dict]:
+    """One row per benchmark; ``status`` is ok, slow or new (no baseline)."""
+    rows = []
+    for name, result in results["benchmarks"].items():
+        budget = BENCHMARKS[name]["budget"] if name in BENCHMARKS else DEFAULT_BUDGET
+        baseline = baselines.get(name, {}).get("normalized")
+        ratio = result["normalized"] / baseline if baseline else None
+        status = "new" if ratio is None else ("slow" if ratio > budget else "ok")
+        rows.append({"name": name, **result, "baseline": baseline, "ratio": ratio, "budget": budget, "status": status})
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time the hot data paths against recorded baselines.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--update", action="store_true", help="record the results as the new baselines")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="seconds per timing round")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only, args.min_time)
+    rows = compare(results, load_baselines(args.baselines))
+
+    print(f"calibration: {results['calibration'] * 1e6:.1f} us")
+    print(f"{'benchmark':<24}{'us/call':>12}{'normalized':>12}{'baseline':>10}{'ratio':>8}  status")
+    for row in rows:
+        baseline = f"{row['baseline']:.3f}" if row["baseline"] else "-"
+        ratio = f"{row['ratio']:.2f}" if row["ratio"] else "-"
+        print(f"{row['name']:<24}{row['seconds'] * 1e6:>12.1f}{row['normalized']:>12.3f}{baseline:>10}{ratio:>8}  "
+              f"{row['status']}{' (budget ' + str(row['budget']) + 'x)' if row['status'] == 'slow' else ''}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"calibration": results["calibration"], "results": rows}, f, indent=2)
+    if args.update:
+        # A full run replaces the file, so every entry shares one calibration
+        save_baselines(results, args.baselines, merge=bool(args.only))
+        print(f"baselines written to {args.baselines}")
+        return 0
+    return 1 if any(row["status"] == "slow" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,52 @@
 import streamlit as st
 import pandas as pd
-import altair as alt
 from datetime import datetime
-import requests
 import numpy as np
 
+import logging
+import os
 import random
 
-SEASON_LABEL = "2025/26"
+from pulse_live import (
+    BREAKERS,
+    SEASON_LABEL,
+    SNAPSHOTS,
+    _normalize_comp_id,  # noqa: F401 (re-exported for tests)
+    get_fixtures,
+    get_premier_league_standings,
+    resolve_comp_season,
+    season_start_year_from_label,  # noqa: F401 (re-exported for tests)
+)
+from charts import data_hash, history_spec, rankings_spec
+from frames import compact_picks, compact_standings
+from headshots import HEADSHOT_DIR, PLACEHOLDER_URL, headshot_path, image_data_uri
+from live_table import LIVE_POLL_INTERVAL, LiveTableWorker
+from mem_profile import PROFILER
+from metrics import CacheProbe, start_metrics_server
+from movement import MovementTracker, rank_arrow
+from picks_store import PicksStore, get_picks_store
+from refresh_scheduler import (
+    IDLE_INTERVAL,
+    CachePrewarmer,
+    RefreshScheduler,
+    describe_schedule,
+)
+from scoring_rules import SCORING_RULES
+from season_archive import ARCHIVE_PATH, SeasonArchive, archive_stamp
+from scoring import (
+    PickMatrix,
+    leaderboard,
+    merge_standings,
+    position_conflicts,
+    rule_leaders,
+    score_history,
+    what_if_totals,
+)
+from snapshot_store import content_hash
+from team_registry import get_registry
+from timing import ROLLING, span, start_run
+
+logger = logging.getLogger(__name__)
 
 # --- Funky Assets ---
 BANTER_PHRASES = {
@@ -87,39 +126,6 @@ BANTER_PHRASES = {
     ]
 }
 
-# --- Authoritative Opta IDs (for Crests) ---
-# The badge URL uses 't{id}' where id is the OPTA id, not Pulse ID.
-OPTA_ID_MAP = {
-    "Arsenal": "t3",
-    "Aston Villa": "t7",
-    "Bournemouth": "t91",
-    "Brentford": "t94",
-    "Brighton & Hove Albion": "t36",
-    "Brighton and Hove Albion": "t36",
-    "Burnley": "t90",
-    "Chelsea": "t8",
-    "Crystal Palace": "t31",
-    "Everton": "t11",
-    "Fulham": "t54",
-    "Ipswich Town": "t8", # Verify if needed, keeping placeholder
-    "Leeds United": "t2",
-    "Leicester City": "t13",
-    "Liverpool": "t14",
-    "Luton Town": "t102",
-    "Manchester City": "t43",
-    "Manchester United": "t1",
-    "Newcastle United": "t4",
-    "Nottingham Forest": "t17",
-    "Sheffield United": "t49",
-    "Southampton": "t20",
-    "Sunderland": "t56",
-    "Tottenham Hotspur": "t6",
-    "Watford": "t57",
-    "West Ham United": "t21",
-    "Wolverhampton Wanderers": "t39",
-}
-
-
 def get_banter(sorted_players):
     """Generate a random bit of 'banter' based on game state.
     Args:
@@ -161,16 +167,73 @@ def get_banter(sorted_players):
         return "The banter generator is confused. Just like VAR."
 
 
+# Collect stage timings for this rerun (shown in the ?debug=1 panel), and
+# its memory use when SWEEPSTAKE_MEMPROFILE is set
+rerun_timings = start_run()
+rerun_memory = PROFILER.start_run()
+
+# --- Season archive ---
+# Past seasons live in one columnar, memory-mapped file (see
+# season_archive.py). Opening it maps the file once per process; switching
+# seasons only slices it, with no network calls.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_season_archive(stamp: tuple | None) -> SeasonArchive | None:
+    """The archive as of ``stamp`` (its size/mtime), or None if there isn't one."""
+    return SeasonArchive.open(ARCHIVE_PATH) if stamp else None
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def get_archived_picks(season_label: str, stamp: tuple) -> PicksStore:
+    """An archived season's groups and picks (read-only)."""
+    return get_season_archive(stamp).season(season_label).picks_store()
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+@PROFILER.track("archived_standings")
+def get_archived_standings(season_label: str, stamp: tuple, snapshot: int) -> pd.DataFrame:
+    """One archived snapshot as a shared, compact standings frame."""
+    return compact_standings(get_season_archive(stamp).season(season_label).standings(snapshot))
+
+
+# Which season this page shows: ?season=<label> for an archived one, else
+# the current season
+season_archive = get_season_archive(archive_stamp())
+# A season archived without snapshots has nothing to replay
+archived_seasons = [
+    label for label in (season_archive.seasons() if season_archive is not None else [])
+    if len(season_archive.season(label))
+]
+season_label = st.query_params.get("season") or SEASON_LABEL
+archived = season_label != SEASON_LABEL and season_label in archived_seasons
+unknown_season = season_label != SEASON_LABEL and not archived
+if unknown_season:
+    season_label = SEASON_LABEL
+
+# Which sweepstake group this page shows: ?group=<id>, else the default.
+# store_key identifies the picks for cache keys (season plus its version)
+if archived:
+    season_view = season_archive.season(season_label)
+    picks_store = get_archived_picks(season_label, season_archive.stamp)
+    store_key = (season_label, season_archive.stamp)
+else:
+    picks_store = get_picks_store()
+    store_key = (season_label, picks_store.version)
+group_id = st.query_params.get("group") or picks_store.default_group
+unknown_group = group_id not in picks_store
+if unknown_group:
+    group_id = picks_store.default_group
+group = picks_store.group(group_id)
+
 # Set page config
 st.set_page_config(
-    page_title=f"Bottoms Sweepstake {SEASON_LABEL} Season",
+    page_title=f"{group['name']} {season_label} Season",
     page_icon="⚽",
     layout="wide",
 )
 
 # Title and description
-st.title("⚽ Bottoms Sweepstake")
-st.subheader(f"Premier League {SEASON_LABEL} Season")
+st.title(f"⚽ {group['name']}")
+st.subheader(f"Premier League {season_label} Season")
 
 # --- CSS Injection for Funky Animations ---
 st.markdown(
@@ -230,457 +293,278 @@ st.markdown(
 )
 
 # Controls
-col_ctrl1, col_ctrl2 = st.columns([1, 4])
+col_ctrl1, col_ctrl2, col_ctrl3 = st.columns([1, 1, 3])
 with col_ctrl1:
-    if st.button("🔄 Refresh", help="Clear cache and refetch standings"):
-        st.cache_data.clear()
-        st.rerun()
+    refresh_clicked = st.button("🔄 Refresh", help="Clear cache and refetch standings")
 with col_ctrl2:
     if st.button("🎉 Celebrate Leader"):
         st.balloons()
+with col_ctrl3:
+    if archived:
+        # Replay the archived season: any snapshot is just a slice of the file
+        live_mode = False
+        snapshot_dates = season_view.dates()
+        replay_at = st.select_slider(
+            "⏪ Replay",
+            options=range(len(snapshot_dates)),
+            value=len(snapshot_dates) - 1,
+            format_func=lambda i: snapshot_dates[i],
+            help="Show the table as it stood on an earlier date",
+        ) if len(snapshot_dates) > 1 else len(snapshot_dates) - 1
+    else:
+        live_mode = st.toggle(
+            "📡 Live mode",
+            help="During matches, apply in-play scores to a provisional table as they happen",
+        )
+
+if unknown_season:
+    st.warning(f"No archive for season '{st.query_params.get('season')}', showing {SEASON_LABEL}.")
+if unknown_group:
+    st.warning(f"Unknown sweepstake group '{st.query_params.get('group')}', showing {group['name']}.")
 
 # Stake and jackpot info
 col1, col2 = st.columns(2)
 with col1:
-    st.info("**Stake:** £5 each")
+    st.info(f"**Stake:** £{group['stake'] or 5:g} each")
 with col2:
-    st.success("**Jackpot:** £25 🤑")
-
+    st.success(f"**Jackpot:** £{group['jackpot'] or 25:g} 🤑")
 
-import base64
-import os
 
 # --- Helper: image to base64 for dataframe display ---
-def get_image_base64(path):
-    """Convert a local image file to a base64 data URI."""
-    if not os.path.exists(path):
-        return None
-    with open(path, "rb") as f:
-        data = f.read()
-    encoded = base64.b64encode(data).decode()
-    # Assume png for simplicity, browser often handles mixed mime types in data uris gracefully enough
-    # or detect extension. Let's assume PNG/JPG.
-    mime = "image/png"
-    if path.lower().endswith(".jpg") or path.lower().endswith(".jpeg"):
-        mime = "image/jpeg"
-    return f"data:{mime};base64,{encoded}"
-
-# --- Fallback Data ---
-# Used if scraping fails
-def get_fallback_standings():
-    st.warning(
-        f"⚠️ Using placeholder fallback data (previous season snapshot). Could not fetch {SEASON_LABEL} live standings yet."
-    )
-    standings_data = {
-        "Position": list(range(1, 21)),
-        "Team": [
-            "Liverpool", "Arsenal", "Nottingham Forest", "Chelsea",
-            "Manchester City", "Newcastle United", "Brighton and Hove Albion", "Fulham",
-            "Aston Villa", "Bournemouth", "Brentford", "Crystal Palace",
-            "Manchester United", "Tottenham Hotspur", "Everton", "West Ham United",
-            "Wolverhampton Wanderers", "Ipswich Town", "Leicester City", "Southampton",
-        ],
-        "Team_ID": [
-            OPTA_ID_MAP.get("Liverpool", "t14"), OPTA_ID_MAP.get("Arsenal", "t3"), OPTA_ID_MAP.get("Nottingham Forest", "t17"), OPTA_ID_MAP.get("Chelsea", "t8"),
-            OPTA_ID_MAP.get("Manchester City", "t43"), OPTA_ID_MAP.get("Newcastle United", "t4"), OPTA_ID_MAP.get("Brighton and Hove Albion", "t36"), OPTA_ID_MAP.get("Fulham", "t54"),
-            OPTA_ID_MAP.get("Aston Villa", "t7"), OPTA_ID_MAP.get("Bournemouth", "t91"), OPTA_ID_MAP.get("Brentford", "t94"), OPTA_ID_MAP.get("Crystal Palace", "t31"),
-            OPTA_ID_MAP.get("Manchester United", "t1"), OPTA_ID_MAP.get("Tottenham Hotspur", "t6"), OPTA_ID_MAP.get("Everton", "t11"), OPTA_ID_MAP.get("West Ham United", "t21"),
-            OPTA_ID_MAP.get("Wolverhampton Wanderers", "t39"), "t8", "t13", "t20" # Manual fallback for promoted teams if missing in map
-        ], 
-        "Points_League": [
-            70, 58, 54, 49, 48, 47, 47, 45, 45, 44,
-            41, 39, 37, 34, 34, 34, 26, 17, 17, 9
-        ],
-    }
-    df = pd.DataFrame(standings_data)
-    # Add points based on position (reverse order: 1st = 20pts, 20th = 1pt)
-    df["Points_Value"] = 21 - df["Position"]
-    # Generate Crest URLs using the verified IDs
-    df["Crest_URL"] = df["Team_ID"].apply(
-        lambda x: f"https://resources.premierleague.com/premierleague/badges/50/{x}.png" if x else None
-    )
-    return df
+get_image_base64 = span("headshot_encoding")(image_data_uri)
 
+STANDINGS_CACHE = CacheProbe("standings")
 
-# --- Helper: get_comp_season_teams ---
-@st.cache_data(ttl=1800)
-def get_comp_season_teams(comp_id: int) -> list[str]:
-    """Return a list of team names registered to a given compSeason id.
+# Beyond this many groups the sidebar picker is hidden; use ?group=<id>
+GROUP_PICKER_LIMIT = 200
 
-    Tries multiple Pulse Live endpoints because structures can vary pre‑season.
-    Returns an empty list on failure.
-    """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-        ),
-        "Accept": "application/json",
-        "Origin": "https://www.premierleague.com",
-        "Referer": "https://www.premierleague.com/tables",
-    }
+# --- Standings cache ---
+# Entries are keyed by the scheduler's refresh key rather than a fixed TTL:
+# the key rolls over every minute during matches and every few hours
+# otherwise. The TTL/max_entries only bound memory for old keys. It's a
+# resource cache: every session shares one compact, read-only frame
+# instead of unpickling its own copy on each rerun. Snapshot and fallback
+# tables are not kept, so the next rerun retries the API (and lets an
+# open circuit breaker send its half-open probe).
+@st.cache_resource(ttl=2 * IDLE_INTERVAL, max_entries=8)
+@PROFILER.track("standings")
+def _cached_standings(season_label: str, refresh_key: str):
+    STANDINGS_CACHE.miss()
+    standings_df, messages = get_premier_league_standings(season_label)
+    return compact_standings(standings_df), messages
 
-    candidates = [
-        f"https://footballapi.pulselive.com/football/competitions/1/compseasons/{comp_id}/teams",
-        f"https://footballapi.pulselive.com/football/teams?comps=1&compSeasons={comp_id}",
-    ]
 
-    names: set[str] = set()
-    for url in candidates:
-        try:
-            r = requests.get(url, headers=headers, timeout=10)
-            if r.status_code != 200:
-                continue
-            js = r.json()
-
-            # Flexible extraction across likely shapes
-            items = (
-                js.get("teams")
-                or js.get("clubs")
-                or js.get("content")
-                or (js if isinstance(js, list) else [])
-            )
-            for it in items:
-                n = (
-                    it.get("name")
-                    or (it.get("team") or {}).get("name")
-                    or (it.get("club") or {}).get("name")
-                    or it.get("displayName")
-                )
-                if n:
-                    names.add(str(n).strip())
-        except Exception:
-            continue
+def load_standings(season_label: str = SEASON_LABEL, refresh_key: str = ""):
+    """Cached wrapper around ``pulse_live.get_premier_league_standings``."""
+    standings_df, messages = _cached_standings(season_label, refresh_key)
+    if standings_df.attrs.get("source") in ("snapshot", "fallback"):
+        _cached_standings.clear(season_label, refresh_key)
+    return standings_df, messages
+
 
-    return sorted(names)
+@st.cache_data(ttl=IDLE_INTERVAL)
+def _cached_fixtures(season_label: str) -> list[dict]:
+    comp_id = resolve_comp_season(season_label)
+    return get_fixtures(comp_id) if comp_id else []
 
 
-# --- Helper: normalize compSeason id to an int ---
-def _normalize_comp_id(value):
-    """Return a clean integer compSeason id from various input types.
+def load_fixtures(season_label: str = SEASON_LABEL) -> list[dict]:
+    """Fixtures (with kickoff times) for the season; empty if unavailable.
 
-    Handles ints, floats (e.g., 777.0), and numeric strings ('777' or '777.0').
-    Falls back to the original value if conversion is impossible.
+    An empty list (API down, season unresolved) isn't kept, so the next
+    rerun asks again rather than scheduling without fixtures for hours.
     """
-    try:
-        # Fast path if already int
-        if isinstance(value, int):
-            return value
-        # Handle floats and numpy types
-        if isinstance(value, float):
-            return int(round(value))
-        # Handle strings like '777.0' or ' 777 '
-        s = str(value).strip()
-        try:
-            # If it parses as float, coerce to int
-            f = float(s)
-            return int(round(f))
-        except Exception:
-            return int(s)
-    except Exception:
-        return value
-
-
-def season_start_year_from_label(label: str) -> int | None:
-    """Parse a season label like '2025/26' into its start year (e.g., 2025)."""
-    try:
-        return int(str(label).strip().split("/")[0])
-    except Exception:
-        return None
+    fixtures = _cached_fixtures(season_label)
+    if not fixtures:
+        _cached_fixtures.clear(season_label)
+    return fixtures
 
 
-# Function to get current Premier League standings via public JSON API
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
-def get_premier_league_standings(season_label: str = SEASON_LABEL) -> pd.DataFrame:
-    """Fetch Premier League standings for a given season label (e.g. "2025/26").
+def get_refresh_scheduler(season_label: str = SEASON_LABEL) -> RefreshScheduler:
+    return RefreshScheduler.from_fixtures(load_fixtures(season_label))
 
-    This uses the Premier League's public data service (footballapi.pulselive.com)
-    to resolve the compSeason ID for the requested season and then retrieves the
-    table standings. If anything fails (e.g., network issues, season not yet
-    populated), it falls back to static placeholder data.
 
-    Parameters
-    ----------
-    season_label : str
-        The season label to fetch (default: value of SEASON_LABEL constant).
+@st.cache_resource
+def start_live_worker(season_label: str = SEASON_LABEL) -> LiveTableWorker:
+    """Start (once per process) the worker every live-mode session reads from."""
+    def base():
+        key = get_refresh_scheduler(season_label).refresh_key()
+        return key, load_standings(season_label, key)[0]
 
-    Returns
-    -------
-    pandas.DataFrame
-        Columns: [Position, Team, Points_League, Points_Value]
-    """
-    # --- Insert: try to parse the requested start year for special matching ---
-    requested_start_year = season_start_year_from_label(season_label)
+    def live_fixtures():
+        comp_id = resolve_comp_season(season_label)
+        return get_fixtures(comp_id, statuses="L") if comp_id else []
 
-    seasons_url = (
-        "https://footballapi.pulselive.com/football/competitions/1/compseasons"
+    worker = LiveTableWorker(
+        base,
+        live_fixtures,
+        is_live=lambda: get_refresh_scheduler(season_label).is_live(),
+        canonical=get_registry().canonical,
     )
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-        ),
-        "Accept": "application/json",
-        "Origin": "https://www.premierleague.com",
-        "Referer": "https://www.premierleague.com/tables",
-    }
+    worker.start()
+    return worker
 
-    try:
-        # Resolve the compSeason ID for the requested season label
-        # Use multiple endpoints and explicit pagination; some responses are paginated or use 'content'
-        season_sources = [
-            "https://footballapi.pulselive.com/football/competitions/1/compseasons?page=0&pageSize=120",
-            "https://footballapi.pulselive.com/football/compseasons?comps=1&page=0&pageSize=120",
-            seasons_url,  # fallback (may be unpaginated)
-        ]
-
-        seasons_list = []
-        for url in season_sources:
-            try:
-                r = requests.get(url, headers=headers, timeout=10)
-                if r.status_code != 200:
-                    continue
-                js = r.json()
-                items = (
-                    js.get("compSeasons")
-                    or js.get("seasons")
-                    or js.get("content")
-                    or (js if isinstance(js, list) else [])
-                )
-                # Ensure list
-                if isinstance(items, dict):
-                    items = [items]
-                seasons_list.extend(items)
-            except Exception:
-                continue
-
-        comp_id = None
-        fallback_current = None
-        latest_id = None
-        latest_start = None
-        # --- Insert: track compSeason id matching the requested start year ---
-        comp_id_start_year = None
-
-        for s in seasons_list:
-            label = s.get("label") or s.get("competition", {}).get("label")
-            sid_raw = s.get("id") or (s.get("compSeason") or {}).get("id")
-            sid = _normalize_comp_id(sid_raw)
-            start = s.get("startDate") or s.get("start", {}).get("date")
-            is_current = s.get("isCurrent") or s.get("current", False)
-
-            if season_label and label == season_label:
-                comp_id = sid
-
-            if is_current and fallback_current is None:
-                fallback_current = sid
-
-            if start:
-                try:
-                    # Normalise ISO strings that may contain a 'T'
-                    ts = start.replace("Z", "").replace("T", " ")
-                    dt = datetime.fromisoformat(ts)
-                    if latest_start is None or dt > latest_start:
-                        latest_start = dt
-                        latest_id = sid
-                except Exception:
-                    pass
-
-            # Prefer explicit start-year match if label match is unavailable
-            if requested_start_year and start:
-                try:
-                    ts2 = start.replace("Z", "").replace("T", " ")
-                    dt2 = datetime.fromisoformat(ts2)
-                    if dt2.year == requested_start_year and comp_id_start_year is None:
-                        comp_id_start_year = sid
-                except Exception:
-                    pass
-
-        if not comp_id:
-            # Try the start-year match for upcoming seasons
-            comp_id = comp_id_start_year or fallback_current or latest_id
-
-        # Normalize comp_id to an integer (avoid '777.0' which causes 400s)
-        comp_id = _normalize_comp_id(comp_id)
-
-        if not comp_id:
-            st.error("Could not resolve a Premier League compSeason id.")
-            return get_fallback_standings()
-
-        # Fetch standings for the resolved compSeason id
-        comp_id_str = str(_normalize_comp_id(comp_id))
-        standings_url = (
-            f"https://footballapi.pulselive.com/football/standings?compSeasons={comp_id_str}"
-            "&altIds=true&detail=2"
-        )
-        resp2 = requests.get(standings_url, headers=headers, timeout=10)
-        resp2.raise_for_status()
-        data = resp2.json()
-
-        tables = data.get("tables") or data.get("standings") or []
-
-        # Prefer the TOTAL (league) table; otherwise, take the first available
-        table_total = None
-        for t in tables:
-            t_type = (t.get("type") or t.get("stage", {}).get("type", "")).upper()
-            if t_type in ("TOTAL", "LEAGUE"):
-                table_total = t
-                break
-        if table_total is None and tables:
-            table_total = tables[0]
-
-        entries = table_total.get("entries", []) if table_total else []
-
-        positions: list[int] = []
-        teams: list[str] = []
-        ids: list[str] = []  # Store team IDs (Opta Strings)
-        points_league: list[int] = []
-
-        for e in entries:
-            pos = e.get("position") or e.get("rank")
-
-            # Team name can live under a few different keys—be defensive
-            team_name = (
-                (e.get("team") or {}).get("name")
-                or (e.get("team", {}).get("club") or {}).get("name")
-                or (e.get("club") or {}).get("name")
-                or (e.get("team") or {}).get("displayName")
-            )
 
-            # Points can appear either directly or inside a stats collection
-            points = e.get("points")
-            if points is None:
-                stats = e.get("stats", {})
-                if isinstance(stats, dict) and "points" in stats:
-                    points = stats.get("points")
-                elif isinstance(stats, list):
-                    for it in stats:
-                        if it.get("name") in ("points", "pts", "Points"):
-                            points = it.get("value") or it.get("displayValue")
-                            break
-
-            if pos is None or team_name is None:
-                continue
-
-            try:
-                positions.append(int(pos))
-            except Exception:
-                continue
-
-            teams.append(str(team_name).strip())
-
-            # Map correct ID from hardcoded map first, falling back to API response (looking for 'opta' id)
-            clean_name = str(team_name).strip()
-            # Try exact match or match stripping 'FC' etc if needed (usually exact works with Pulse Live names)
-            mapped_id = OPTA_ID_MAP.get(clean_name)
-            
-            if mapped_id:
-                ids.append(mapped_id)
-            else:
-                 # Extract Opta ID from API response if not in map
-                opta_id = (e.get("team") or {}).get("altIds", {}).get("opta")
-                # Fallback to hardcoded generic or Pulse ID extraction if absolutely necessary, but Opta usually exists
-                if not opta_id:
-                     # Try finding 'club'
-                     opta_id = (e.get("club") or {}).get("altIds", {}).get("opta")
-                
-                ids.append(str(opta_id) if opta_id else "t0")
-
-            # Extract points (usually in 'overall' -> 'points')
-            points = 0
-            if "overall" in e and "points" in e["overall"]:
-                points = e["overall"]["points"]
-            elif "points" in e:
-                points = e["points"]
-            
-            try:
-                points_league.append(int(points))
-            except Exception:
-                # Early-season/empty table case: default to zero
-                points_league.append(0)
-
-        if not positions:
-            # Pre‑season: standings can be empty even though the compSeason exists.
-            team_names = get_comp_season_teams(comp_id)
-            if team_names:
-                df = pd.DataFrame(
-                    {
-                        "Position": [0] * len(team_names),
-                        "Team": team_names,
-                        "Points_League": [0] * len(team_names),
-                    }
-                )
-                df["Points_Value"] = 0
-                st.info(
-                    f"📅 {season_label} pre‑season: teams loaded; league table will populate once matches are played."
-                )
-                return df
+@st.fragment(run_every=LIVE_POLL_INTERVAL)
+def watch_live_table(worker: LiveTableWorker, seen_version: int):
+    """Rerun the page whenever the shared live table publishes a new version."""
+    if worker.version != seen_version:
+        st.rerun()
 
-            st.warning(
-                f"No league entries returned for {season_label}, and no team list available; showing fallback."
-            )
-            return get_fallback_standings()
 
-        df = pd.DataFrame(
-            {"Position": positions, "Team": teams, "Team_ID": ids, "Points_League": points_league}
-        )
-        # Generate Crest URLs
-        df["Crest_URL"] = df["Team_ID"].apply(
-            lambda x: f"https://resources.premierleague.com/premierleague/badges/50/{x}.png" if x and x != "t0" else None
-        )
+@st.cache_resource
+def start_metrics_endpoint(port: int):
+    """Serve Prometheus metrics on localhost (once per process).
 
-        df.sort_values("Position", inplace=True)
-        df["Points_Value"] = 21 - df["Position"]
-        st.success("✅ Live standings fetched successfully!")
-        return df
-
-    except requests.exceptions.RequestException as exc:
-        st.error(f"Network error fetching standings: {exc}")
-        return get_fallback_standings()
-    except Exception as exc:
-        st.error(f"An unexpected error occurred while fetching standings: {exc}")
-        return get_fallback_standings()
-
-
-# Create player picks data for the 24/25 season
-def get_player_picks():
-    return pd.DataFrame(
-        {
-            "Player": [
-                "Vosey",
-                "Vosey",
-                "Dom",
-                "Dom",
-                "Chris",
-                "Chris",
-                "Sam",
-                "Sam",
-                "Adam",
-                "Adam",
-                "Sean",
-                "Sean",
-            ],
-            "Team": [
-                "Bournemouth",
-                "Leeds United",
-                "Brentford",
-                "Sunderland",
-                "Wolverhampton Wanderers",
-                "Fulham",
-                "Burnley",
-                "Tottenham Hotspur",
-                "West Ham United",
-                "Manchester United",
-                "Everton",
-                "Crystal Palace",
-            ],
-        }
+    A port that's already taken is logged once and the page runs without
+    the exporter, rather than failing on every rerun.
+    """
+    try:
+        return start_metrics_server(port)
+    except OSError as exc:
+        logger.warning("Metrics endpoint not started on port %d: %s", port, exc)
+        return None
+
+
+@st.cache_resource
+def start_prewarmer(season_label: str = SEASON_LABEL) -> CachePrewarmer:
+    """Start (once per process) the thread that warms the next refresh key."""
+    prewarmer = CachePrewarmer(
+        lambda: get_refresh_scheduler(season_label),
+        lambda key: load_standings(season_label, key),
     )
+    prewarmer.start()
+    return prewarmer
+
+
+# Player picks come from data/picks.json (or SWEEPSTAKE_PICKS). Teams are
+# resolved to the registry's canonical names so spelling differences
+# ("Brighton and Hove Albion" vs "Brighton & Hove Albion") still merge.
+# Archived seasons pass their own store; store_key names it in cache keys.
+@st.cache_resource(max_entries=64)
+@PROFILER.track("picks")
+def _shared_picks(group_id: str | None, store_key: tuple, registry_size: int, _store: PicksStore):
+    return compact_picks(_store.picks_frame(group_id), get_registry().canonical)
+
+
+def get_player_picks(group_id: str | None = None, store: PicksStore | None = None,
+                     store_key: tuple | None = None):
+    """The group's picks as a shared, read-only compact frame."""
+    if store is None:
+        store = get_picks_store()
+        store_key = (SEASON_LABEL, store.version)
+    return _shared_picks(group_id, store_key, len(get_registry()), store)
+
+
+@st.cache_resource(max_entries=8)
+@PROFILER.track("pick_matrix")
+def get_pick_matrix(store_key: tuple, _store: PicksStore) -> PickMatrix:
+    """Every group's picks flattened for vectorised scoring (once per store version)."""
+    return PickMatrix(_store.groups, canonical=get_registry().canonical)
+
+
+@st.cache_data(max_entries=8)
+@PROFILER.track("group_scores")
+def score_all_groups(standings_hash: str, store_key: tuple, _standings_df: pd.DataFrame, _store: PicksStore):
+    """Score all groups against one standings table; keyed by its content hash."""
+    return get_pick_matrix(store_key, _store).score_standings(_standings_df)
+
+
+@st.cache_data(max_entries=8)
+@PROFILER.track("rule_scores")
+def score_all_rules(standings_hash: str, store_key: tuple, _standings_df: pd.DataFrame, _store: PicksStore):
+    """Every group under every scoring rule (rules x slots) in one matrix product."""
+    return get_pick_matrix(store_key, _store).score_rules(_standings_df, SCORING_RULES)
+
+
+if refresh_clicked:
+    st.cache_data.clear()
+    _cached_standings.clear()
+    st.rerun()
+
+# --- Movement and head-to-head ---
+# One tracker per picks version, fed only the snapshots appended since the
+# last rerun. An archived season is replayed up to the chosen snapshot.
+@st.cache_resource(max_entries=8)
+def get_movement_tracker(store_key: tuple, _store: PicksStore) -> MovementTracker:
+    """The current season's tracker (call ``catch_up`` before reading it)."""
+    return MovementTracker(get_pick_matrix(store_key, _store))
+
+
+@st.cache_resource(max_entries=16)
+def get_replay_tracker(store_key: tuple, snapshot: int, _store: PicksStore, _view) -> MovementTracker:
+    """A tracker over an archived season's snapshots up to ``snapshot``."""
+    tracker = MovementTracker(get_pick_matrix(store_key, _store))
+    for i in range(snapshot + 1):
+        tracker.add(_view.standings(i))
+    return tracker
+
+
+# --- Chart specs ---
+# Built as plain Vega-Lite dicts and cached by the data's content hash, so
+# a rerun with unchanged totals reuses the ready spec
+@st.cache_data(max_entries=32)
+@PROFILER.track("rankings_chart")
+def rankings_chart(totals_hash: str, title: str, scheme: str, x_title: str, _totals: pd.DataFrame) -> dict:
+    """Rankings bar chart spec for ``_totals`` (identified by ``totals_hash``)."""
+    return rankings_spec(_totals, title, scheme, x_title)
+
+
+@st.cache_data(max_entries=16)
+@PROFILER.track("history_chart")
+def history_chart(group_id: str, store_key: tuple, snapshots_version: tuple, _store: PicksStore,
+                  _snapshots) -> dict | None:
+    """Season history line chart spec; None until there are two days to plot.
+
+    ``_snapshots`` is called for the standings snapshots only on a cache miss.
+    """
+    history = score_history(get_pick_matrix(store_key, _store), group_id, _snapshots())
+    if history["Date"].nunique() < 2:
+        return None
+    return history_spec(history)
 
 
-# Get standings data (tries scraping, falls back to static)
-standings_df = get_premier_league_standings()
+# Opt-in Prometheus endpoint, e.g. SWEEPSTAKE_METRICS_PORT=9464
+if os.environ.get("SWEEPSTAKE_METRICS_PORT"):
+    start_metrics_endpoint(int(os.environ["SWEEPSTAKE_METRICS_PORT"]))
+
+# Get standings data (tries scraping, falls back to static); archived
+# seasons are read from the archive, never fetched
+if archived:
+    refresh_scheduler = None
+    standings_df = get_archived_standings(season_label, season_archive.stamp, replay_at)
+    standings_messages = [("info", f"📼 Replaying the {season_label} season as of {snapshot_dates[replay_at]}.")]
+else:
+    refresh_scheduler = get_refresh_scheduler()
+    if st.runtime.exists():
+        start_prewarmer()
+    with STANDINGS_CACHE.lookup():
+        standings_df, standings_messages = load_standings(
+            SEASON_LABEL, refresh_scheduler.refresh_key()
+        )
+    if standings_df.attrs.get("source") != "live":
+        STANDINGS_CACHE.stale()
+for level, message in standings_messages:
+    getattr(st, level)(message)
+
+if live_mode:
+    live_worker = start_live_worker()
+    live_version, live_df = live_worker.snapshot()
+    if live_df is not None and live_worker.matches_in_play:
+        standings_df = live_df
+        st.caption(
+            f"📡 Provisional table including {live_worker.matches_in_play} "
+            "match(es) in play. Positions will change as goals go in!"
+        )
+    elif live_df is not None and live_worker.fixtures_applied:
+        # Matches just finished: keep their results until the official table has them
+        standings_df = live_df
+        st.caption("📡 Provisional table including results not yet in the official standings.")
+    else:
+        st.caption("📡 Live mode is on, but no matches are in play right now.")
+    watch_live_table(live_worker, live_version)
 
-picks_df = get_player_picks()
+picks_df = get_player_picks(group_id, picks_store, store_key)
 
 if standings_df is None or standings_df.empty:
     st.error("🚨 Critical Error: Could not load league standings data. Aborting.")
@@ -690,34 +574,25 @@ if standings_df is None or standings_df.empty:
 
 # Merge with standings to get points
 # Add validation to handle cases where a picked team might not be in the scraped standings (e.g., mid-season)
-merged_df = pd.merge(picks_df, standings_df, on="Team", how="left")
-
-# Handle potential missing teams after merge (if scraping failed partially or team names mismatch)
-missing_teams = merged_df[merged_df["Position"].isna()]
-if not missing_teams.empty:
-    st.warning("Could not find standings data for the following teams:")
-    st.dataframe(missing_teams[["Player", "Team"]], hide_index=True)
-    # Decide how to handle points for missing teams: assign 0 or handle differently
-    merged_df["Points_Value"] = merged_df["Points_Value"].fillna(
-        0
-    )  # Assign 0 points if team not found
-    merged_df["Position"] = merged_df["Position"].fillna(0)  # Assign 0 position
-    merged_df["Points_League"] = merged_df["Points_League"].fillna(
-        0
-    )  # Assign 0 league points
-
-# --- Ensure numeric, finite values to keep charts happy ---
-for col in ["Points_Value", "Points_League", "Position"]:
-    merged_df[col] = pd.to_numeric(merged_df[col], errors="coerce")
-merged_df.replace([np.inf, -np.inf], np.nan, inplace=True)
-merged_df[["Points_Value", "Points_League", "Position"]] = merged_df[
-    ["Points_Value", "Points_League", "Position"]
-].fillna(0)
-
-
-# Calculate total points per player
-player_totals = merged_df.groupby("Player")["Points_Value"].sum().reset_index()
-player_totals = player_totals.sort_values("Points_Value", ascending=False)
+with span("merge_score"):
+    # Teams missing from the standings (partial scrape or name mismatch) score 0
+    merged_df, missing_teams = merge_standings(picks_df, standings_df)
+    if not missing_teams.empty:
+        st.warning("Could not find standings data for the following teams:")
+        st.dataframe(missing_teams, hide_index=True)
+
+    # Total points per player: one vectorised pass scores every group against
+    # this table (cached per table content), this page just takes its slice
+    group_scores = score_all_groups(content_hash(standings_df), store_key, standings_df, picks_store)
+    player_totals = get_pick_matrix(store_key, picks_store).group_totals(group_id, group_scores)
+
+    # Rank and points change since the previous snapshot
+    if archived:
+        movement_tracker = get_replay_tracker(store_key, replay_at, picks_store, season_view)
+    else:
+        movement_tracker = get_movement_tracker(store_key, picks_store)
+        movement_tracker.catch_up(SNAPSHOTS, SEASON_LABEL)
+    player_movement = movement_tracker.movement(group_id, group_scores).set_index("Player")
 
 # Display last update time
 current_time = datetime.now().strftime("%d %B %Y %H:%M:%S")
@@ -762,8 +637,52 @@ with st.expander("Points Assignment & Current Standings"):
         use_container_width=True,
     )
 
+# Archived seasons have no upcoming refreshes
+if refresh_scheduler is not None:
+    with st.expander("🗓️ Refresh Schedule"):
+        now_mode = "🔴 live match window" if refresh_scheduler.is_live() else "idle"
+        next_at = datetime.fromtimestamp(refresh_scheduler.next_refresh())
+        st.write(
+            f"Currently **{now_mode}**: standings refresh every "
+            f"{refresh_scheduler.interval_at() // 60} minutes. "
+            f"Next refresh at {next_at.strftime('%d %B %Y %H:%M:%S')}."
+        )
+        budget_day = refresh_scheduler.request_budget()
+        budget_week = refresh_scheduler.request_budget(
+            end=datetime.now().timestamp() + 7 * 24 * 3600
+        )
+        st.caption(
+            f"Upstream standings requests: {budget_day['upstream_requests']} in the next 24h "
+            f"({budget_day['live_refreshes']} during matches), "
+            f"{budget_week['upstream_requests']} in the next 7 days."
+        )
+        schedule_rows = describe_schedule(refresh_scheduler)
+        if schedule_rows:
+            st.dataframe(pd.DataFrame(schedule_rows), hide_index=True, use_container_width=True)
+
 # --- Player Profile / Headshot Upload ---
 with st.sidebar:
+    if archived_seasons:
+        season_labels = [SEASON_LABEL] + [label for label in archived_seasons if label != SEASON_LABEL]
+        chosen_season = st.selectbox("Season", season_labels, index=season_labels.index(season_label))
+        if chosen_season != season_label:
+            if chosen_season == SEASON_LABEL:
+                del st.query_params["season"]
+            else:
+                st.query_params["season"] = chosen_season
+            st.rerun()
+    if 1 < len(picks_store) <= GROUP_PICKER_LIMIT:
+        group_ids = picks_store.group_ids()
+        chosen_group = st.selectbox(
+            "Sweepstake group",
+            group_ids,
+            index=group_ids.index(group_id),
+            format_func=lambda gid: picks_store.group(gid)["name"],
+        )
+        if chosen_group != group_id:
+            st.query_params["group"] = chosen_group
+            st.rerun()
+
     st.header("👤 Player Profile")
     players_list = sorted(picks_df["Player"].unique())
     selected_player = st.selectbox("Select Player to Edit", players_list)
@@ -771,10 +690,12 @@ with st.sidebar:
     st.caption("Upload a new headshot:")
     uploaded_file = st.file_uploader("Choose an image...", type=['png', 'jpg', 'jpeg'])
     
-    headshot_dir = "assets/headshots"
+    headshot_dir = HEADSHOT_DIR
     os.makedirs(headshot_dir, exist_ok=True)
     
-    if uploaded_file is not None:
+    # The uploader keeps its file across reruns, so handle each upload once
+    if uploaded_file is not None and st.session_state.get("headshot_upload_id") != uploaded_file.file_id:
+        st.session_state["headshot_upload_id"] = uploaded_file.file_id
         file_ext = os.path.splitext(uploaded_file.name)[1]
         if not file_ext:
             file_ext = ".png" # default
@@ -788,20 +709,17 @@ with st.sidebar:
             f.write(uploaded_file.getbuffer())
         
         st.success(f"Headshot updated for {selected_player}!")
-        st.cache_data.clear() # Clear cache to potentially reload visuals if they depended on cached data
-        # time.sleep(1) # requires import time; skip or just rerun
+        # Headshots are read from disk on every rerun, so there's no cache to
+        # clear (clearing st.cache_data would also force a standings refetch)
         st.rerun()
 
 # --- Helper to get headshot URL/Base64 for a player ---
 def get_player_headshot(player_name):
-    # Check for png/jpg/jpeg
-    for ext in [".png", ".jpg", ".jpeg"]:
-        path = os.path.join("assets/headshots", f"{player_name}{ext}")
-        if os.path.exists(path):
-            return get_image_base64(path)
-    # Return a default placeholder (online or local?)
-    # Using a generic placeholder URL
-    return "https://www.gravatar.com/avatar/00000000000000000000000000000000?d=mp&f=y"
+    path = headshot_path(player_name)
+    if path:
+        return get_image_base64(path)
+    # Generic placeholder avatar
+    return PLACEHOLDER_URL
 
 
 # Display player picks and points
@@ -824,145 +742,118 @@ else:
 cols = st.columns(len(picks_df["Player"].unique()))  # Dynamically create columns
 players = sorted(picks_df["Player"].unique())
 
-for i, player in enumerate(players):
-    with cols[i]:
-        # Header with Headshot
-        headshot_src = get_player_headshot(player)
+with span("card_rendering"):
+    for i, player in enumerate(players):
+        with cols[i]:
+            # Header with Headshot
+            headshot_src = get_player_headshot(player)
         
-        # Styles for Headshot
-        img_class = "headshot-img"
-        extra_badges = ""
+            # Styles for Headshot
+            img_class = "headshot-img"
+            extra_badges = ""
         
-        if player == current_leader:
-            extra_badges = "👑"
-        elif player == current_loser:
-            extra_badges = "🥄"
-
-        # Use HTML for the circular headshot + name combo
-        st.markdown(
-            f"""
-            <div style="text-align: center;">
-                <img src="{headshot_src}" class="{img_class}" style="width: 80px; height: 80px; border-radius: 50%; object-fit: cover; border: 2px solid #ddd;">
-                <h3>{player} {extra_badges}</h3>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-
-        player_data = merged_df[merged_df["Player"] == player]
-        # Recalculate total points here to ensure consistency after potential fillna
-        total_points = player_data["Points_Value"].sum()
-
-        # Styles for the Card Container
-        card_class = ""
-        if player == current_leader:
-            card_class = "leader-card"
-        elif player == current_loser:
-            card_class = "loser-card"
-
-        for _, row in player_data.iterrows():
-            team = row["Team"]
-            position = row["Position"]
-            points = row["Points_Value"]
-            league_points = row["Points_League"]
-            crest = row.get("Crest_URL")
-
-            # Format position nicely, handle potential 0 from fillna
-            pos_display = f"{int(position)}" if position > 0 else "N/A"
-
-            # Calculate background color based on points (higher = better)
-            # Handle potential 0 points from fillna
-            intensity = int(min(255, 100 + (points / 20) * 155)) if points > 0 else 100
-            bg_color = (
-                f"rgba(0, {intensity}, 0, 0.2)"
-                if points > 0
-                else "rgba(128, 128, 128, 0.1)"
-            )  # Grey if N/A
-            
-            # Crest image tag
-            crest_html = f'<img src="{crest}" width="24" style="vertical-align: middle; margin-right: 5px;">' if crest else ''
+            if player == current_leader:
+                extra_badges = "👑"
+            elif player == current_loser:
+                extra_badges = "🥄"
 
+            # Use HTML for the circular headshot + name combo
             st.markdown(
                 f"""
-                <div class="{card_class}" style="padding: 10px; margin-bottom: 10px; background-color: {bg_color}; border-radius: 5px;">
-                    <div style="font-weight: bold; font-size: 1.1em;">{crest_html}{team}</div>
-                    Position: {pos_display}<br>
-                    Sweepstake Points: {int(points)}<br>
-                    League Points: {int(league_points)}
+                <div style="text-align: center;">
+                    <img src="{headshot_src}" class="{img_class}" style="width: 80px; height: 80px; border-radius: 50%; object-fit: cover; border: 2px solid #ddd;">
+                    <h3>{player} {extra_badges}</h3>
                 </div>
                 """,
-                unsafe_allow_html=True,
+                unsafe_allow_html=True
             )
 
-        st.markdown(f"<div style='text-align: center; font-weight: bold;'>Total: {int(total_points)} points</div>", unsafe_allow_html=True)
+            player_data = merged_df[merged_df["Player"] == player]
+            # Recalculate total points here to ensure consistency after potential fillna
+            total_points = player_data["Points_Value"].sum()
+
+            # Styles for the Card Container
+            card_class = ""
+            if player == current_leader:
+                card_class = "leader-card"
+            elif player == current_loser:
+                card_class = "loser-card"
+
+            for _, row in player_data.iterrows():
+                team = row["Team"]
+                position = row["Position"]
+                points = row["Points_Value"]
+                league_points = row["Points_League"]
+                crest = row.get("Crest_URL")
+
+                # Format position nicely, handle potential 0 from fillna
+                pos_display = f"{int(position)}" if position > 0 else "N/A"
+
+                # Calculate background color based on points (higher = better)
+                # Handle potential 0 points from fillna
+                intensity = int(min(255, 100 + (points / 20) * 155)) if points > 0 else 100
+                bg_color = (
+                    f"rgba(0, {intensity}, 0, 0.2)"
+                    if points > 0
+                    else "rgba(128, 128, 128, 0.1)"
+                )  # Grey if N/A
+            
+                # Crest image tag
+                crest_html = f'<img src="{crest}" width="24" style="vertical-align: middle; margin-right: 5px;">' if crest else ''
+
+                st.markdown(
+                    f"""
+                    <div class="{card_class}" style="padding: 10px; margin-bottom: 10px; background-color: {bg_color}; border-radius: 5px;">
+                        <div style="font-weight: bold; font-size: 1.1em;">{crest_html}{team}</div>
+                        Position: {pos_display}<br>
+                        Sweepstake Points: {int(points)}<br>
+                        League Points: {int(league_points)}
+                    </div>
+                    """,
+                    unsafe_allow_html=True,
+                )
+
+            move_html = ""
+            if player in player_movement.index:
+                move = player_movement.loc[player]
+                if move["Rank_Change"] or move["Points_Change"]:
+                    move_html = f" <span style='font-weight: normal;'>({rank_arrow(move['Rank_Change'])}, {move['Points_Change']:+d} pts)</span>"
+            st.markdown(f"<div style='text-align: center; font-weight: bold;'>Total: {int(total_points)} points{move_html}</div>", unsafe_allow_html=True)
 
 
 # Display leaderboard
 st.header("Sweepstake Leaderboard")
 
-# Clean and guard data for chart rendering
-player_totals["Points_Value"] = pd.to_numeric(
-    player_totals["Points_Value"], errors="coerce"
-)
-player_totals.replace([np.inf, -np.inf], np.nan, inplace=True)
-player_totals["Points_Value"] = player_totals["Points_Value"].fillna(0)
+with span("chart_building"):
+    # group_totals gives whole-number totals, so there's nothing to clean
 
-# Skip chart if there's nothing to plot (prevents Vega-Lite Infinity warnings)
-if player_totals.empty or player_totals["Points_Value"].isna().all():
-    st.info("No leaderboard data to plot yet.")
-else:
-    # Create horizontal bar chart with Altair
-    chart = (
-        alt.Chart(player_totals)
-        .mark_bar()
-        .encode(
-            x=alt.X("Points_Value:Q", title="Total Sweepstake Points"),
-            y=alt.Y("Player:N", title="Player", sort="-x"),
-            color=alt.Color(
-                "Points_Value:Q", scale=alt.Scale(scheme="blues"), legend=None
-            ),
-            tooltip=["Player", alt.Tooltip("Points_Value:Q", title="Points")],
-        )
-        .properties(
-            title="Player Rankings",
-            height=alt.Step(40),  # Adjust height based on number of players
-        )
-    )
-
-    # Force a domain if all zeros to avoid Vega "Infinite extent" warnings
-    if player_totals["Points_Value"].max() == 0:
-        chart = chart.encode(
-            x=alt.X(
-                "Points_Value:Q",
-                title="Total Sweepstake Points",
-                scale=alt.Scale(domain=[0, 1]),
-            )
+    # Skip chart if there's nothing to plot (prevents Vega-Lite Infinity warnings)
+    if player_totals.empty or player_totals["Points_Value"].isna().all():
+        st.info("No leaderboard data to plot yet.")
+    else:
+        chart = rankings_chart(
+            data_hash(player_totals), "Player Rankings", "blues", "Total Sweepstake Points", player_totals
         )
-
-    st.altair_chart(chart, use_container_width=True)
+        st.vega_lite_chart(chart, use_container_width=True)
 
 # Create a leaderboard table
 st.subheader("Current Standings")
-leaderboard_df = player_totals.copy()
-
-# Add Headshots
-leaderboard_df["Headshot"] = leaderboard_df["Player"].apply(get_player_headshot)
-
-# Handle ties in rank
-leaderboard_df["Rank"] = (
-    leaderboard_df["Points_Value"].rank(method="min", ascending=False).astype(int)
-)
-leaderboard_df = leaderboard_df.sort_values("Rank")
-leaderboard_df = leaderboard_df[["Rank", "Headshot", "Player", "Points_Value"]]
+# Ties share the better rank
+leaderboard_df = leaderboard(player_totals)
+leaderboard_df.insert(1, "Move", leaderboard_df["Player"].map(player_movement["Rank_Change"]).fillna(0).map(rank_arrow))
+leaderboard_df.insert(2, "Headshot", leaderboard_df["Player"].apply(get_player_headshot))
+leaderboard_df["Change"] = leaderboard_df["Player"].map(player_movement["Points_Change"]).fillna(0)
 leaderboard_df.rename(columns={"Points_Value": "Total Points", "Headshot": ""}, inplace=True)
 
 st.dataframe(
     leaderboard_df,
     column_config={
         "Rank": st.column_config.NumberColumn(format="%d"),
+        "Move": st.column_config.TextColumn(help="Rank change since the previous standings snapshot"),
         "": st.column_config.ImageColumn(width="small"),
         "Player": "Player",
         "Total Points": st.column_config.NumberColumn(format="%d"),
+        "Change": st.column_config.NumberColumn(format="%+d", help="Points change since the previous snapshot"),
     },
     hide_index=True,
     use_container_width=True,
@@ -981,6 +872,53 @@ if not player_totals.empty:
 else:
     st.write("Leaderboard data is currently unavailable.")
 
+# Season-long head-to-head, accumulated snapshot by snapshot
+if movement_tracker.snapshots:
+    with st.expander("🤜 Head-to-Head"):
+        st.caption(
+            f"How many of the season's {movement_tracker.snapshots} standings snapshots each row's "
+            "player was ahead of each column's player."
+        )
+        st.dataframe(movement_tracker.head_to_head(group_id), use_container_width=True)
+
+# Who would be winning under the other scoring rules (all scored together)
+with span("merge_score"):
+    rule_scores = score_all_rules(content_hash(standings_df), store_key, standings_df, picks_store)
+    rule_totals = get_pick_matrix(store_key, picks_store).group_rule_totals(group_id, rule_scores, SCORING_RULES)
+if not rule_totals.empty:
+    st.subheader("Under Other Scoring Rules")
+    leaders_by_rule = rule_leaders(rule_totals)
+    for col, (name, rule) in zip(st.columns(len(SCORING_RULES)), SCORING_RULES.items()):
+        with col:
+            st.metric(
+                rule.label,
+                " & ".join(leaders_by_rule[name]),
+                f"{rule_totals[name].max():g} pts",
+                delta_color="off",
+                help=rule.description,
+            )
+    with st.expander("Totals under every rule"):
+        st.dataframe(
+            rule_totals.rename(columns={name: rule.label for name, rule in SCORING_RULES.items()}),
+            column_config={rule.label: st.column_config.NumberColumn(format="%g") for rule in SCORING_RULES.values()},
+            hide_index=True,
+            use_container_width=True,
+        )
+
+# Season history from the snapshot store (one point per day)
+with span("chart_building"):
+    if archived:
+        season_chart = history_chart(
+            group_id, store_key, season_archive.stamp, picks_store, season_view.daily_standings
+        )
+    else:
+        season_chart = history_chart(
+            group_id, store_key, SNAPSHOTS.version(SEASON_LABEL), picks_store,
+            lambda: SNAPSHOTS.history(SEASON_LABEL),
+        )
+if season_chart:
+    st.vega_lite_chart(season_chart, use_container_width=True)
+
 
 # Add what-if scenario option
 st.header("What-If Scenario Builder")
@@ -1035,155 +973,135 @@ with team_columns[1]:
 
 # Calculate button
 if st.button("Calculate New Standings"):
-    # Check for position conflicts *among the teams being modified*
-    pos_counts = {}
-    for team, pos in modified_positions.items():
-        pos_counts[pos] = pos_counts.get(pos, 0) + 1
-
-    conflicts = {pos: count for pos, count in pos_counts.items() if count > 1}
-
-    if conflicts:
-        conflict_messages = []
-        for pos, count in conflicts.items():
-            teams_at_pos = [t for t, p in modified_positions.items() if p == pos]
-            conflict_messages.append(
-                f"Position {pos} assigned to {count} teams: {', '.join(teams_at_pos)}"
-            )
+    with span("what_if"):
+        # Check for position conflicts *among the teams being modified*
+        conflicts = position_conflicts(modified_positions)
 
-        st.error(f"⚠️ Position conflicts detected:\n" + "\n".join(conflict_messages))
-        st.warning(
-            "Please ensure each position is assigned to only one selected team in the builder."
-        )
-    else:
-        # Create a new dataframe based on the *currently loaded* standings
-        new_standings = standings_df.copy()
+        if conflicts:
+            conflict_messages = [
+                f"Position {pos} assigned to {len(teams)} teams: {', '.join(teams)}"
+                for pos, teams in conflicts.items()
+            ]
 
-        # Update positions only for the teams included in the builder
-        for team, new_pos in modified_positions.items():
-            if team in new_standings["Team"].values:
-                new_standings.loc[new_standings["Team"] == team, "Position"] = new_pos
-            else:
-                st.warning(
-                    f"Team '{team}' selected in 'What-If' not found in current standings, ignoring."
-                )
-
-        st.subheader("Hypothetical Player Scores (What-If)")
-        st.caption(
-            "Calculated based ONLY on the new positions entered above. Other teams' positions are assumed unchanged for this calculation."
-        )
+            st.error(f"⚠️ Position conflicts detected:\n" + "\n".join(conflict_messages))
+            st.warning(
+                "Please ensure each position is assigned to only one selected team in the builder."
+            )
+        else:
+            # Only teams in the currently loaded standings can be moved
+            for team in modified_positions:
+                if team not in standings_df["Team"].values:
+                    st.warning(
+                        f"Team '{team}' selected in 'What-If' not found in current standings, ignoring."
+                    )
 
-        # Recalculate points values based on *hypothetical* positions
-        hypothetical_points = {
-            team: 21 - pos for team, pos in modified_positions.items()
-        }
+            st.subheader("Hypothetical Player Scores (What-If)")
+            st.caption(
+                "Calculated based ONLY on the new positions entered above. Other teams' positions are assumed unchanged for this calculation."
+            )
 
-        # Calculate new player totals based on these hypothetical points
-        new_player_totals_list = []
-        for player in picks_df["Player"].unique():
-            player_teams_list = picks_df[picks_df["Player"] == player]["Team"].tolist()
-            new_total = 0
-            for team in player_teams_list:
-                # Use the hypothetical point value if the team was modified
-                if team in hypothetical_points:
-                    new_total += hypothetical_points[team]
-                # Otherwise, use the original point value from the loaded standings
-                elif team in merged_df["Team"].values:
-                    # Get original points value for teams not in the what-if builder
-                    original_points = merged_df.loc[
-                        merged_df["Team"] == team, "Points_Value"
-                    ].iloc[0]
-                    new_total += original_points
-                else:
-                    new_total += 0  # Team not found in original merge either
-
-            new_player_totals_list.append({"Player": player, "Points_Value": new_total})
-
-        new_player_totals = pd.DataFrame(new_player_totals_list)
-        new_player_totals = new_player_totals.sort_values(
-            "Points_Value", ascending=False
-        )
+            # Moved teams score on their hypothetical positions, the rest keep
+            # their current points
+            new_player_totals = what_if_totals(merged_df, modified_positions)
 
-        # Add Headshots to Hypothetical Leaderboard
-        new_player_totals["Headshot"] = new_player_totals["Player"].apply(get_player_headshot)
+            # Add Headshots to Hypothetical Leaderboard
+            new_player_totals["Headshot"] = new_player_totals["Player"].apply(get_player_headshot)
         
-        # Clean and guard data for chart rendering
-        new_player_totals["Points_Value"] = pd.to_numeric(
-            new_player_totals["Points_Value"], errors="coerce"
-        )
-        new_player_totals.replace([np.inf, -np.inf], np.nan, inplace=True)
-        new_player_totals["Points_Value"] = new_player_totals["Points_Value"].fillna(0)
+            # Clean and guard data for chart rendering
+            new_player_totals["Points_Value"] = pd.to_numeric(
+                new_player_totals["Points_Value"], errors="coerce"
+            )
+            new_player_totals.replace([np.inf, -np.inf], np.nan, inplace=True)
+            new_player_totals["Points_Value"] = new_player_totals["Points_Value"].fillna(0)
 
-        if new_player_totals.empty or new_player_totals["Points_Value"].isna().all():
-            st.info("No hypothetical data to plot.")
-        else:
-            # Display new leaderboard chart
-            new_chart = (
-                alt.Chart(new_player_totals)
-                .mark_bar()
-                .encode(
-                    x=alt.X("Points_Value:Q", title="Total Points (Hypothetical)"),
-                    y=alt.Y("Player:N", title="Player", sort="-x"),
-                    color=alt.Color(
-                        "Points_Value:Q", scale=alt.Scale(scheme="greens"), legend=None
-                    ),
-                    tooltip=["Player", alt.Tooltip("Points_Value:Q", title="Points")],
+            if new_player_totals.empty or new_player_totals["Points_Value"].isna().all():
+                st.info("No hypothetical data to plot.")
+            else:
+                # Display new leaderboard chart
+                chart_totals = new_player_totals[["Player", "Points_Value"]]
+                new_chart = rankings_chart(
+                    data_hash(chart_totals), "Hypothetical Player Rankings", "greens",
+                    "Total Points (Hypothetical)", chart_totals,
                 )
-                .properties(title="Hypothetical Player Rankings", height=alt.Step(40))
+                st.vega_lite_chart(new_chart, use_container_width=True)
+
+            # Display new leaderboard table
+            new_leaderboard_df = leaderboard(new_player_totals)
+            new_leaderboard_df.insert(1, "Headshot", new_leaderboard_df["Player"].apply(get_player_headshot))
+            new_leaderboard_df.rename(
+                columns={"Points_Value": "Total Points", "Headshot": ""}, inplace=True
             )
 
-            # Force a domain if all zeros to avoid Vega "Infinite extent" warnings
-            if new_player_totals["Points_Value"].max() == 0:
-                new_chart = new_chart.encode(
-                    x=alt.X(
-                        "Points_Value:Q",
-                        title="Total Points (Hypothetical)",
-                        scale=alt.Scale(domain=[0, 1]),
-                    )
-                )
+            st.dataframe(
+                new_leaderboard_df,
+                column_config={
+                    "Rank": st.column_config.NumberColumn(format="%d"),
+                    "": st.column_config.ImageColumn(width="small"),
+                    "Player": "Player",
+                    "Total Points": st.column_config.NumberColumn(format="%d"),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
 
-            st.altair_chart(new_chart, use_container_width=True)
+            # Highlight new leaders
+            if not new_player_totals.empty:
+                new_max_points = new_player_totals["Points_Value"].max()
+                new_leaders = new_player_totals[
+                    new_player_totals["Points_Value"] == new_max_points
+                ]["Player"].tolist()
+                new_leaders_text = " and ".join(new_leaders)
+                st.write(
+                    f"### 🏆 Hypothetical Leader{'s' if len(new_leaders) > 1 else ''}: {new_leaders_text} ({int(new_max_points)} points)"
+                )
+            else:
+                st.write("Hypothetical leaderboard data is currently unavailable.")
 
-        # Display new leaderboard table
-        new_leaderboard_df = new_player_totals.copy()
-        new_leaderboard_df["Rank"] = (
-            new_leaderboard_df["Points_Value"]
-            .rank(method="min", ascending=False)
-            .astype(int)
-        )
-        new_leaderboard_df = new_leaderboard_df.sort_values("Rank")
-        new_leaderboard_df = new_leaderboard_df[["Rank", "Headshot", "Player", "Points_Value"]]
-        new_leaderboard_df.rename(
-            columns={"Points_Value": "Total Points", "Headshot": ""}, inplace=True
-        )
 
+# --- Hidden debug panel: append ?debug=1 to the URL ---
+ROLLING.record("rerun_total", rerun_timings.elapsed())
+PROFILER.finish_run(rerun_memory)
+if st.query_params.get("debug"):
+    with st.expander("🛠️ Debug: Stage Timings"):
+        st.write(f"This rerun took {rerun_timings.elapsed() * 1000:.1f} ms.")
         st.dataframe(
-            new_leaderboard_df,
-            column_config={
-                "Rank": st.column_config.NumberColumn(format="%d"),
-                "": st.column_config.ImageColumn(width="small"),
-                "Player": "Player",
-                "Total Points": st.column_config.NumberColumn(format="%d"),
-            },
+            pd.DataFrame(
+                [
+                    {"Stage": stage, "ms": round(seconds * 1000, 2)}
+                    for stage, seconds in rerun_timings.totals().items()
+                ]
+            ),
             hide_index=True,
             use_container_width=True,
         )
-
-        # Highlight new leaders
-        if not new_player_totals.empty:
-            new_max_points = new_player_totals["Points_Value"].max()
-            new_leaders = new_player_totals[
-                new_player_totals["Points_Value"] == new_max_points
-            ]["Player"].tolist()
-            new_leaders_text = " and ".join(new_leaders)
-            st.write(
-                f"### 🏆 Hypothetical Leader{'s' if len(new_leaders) > 1 else ''}: {new_leaders_text} ({int(new_max_points)} points)"
-            )
-        else:
-            st.write("Hypothetical leaderboard data is currently unavailable.")
-
+        st.caption(
+            "Rolling window across all sessions. Upstream stages (season_resolution, "
+            "standings_http, json_extraction) only run on a cache miss."
+        )
+        st.dataframe(pd.DataFrame(ROLLING.summary()), hide_index=True, use_container_width=True)
+        breaker_states = BREAKERS.states()
+        if breaker_states:
+            st.caption("Pulse Live circuit breakers")
+            st.json(breaker_states)
+    if PROFILER.enabled:
+        with st.expander("🧠 Debug: Memory"):
+            memory = PROFILER.summary()
+            if memory:
+                st.write(
+                    f"Traced heap {memory['current'] / 1024:.0f} KiB after {memory['reruns']} reruns. "
+                    f"Last rerun: peak {memory['last_peak'] / 1024:.0f} KiB, "
+                    f"retained {memory['last_retained'] / 1024:+.1f} KiB."
+                )
+                if memory["growth"]:
+                    st.warning(f"Heap is growing: {memory['growth'] / 1024:.0f} KiB over the last reruns.")
+            cache_rows = PROFILER.cache_rows()
+            if cache_rows:
+                st.dataframe(pd.DataFrame(cache_rows), hide_index=True, use_container_width=True)
+            if st.button("Write memory report"):
+                st.caption(f"Written to {PROFILER.write_report()}")
 
 # Add a footer
 st.markdown("---")
 st.caption(
-    f"Bottoms Sweepstake {SEASON_LABEL} Season | Made with Streamlit | Data via premierleague.com | Last updated: {current_time}"
+    f"{group['name']} {season_label} Season | Made with Streamlit | Data via premierleague.com | Last updated: {current_time}"
 )
@@ -0,0 +1,85 @@
+"""Vega-Lite chart specs for the leaderboard and season history.
+
+Specs are plain dicts built straight from the data (no Altair), so the
+app can cache them by the data's content hash: a rerun with unchanged
+totals reuses the ready spec instead of rebuilding and re-serializing a
+chart. Nothing here touches Streamlit.
+"""
+
+import hashlib
+
+import pandas as pd
+
+VEGA_LITE_SCHEMA = "https://vega.github.io/schema/vega-lite/v5.json"
+BAR_STEP = 40  # pixels per player bar
+
+
+def data_hash(df: pd.DataFrame) -> str:
+    """Hash of a frame's values and column names (not its index)."""
+    digest = hashlib.sha256(",".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    return [
+        {col: (value.item() if hasattr(value, "item") else value) for col, value in row.items()}
+        for row in df.to_dict(orient="records")
+    ]
+
+
+def rankings_spec(totals: pd.DataFrame, title: str = "Player Rankings", scheme: str = "blues",
+                  x_title: str = "Total Sweepstake Points") -> dict:
+    """Horizontal bar chart of ``Player``/``Points_Value``, best on top."""
+    values = _records(totals[["Player", "Points_Value"]].astype({"Player": str}))
+    x = {"field": "Points_Value", "type": "quantitative", "title": x_title}
+    if totals.empty or totals["Points_Value"].max() == 0:
+        # Force a domain when every total is zero, avoiding Vega's
+        # "Infinite extent" warnings
+        x["scale"] = {"domain": [0, 1]}
+    return {
+        "$schema": VEGA_LITE_SCHEMA,
+        "title": title,
+        "data": {"values": values},
+        "mark": {"type": "bar"},
+        "height": {"step": BAR_STEP},
+        "encoding": {
+            "x": x,
+            "y": {"field": "Player", "type": "nominal", "title": "Player", "sort": "-x"},
+            "color": {
+                "field": "Points_Value",
+                "type": "quantitative",
+                "scale": {"scheme": scheme},
+                "legend": None,
+            },
+            "tooltip": [
+                {"field": "Player", "type": "nominal"},
+                {"field": "Points_Value", "type": "quantitative", "title": "Points"},
+            ],
+        },
+    }
+
+
+def history_spec(history: pd.DataFrame, title: str = "Season So Far") -> dict:
+    """Line chart of each player's total over time.
+
+    ``history`` has ``Date``, ``Player`` and ``Points_Value`` columns (see
+    ``scoring.score_history``).
+    """
+    values = _records(history[["Date", "Player", "Points_Value"]].astype({"Date": str, "Player": str}))
+    return {
+        "$schema": VEGA_LITE_SCHEMA,
+        "title": title,
+        "data": {"values": values},
+        "mark": {"type": "line", "point": True},
+        "encoding": {
+            "x": {"field": "Date", "type": "temporal", "title": "Date"},
+            "y": {"field": "Points_Value", "type": "quantitative", "title": "Total Sweepstake Points"},
+            "color": {"field": "Player", "type": "nominal", "title": "Player"},
+            "tooltip": [
+                {"field": "Date", "type": "temporal"},
+                {"field": "Player", "type": "nominal"},
+                {"field": "Points_Value", "type": "quantitative", "title": "Points"},
+            ],
+        },
+    }
@@ -0,0 +1,108 @@
+"""Per-endpoint circuit breakers with jittered exponential backoff.
+
+After ``failure_threshold`` consecutive failures a breaker *opens* and
+calls fail fast instead of waiting on timeouts. Once the backoff delay
+has passed it goes *half-open* and lets a single probe through: success
+closes it again, failure re-opens it with a doubled (jittered) delay.
+"""
+
+import random
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_THRESHOLD = 3
+BASE_DELAY = 30  # seconds before the first half-open probe
+MAX_DELAY = 15 * 60
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+    def __init__(self, key: str, retry_in: float):
+        super().__init__(f"circuit open for {key}; retrying in {retry_in:.0f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Failure tracker for one endpoint. Thread-safe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        clock=time.monotonic,
+        rng=random.random,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.rng = rng
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_count = 0  # consecutive opens, drives the backoff
+        self.retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def _delay(self) -> float:
+        """Equal-jitter backoff: half the exponential delay plus a random half."""
+        delay = min(self.max_delay, self.base_delay * 2 ** self.opened_count)
+        return delay / 2 + self.rng() * delay / 2
+
+    def allow(self) -> bool:
+        """Return True if a call may go ahead now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.clock() >= self.retry_at:
+                self.state = HALF_OPEN  # this caller is the probe
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            return max(0.0, self.retry_at - self.clock())
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_count = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.retry_at = self.clock() + self._delay()
+                self.state = OPEN
+                self.opened_count += 1
+
+
+class BreakerRegistry:
+    """Lazily created breakers keyed by endpoint."""
+
+    def __init__(self, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(**self.breaker_kwargs)
+            return breaker
+
+    def states(self) -> dict[str, str]:
+        with self._lock:
+            return {key: b.state for key, b in sorted(self._breakers.items())}
+
+    def reset(self):
+        with self._lock:
+            self._breakers.clear()
@@ -0,0 +1,283 @@
+"""Seeded, auditable draw that allocates teams to players.
+
+Each player gets ``picks_per_player`` teams (two by default) and no team
+is drawn twice within a group. The draw is balanced against a position
+forecast (expected finishing position per team, e.g. the latest table):
+
+* The forecast's top six may not go two to one player: the pool of teams
+  for a group holds at most one top-six team per player.
+* The pool is split into tiers by expected points (the strongest ``n``
+  teams, the next ``n``, ...) and every player gets one team per tier.
+  That keeps the top-six rule, and starting from a random team in each
+  tier, swaps within a tier that even out the players' expected totals
+  are applied (a local-search assignment) until the gap between the best
+  and worst expected totals is within ``tolerance`` points, or no swap
+  helps. Stopping at "fair enough" rather than the optimum keeps the draw
+  random: for two picks each the optimum is a fixed strongest-with-weakest
+  pairing.
+
+Everything random comes from ``numpy.random.default_rng`` seeded per group
+(from the batch seed and the group id), and each draw is logged with its
+inputs and seed, so ``verify_draw`` can replay it later. Hundreds of
+groups take well under a second.
+
+Examples::
+
+    python draw.py --group office --players Ann Bob Cat Dan --seed 42
+    python draw.py --groups groups.json --season 2026/27 --write   # into the picks store
+    python draw.py --verify                                         # replay the audit log
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import secrets
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from picks_store import PICKS_PATH, PicksStore
+from pulse_live import SEASON_LABEL, SNAPSHOTS, get_fallback_standings
+from scoring_rules import position_points
+from snapshot_store import DATA_DIR
+from team_registry import get_registry
+
+DRAW_LOG = os.path.join(DATA_DIR, "draws.jsonl")
+DRAW_VERSION = 1
+PICKS_PER_PLAYER = 2
+TOP_TEAMS = 6
+TOLERANCE = 2.0  # expected points between the best and worst drawn player
+
+
+class DrawError(ValueError):
+    """The draw can't be made (e.g. more picks than teams)."""
+
+
+def group_seed(seed: int, group_id: str) -> int:
+    """The seed for one group, derived from the batch seed and the group id."""
+    digest = hashlib.sha256(f"{seed}:{group_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def forecast_from_standings(standings_df: pd.DataFrame) -> dict[str, float]:
+    """Team -> expected finishing position, taken from a standings table."""
+    canonical = get_registry().canonical
+    return {canonical(team): float(pos) for team, pos in zip(standings_df["Team"], standings_df["Position"])}
+
+
+def forecast_points(position: float) -> float:
+    """Sweepstake points for a forecast position; 0 for an unranked (<= 0) one."""
+    return float(position_points(position)) if position > 0 else 0.0
+
+
+def draw_group(players: list[str], forecast: dict[str, float], seed: int,
+               picks_per_player: int = PICKS_PER_PLAYER, top_teams: int = TOP_TEAMS,
+               tolerance: float = TOLERANCE) -> dict[str, list[str]]:
+    """Draw teams for one group's players; the same inputs give the same draw."""
+    players = list(players)
+    n, k = len(players), picks_per_player
+    if len(set(players)) != n:
+        raise DrawError("player names must be unique")
+    if not n:
+        return {}
+    # Strongest first; names break ties so the order doesn't depend on the input's
+    teams = sorted(forecast, key=lambda team: (forecast[team], team))
+    if n * k > len(teams):
+        raise DrawError(f"{n} players x {k} picks needs {n * k} teams, the forecast has {len(teams)}")
+    top = set(teams[:top_teams])
+    points = {team: forecast_points(forecast[team]) for team in teams}
+    rng = np.random.default_rng(seed)
+
+    # The pool: a random subset with at most one top team per player
+    pool, top_taken = [], 0
+    for i in rng.permutation(len(teams)):
+        team = teams[i]
+        if team in top:
+            if top_taken == n:
+                continue
+            top_taken += 1
+        pool.append(team)
+        if len(pool) == n * k:
+            break
+    if len(pool) < n * k:
+        raise DrawError(f"not enough teams outside the top {top_teams} for {n} players")
+    pool.sort(key=lambda team: (forecast[team], team))
+
+    # tiers[j, i] is player i's team from tier j, starting from a random deal
+    tiers = np.array([rng.permutation(pool[j * n:(j + 1) * n]) for j in range(k)], dtype=object)
+    values = np.vectorize(points.get, otypes=[float])(tiers)
+    totals = values.sum(axis=0)
+
+    # Swap within tiers while it evens out the totals (sum of squares drops)
+    candidates = [(j, a, b) for j in range(k) for a in range(n) for b in range(a + 1, n)]
+    improved = True
+    while improved and totals.max() - totals.min() > tolerance:
+        improved = False
+        for c in rng.permutation(len(candidates)):
+            if totals.max() - totals.min() <= tolerance:
+                break
+            j, a, b = candidates[c]
+            d = values[j, b] - values[j, a]
+            # (ta + d)^2 + (tb - d)^2 - ta^2 - tb^2
+            if 2 * d * (totals[a] - totals[b] + d) < -1e-9:
+                tiers[j, a], tiers[j, b] = tiers[j, b], tiers[j, a]
+                values[j, a], values[j, b] = values[j, b], values[j, a]
+                totals[a] += d
+                totals[b] -= d
+                improved = True
+    return {player: [str(team) for team in tiers[:, i]] for i, player in enumerate(players)}
+
+
+def expected_totals(picks: dict[str, list[str]], forecast: dict[str, float]) -> dict[str, float]:
+    """Each player's expected points under the forecast."""
+    return {player: float(sum(forecast_points(forecast[t]) for t in teams)) for player, teams in picks.items()}
+
+
+def _digest(record: dict) -> str:
+    body = {key: record[key] for key in sorted(record) if key != "digest"}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def draw_groups(groups: dict[str, dict], forecast: dict[str, float], seed: int,
+                picks_per_player: int = PICKS_PER_PLAYER, top_teams: int = TOP_TEAMS,
+                tolerance: float = TOLERANCE) -> dict[str, dict]:
+    """Draw every group; returns an audit record per group id.
+
+    ``groups`` maps a group id to ``{"players": [...], ...}`` (other keys,
+    such as the name, are kept for the picks store).
+    """
+    drawn_at = datetime.now(timezone.utc).isoformat()
+    records = {}
+    for group_id, group in groups.items():
+        players = [str(p) for p in group["players"]]
+        picks = draw_group(players, forecast, group_seed(seed, group_id), picks_per_player, top_teams, tolerance)
+        totals = expected_totals(picks, forecast)
+        record = {
+            "version": DRAW_VERSION,
+            "group_id": group_id,
+            "drawn_at": drawn_at,
+            "seed": seed,
+            "players": players,
+            "picks_per_player": picks_per_player,
+            "top_teams": top_teams,
+            "tolerance": tolerance,
+            "forecast": forecast,
+            "picks": picks,
+            "expected_totals": totals,
+            "spread": max(totals.values()) - min(totals.values()) if totals else 0.0,
+        }
+        record["digest"] = _digest(record)
+        records[group_id] = record
+    return records
+
+
+def verify_draw(record: dict) -> bool:
+    """Replay a logged draw: True if it's untampered and the seed reproduces it."""
+    if record.get("digest") != _digest(record) or record.get("version") != DRAW_VERSION:
+        return False
+    picks = draw_group(record["players"], record["forecast"], group_seed(record["seed"], record["group_id"]),
+                       record["picks_per_player"], record["top_teams"], record["tolerance"])
+    return picks == record["picks"]
+
+
+def apply_draws(store: PicksStore, groups: dict[str, dict], records: dict[str, dict], season: str | None = None):
+    """Write drawn picks into ``store`` (call ``store.save()`` to persist)."""
+    for group_id, record in records.items():
+        group = {key: value for key, value in groups[group_id].items() if key != "players"}
+        if season:
+            group["season"] = season
+        store.set_group(group_id, {**group, "picks": record["picks"]})
+
+
+def append_log(records: dict[str, dict], path: str = DRAW_LOG):
+    """Append the audit records to the draw log (one JSON object per line)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records.values():
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def read_log(path: str = DRAW_LOG) -> list[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def load_forecast(path: str | None) -> dict[str, float]:
+    """A ``{team: position}`` JSON file, else the latest snapshot, else the static table."""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            canonical = get_registry().canonical
+            return {canonical(team): float(pos) for team, pos in json.load(f).items()}
+    standings_df = SNAPSHOTS.latest(SEASON_LABEL)
+    if standings_df is None or standings_df.empty:
+        standings_df = get_fallback_standings()
+    return forecast_from_standings(standings_df)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Draw teams for sweepstake players, fairly and reproducibly.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--players", nargs="+", help="players of one group (with --group)")
+    source.add_argument("--groups", help='JSON file: {"<id>": {"name": ..., "players": [...]}, ...}')
+    source.add_argument("--verify", action="store_true", help="replay every draw in the audit log")
+    parser.add_argument("--group", default="default", help="group id for --players")
+    parser.add_argument("--name", help="group name for --players")
+    parser.add_argument("--seed", type=int, help="batch seed (random, and logged, if omitted)")
+    parser.add_argument("--forecast", help="JSON file of team -> expected position")
+    parser.add_argument("--picks-per-player", type=int, default=PICKS_PER_PLAYER)
+    parser.add_argument("--top-teams", type=int, default=TOP_TEAMS, help="at most one of these per player")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="acceptable gap in expected points between players")
+    parser.add_argument("--season", help="season label to record on the drawn groups")
+    parser.add_argument("--write", action="store_true", help="save into the picks store and log the draw")
+    parser.add_argument("--picks", default=PICKS_PATH, help="picks store to write to")
+    parser.add_argument("--log", default=DRAW_LOG, help="audit log")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        records = read_log(args.log)
+        failed = [r.get("group_id") for r in records if not verify_draw(r)]
+        print(f"{len(records) - len(failed)}/{len(records)} draw(s) verified", file=sys.stderr)
+        for group_id in failed:
+            print(f"FAILED: {group_id}", file=sys.stderr)
+        return 1 if failed else 0
+
+    if args.groups:
+        with open(args.groups, encoding="utf-8") as f:
+            groups = json.load(f)
+    else:
+        groups = {args.group: {"name": args.name or args.group, "players": args.players}}
+    seed = args.seed if args.seed is not None else secrets.randbits(63)
+    try:
+        records = draw_groups(groups, load_forecast(args.forecast), seed, args.picks_per_player,
+                              args.top_teams, args.tolerance)
+    except DrawError as e:
+        parser.error(str(e))
+
+    if args.write:
+        store = PicksStore.load(args.picks)
+        apply_draws(store, groups, records, args.season)
+        store.save(args.picks)
+        append_log(records, args.log)
+        print(f"Drew {len(records)} group(s) with seed {seed} into {args.picks}", file=sys.stderr)
+    else:
+        json.dump({gid: {"picks": r["picks"], "expected_totals": r["expected_totals"]} for gid, r in records.items()},
+                  sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        print(f"seed {seed}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Compact, shared dataframes for standings and picks.
+
+Standings and picks are small but read on every rerun of every session,
+so they are stored once in a compact form and shared rather than copied:
+
+* ``Team`` is categorical over the team registry's canonical names, so
+  standings and picks share one dtype and merge on integer codes;
+  ``Player`` is categorical too.
+* Positions and points use the smallest integer dtype that fits
+  (``int8``/``int16``) instead of ``int64``/``float64``.
+* Text columns are Arrow-backed strings (the default from pandas 3 on;
+  object columns are converted), which Streamlit hands to the frontend
+  as Arrow without converting Python objects first.
+
+Frames returned from here are meant to be shared between sessions (and
+with pandas' copy-on-write, derived frames never write back). Treat them
+as read-only: derive a new frame with ``assign``/selection instead of
+setting columns in place.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from team_registry import get_registry
+
+INT_COLUMNS = {
+    "Position": np.int8,
+    "Points_Value": np.int8,
+    "Points_League": np.int16,
+    "Goals_For": np.int16,
+    "Goals_Against": np.int16,
+}
+TEXT_COLUMNS = ("Team_ID", "Crest_URL")
+TEXT_DTYPE = pd.StringDtype("pyarrow")
+
+
+@lru_cache(maxsize=32)
+def _categorical(names: tuple) -> pd.CategoricalDtype:
+    return pd.CategoricalDtype(names)
+
+
+def team_dtype(teams=()) -> pd.CategoricalDtype:
+    """Categorical dtype over the registry's canonical names plus ``teams``.
+
+    The same names give the same dtype object, so frames built from one
+    registry share a single categories index.
+    """
+    names = {team["name"] for team in get_registry().teams.values()}
+    names.update(t for t in teams if isinstance(t, str))
+    return _categorical(tuple(sorted(names)))
+
+
+def _small_int(series: pd.Series, dtype) -> pd.Series:
+    """``series`` as ``dtype`` if every value is a whole number that fits."""
+    values = pd.to_numeric(series, errors="coerce")
+    info = np.iinfo(dtype)
+    if values.isna().any() or not values.between(info.min, info.max).all() or (values % 1 != 0).any():
+        return series
+    return values.astype(dtype)
+
+
+def compact_standings(df: pd.DataFrame | None) -> pd.DataFrame | None:
+    """The standings with categorical teams, small ints and Arrow strings."""
+    if df is None or df.empty:
+        return df
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if col == "Team":
+            series = series.astype(team_dtype(series.unique()))
+        elif col in INT_COLUMNS:
+            series = _small_int(series, INT_COLUMNS[col])
+        elif col in TEXT_COLUMNS and series.dtype == object:
+            series = series.astype(TEXT_DTYPE)
+        columns[col] = series
+    compact = pd.DataFrame(columns, index=df.index)
+    compact.attrs = dict(df.attrs)
+    return compact
+
+
+def compact_picks(df: pd.DataFrame, canonical=None) -> pd.DataFrame:
+    """Picks with canonical, categorical ``Team`` and categorical ``Player``."""
+    teams = df["Team"].map(canonical) if canonical else df["Team"]
+    return pd.DataFrame(
+        {
+            "Player": df["Player"].astype(_categorical(tuple(sorted(df["Player"].unique())))),
+            "Team": teams.astype(team_dtype(teams.unique())),
+        },
+        index=df.index,
+    )
@@ -0,0 +1,32 @@
+"""Player headshots: locating the image for a player and inlining it.
+
+Headshots live in ``assets/headshots/<Player>.<ext>`` next to this module,
+whatever the working directory (uploads from the sidebar are saved there too).
+"""
+
+import base64
+import os
+
+HEADSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "headshots")
+HEADSHOT_EXTENSIONS = (".png", ".jpg", ".jpeg")
+PLACEHOLDER_URL = "https://www.gravatar.com/avatar/00000000000000000000000000000000?d=mp&f=y"
+
+
+def headshot_path(player: str, headshot_dir: str = HEADSHOT_DIR) -> str | None:
+    """The player's headshot file, or None if there isn't one."""
+    for ext in HEADSHOT_EXTENSIONS:
+        path = os.path.join(headshot_dir, f"{player}{ext}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def image_data_uri(path: str) -> str | None:
+    """Convert a local image file to a base64 data URI."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    encoded = base64.b64encode(data).decode()
+    mime = "image/jpeg" if path.lower().endswith((".jpg", ".jpeg")) else "image/png"
+    return f"data:{mime};base64,{encoded}"
@@ -0,0 +1,172 @@
+"""Incremental parsing of the one JSON array we care about in a response.
+
+Pulse Live responses wrap the useful records (season list, table entries)
+in an array under a known key. ``iter_array_items`` scans the body as it
+arrives for the first ``"key": [`` and then decodes and yields one
+element at a time, dropping consumed text as it goes. The text before
+the array is kept until the array is found (it is the fallback body if
+it never is); after that only the element being decoded plus one
+network chunk is held, and the first record is usable as soon as its
+bytes have arrived.
+
+``iter_array_objects`` does the same for arrays of objects that are
+themselves large (standings ``tables``, each with an ``entries`` array):
+every element is decoded key by key and its nested array item by item,
+so the text held is one nested item plus one chunk, and what is kept of
+the element is its small fields and the (projected) nested items.
+"""
+
+import codecs
+import json
+import re
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class ArrayNotFound(ValueError):
+    """No array under any of the requested keys; ``text`` holds the whole body."""
+
+    def __init__(self, text: str):
+        super().__init__("no matching JSON array in response")
+        self.text = text
+
+
+def _decode_chunks(chunks):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class _Reader:
+    """A cursor over streamed JSON text that drops what it has consumed."""
+
+    def __init__(self, chunks):
+        self._stream = _decode_chunks(chunks)
+        self.buf = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def more(self) -> bool:
+        text = next(self._stream, None)
+        if text is None:
+            self.exhausted = True
+            return False
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += text
+        return True
+
+    def peek(self, skip: str = _WHITESPACE) -> str | None:
+        """The next character not in ``skip`` (None at the end of the body)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                return None
+
+    def value(self):
+        """Decode the JSON value at the cursor."""
+        if self.peek() is None:
+            raise ValueError("response ended before a JSON value")
+        while True:
+            try:
+                item, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            if end == len(self.buf) and not self.exhausted and not isinstance(item, (dict, list, str)):
+                # A bare number may continue in the next chunk
+                if self.more():
+                    continue
+            self.pos = end
+            return item
+
+    def open_array(self, keys):
+        """Move past the ``[`` of the first array under ``keys`` (or a top-level one)."""
+        pattern = re.compile(
+            r'"(?:' + "|".join(re.escape(k) for k in keys) + r')"\s*:\s*\[' if keys else r"(?!)"
+        )
+        while True:
+            stripped = self.buf.lstrip(_WHITESPACE)
+            if stripped.startswith("["):
+                self.pos = len(self.buf) - len(stripped) + 1
+                return
+            match = pattern.search(self.buf)
+            if match:
+                self.pos = match.end()
+                return
+            # Nothing is consumed yet, so the buffer is still the whole body
+            if not self.more():
+                raise ArrayNotFound(self.buf)
+
+    def items(self, decode=None):
+        """Yield the elements of the array whose ``[`` was just consumed."""
+        decode = decode or self.value
+        while True:
+            ch = self.peek(_WHITESPACE + ",")
+            if ch is None:
+                raise ValueError("response ended inside the JSON array")
+            if ch == "]":
+                self.pos += 1
+                return
+            yield decode()
+
+    def fields(self, stream_key: str, project):
+        """Decode the object at the cursor, streaming its ``stream_key`` array."""
+        if self.peek() != "{":
+            return self.value()
+        self.pos += 1
+        obj = {}
+        while True:
+            ch = self.peek(_WHITESPACE + ",")
+            if ch is None:
+                raise ValueError("response ended inside a JSON object")
+            if ch == "}":
+                self.pos += 1
+                return obj
+            key = self.value()
+            if self.peek() != ":":
+                raise ValueError("expected ':' in a JSON object")
+            self.pos += 1
+            if key == stream_key and self.peek() == "[":
+                self.pos += 1
+                obj[key] = [project(item) for item in self.items()]
+            else:
+                obj[key] = self.value()
+
+
+def iter_array_items(chunks, keys=()):
+    """Yield the elements of the first array found under any of ``keys``.
+
+    ``chunks`` is an iterable of ``bytes`` or ``str`` (e.g.
+    ``response.iter_content()``). A body that is itself a top-level array
+    is streamed as well. If no such array exists, ``ArrayNotFound`` is
+    raised with the full text so the caller can fall back to ``json.loads``
+    without refetching.
+    """
+    reader = _Reader(chunks)
+    reader.open_array(keys)
+    yield from reader.items()
+
+
+def iter_array_objects(chunks, keys=(), stream_key: str = "entries", project=lambda item: item):
+    """Like ``iter_array_items``, but each object's ``stream_key`` array is streamed too.
+
+    Elements are yielded as dicts once they are complete, with
+    ``stream_key`` holding ``project(item)`` for each of its items, so a
+    caller can look at fields that come after the array (e.g. a table's
+    ``type``) without the element ever being held as one piece of text.
+    """
+    reader = _Reader(chunks)
+    reader.open_array(keys)
+    yield from reader.items(lambda: reader.fields(stream_key, project))
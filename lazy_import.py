@@ -0,0 +1,39 @@
+"""Deferred imports for heavy, rarely-needed dependencies.
+
+``requests`` and ``altair`` together cost a few hundred milliseconds to
+import, and many runs never touch them (tests, batch exports from a
+snapshot, a page that stops early). ``LazyModule`` stands in for the
+module and imports it on first attribute access::
+
+    requests = LazyModule("requests")
+    requests.get(url)  # imported here, once
+"""
+
+import importlib
+import threading
+
+
+class LazyModule:
+    """A module proxy that imports ``name`` the first time it is used."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._module or self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
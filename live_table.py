@@ -0,0 +1,187 @@
+"""Provisional "as it stands" league table built from in-play scores.
+
+The base table is the last fetched standings (completed matches only).
+Live scores are applied on top as deltas: when a fixture's score changes
+we undo that fixture's previous provisional result and apply the new
+one, touching just two rows of a few numpy arrays before re-ranking.
+That keeps an update cheap enough to run every few seconds, and a
+single ``LiveTableWorker`` per process does it for every session.
+"""
+
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+from scoring_rules import position_points
+
+logger = logging.getLogger(__name__)
+
+LIVE_POLL_INTERVAL = 10  # seconds between in-play score polls
+
+
+def _result_points(goals_for: int, goals_against: int) -> int:
+    if goals_for > goals_against:
+        return 3
+    if goals_for == goals_against:
+        return 1
+    return 0
+
+
+class LiveTable:
+    """Mutable provisional copy of a standings frame."""
+
+    def __init__(self, standings_df: pd.DataFrame):
+        base = standings_df.sort_values("Position").reset_index(drop=True)
+        self._base = base
+        self._index = {team: i for i, team in enumerate(base["Team"])}
+        n = len(base)
+
+        def column(name):
+            if name in base:
+                return pd.to_numeric(base[name], errors="coerce").fillna(0).to_numpy(np.int32)
+            return np.zeros(n, dtype=np.int32)
+
+        self.points = column("Points_League")
+        self.goals_for = column("Goals_For")
+        self.goals_against = column("Goals_Against")
+        # Break remaining ties on the base table's order (its Position)
+        self._tiebreak = np.arange(n)
+        # fixture id -> (home index, away index, home goals, away goals)
+        self._applied: dict = {}
+
+    def _apply(self, home: int, away: int, home_goals: int, away_goals: int, sign: int):
+        self.points[home] += sign * _result_points(home_goals, away_goals)
+        self.points[away] += sign * _result_points(away_goals, home_goals)
+        self.goals_for[home] += sign * home_goals
+        self.goals_against[home] += sign * away_goals
+        self.goals_for[away] += sign * away_goals
+        self.goals_against[away] += sign * home_goals
+
+    def apply_score(self, fixture_id, home: str, away: str, home_goals, away_goals) -> bool:
+        """Bring one fixture's provisional result up to date.
+
+        Returns True if the table changed. Unknown teams are ignored.
+        """
+        h, a = self._index.get(home), self._index.get(away)
+        if h is None or a is None:
+            return False
+        score = (h, a, int(home_goals or 0), int(away_goals or 0))
+        previous = self._applied.get(fixture_id)
+        if previous == score:
+            return False
+        if previous is not None:
+            self._apply(*previous, sign=-1)
+        self._apply(*score, sign=1)
+        self._applied[fixture_id] = score
+        return True
+
+    @property
+    def fixtures_applied(self) -> int:
+        return len(self._applied)
+
+    def positions(self) -> np.ndarray:
+        """Rank on points, then goal difference, then goals scored."""
+        gd = self.goals_for - self.goals_against
+        order = np.lexsort((self._tiebreak, -self.goals_for, -gd, -self.points))
+        positions = np.empty(len(order), dtype=np.int32)
+        positions[order] = np.arange(1, len(order) + 1)
+        return positions
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the provisional table in the same shape as the base standings."""
+        positions = self.positions()
+        values = {
+            "Position": positions,
+            "Points_League": self.points,
+            "Goals_For": self.goals_for,
+            "Goals_Against": self.goals_against,
+            "Points_Value": position_points(positions),
+        }
+        # assign() shares the untouched base columns (copy-on-write); the
+        # arrays are copied into the base table's dtypes
+        df = self._base.assign(
+            **{col: v.astype(self._base[col].dtype if col in self._base else v.dtype) for col, v in values.items()}
+        )
+        return df.sort_values("Position").reset_index(drop=True)
+
+
+class LiveTableWorker(threading.Thread):
+    """Process-wide poller that keeps one provisional table up to date.
+
+    Parameters
+    ----------
+    get_base : callable
+        Returns ``(key, standings_df)``; a new key rebuilds the table from
+        the fresh standings.
+    get_live_fixtures : callable
+        Returns in-play fixtures as produced by ``pulse_live.get_fixtures``.
+    is_live : callable
+        Polling is skipped while this returns False (no match window).
+    canonical : callable, optional
+        Maps fixture team names to the standings' spelling (e.g.
+        ``TeamRegistry.canonical``); unmatched names can't be applied.
+    """
+
+    def __init__(self, get_base, get_live_fixtures, is_live=lambda: True,
+                 poll_interval: int = LIVE_POLL_INTERVAL, canonical=None):
+        super().__init__(name="live-table", daemon=True)
+        self.get_base = get_base
+        self.get_live_fixtures = get_live_fixtures
+        self.is_live = is_live
+        self.poll_interval = poll_interval
+        self.canonical = canonical or (lambda name: name)
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._base_key = None
+        self._table = None
+        self._frame = None
+        self.version = 0
+        self.matches_in_play = 0  # scored fixtures in the latest poll
+        self.fixtures_applied = 0  # results on top of the base table
+
+    def stop(self):
+        self._stop_event.set()
+
+    def snapshot(self):
+        """Return ``(version, frame)``; frame is None until the first poll."""
+        with self._lock:
+            return self.version, self._frame
+
+    def poll_once(self) -> bool:
+        """Fetch live scores once and publish a new frame if anything moved."""
+        key, base_df = self.get_base()
+        changed = False
+        if key != self._base_key or self._table is None:
+            self._base_key = key
+            self._table = LiveTable(base_df)
+            changed = True
+
+        in_play = 0
+        for fx in self.get_live_fixtures():
+            if fx.get("home_score") is None or fx.get("away_score") is None:
+                continue
+            in_play += 1
+            changed |= self._table.apply_score(
+                fx["id"], self.canonical(fx["home"]), self.canonical(fx["away"]),
+                fx["home_score"], fx["away_score"],
+            )
+
+        self.matches_in_play = in_play
+        self.fixtures_applied = self._table.fixtures_applied
+        if changed:
+            frame = self._table.to_frame()
+            with self._lock:
+                self._frame = frame
+                self.version += 1
+        return changed
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                if self._table is None or self.is_live():
+                    self.poll_once()
+            except Exception:
+                logger.exception("Live table poll failed")
+            self._stop_event.wait(self.poll_interval)
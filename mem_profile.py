@@ -0,0 +1,225 @@
+"""Opt-in per-rerun memory profiling and leak detection (tracemalloc).
+
+Off unless ``SWEEPSTAKE_MEMPROFILE`` is set (to ``1``, or to the number of
+traceback frames to keep, e.g. ``10``); tracing slows Python allocations
+down noticeably, so it isn't for normal serving. When on:
+
+* every rerun records the traced heap before and after it and its peak,
+  so ``retained`` is what the rerun left behind;
+* cached functions wrapped with ``PROFILER.track(name)`` record what each
+  cache miss allocated and kept (the size of the cached value, roughly);
+* ``growth()`` fits a line through the heap left after the last
+  ``GROWTH_WINDOW`` reruns and flags a leak when it climbs more than
+  ``GROWTH_THRESHOLD`` bytes over the window. Each episode of growth writes a
+  top-allocations report (largest allocation sites now, and growth since
+  the first rerun) to ``REPORT_PATH``.
+
+tracemalloc's counters are process-wide, so with several sessions rerunning
+at once a rerun's numbers include its neighbours' allocations. Per-rerun
+figures are indicative; the trend across reruns is what matters.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone
+
+from snapshot_store import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+REPORT_PATH = os.environ.get("SWEEPSTAKE_MEMPROFILE_REPORT", os.path.join(DATA_DIR, "memory_report.txt"))
+WINDOW_SIZE = 200  # reruns kept
+GROWTH_WINDOW = 20  # reruns a growth trend is judged over
+GROWTH_THRESHOLD = 1024 * 1024  # bytes over GROWTH_WINDOW that count as a leak
+TOP_ALLOCATIONS = 25
+# Allocation sites left out of reports: tracemalloc itself and imports
+IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap*>", "<unknown>")
+
+
+def _frames_setting() -> int:
+    value = os.environ.get("SWEEPSTAKE_MEMPROFILE", "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return 0
+    return int(value) if value.isdigit() and int(value) > 1 else 1
+
+
+def _slope(values: list[float]) -> float:
+    """Least-squares slope of ``values`` against their index."""
+    n = len(values)
+    mean_x, mean_y = (n - 1) / 2, sum(values) / n
+    var = sum((x - mean_x) ** 2 for x in range(n))
+    return sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values)) / var if var else 0.0
+
+
+class RerunMemory:
+    """Traced heap around one rerun (bytes)."""
+
+    def __init__(self, before: int):
+        self.started = time.time()
+        self.before = before
+        self.after = before
+        self.peak = before
+
+    @property
+    def retained(self) -> int:
+        return self.after - self.before
+
+
+class MemoryProfiler:
+    """Process-wide tracemalloc bookkeeping for reruns and caches."""
+
+    def __init__(self, frames: int = 0, report_path: str = REPORT_PATH, window: int = WINDOW_SIZE):
+        self.frames = frames
+        self.report_path = report_path
+        self.reruns: deque[RerunMemory] = deque(maxlen=window)
+        self.caches: dict[str, dict] = {}
+        self.baseline: tracemalloc.Snapshot | None = None
+        self.flagged = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.frames > 0
+
+    def _ensure_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    # --- Reruns ---
+    def start_run(self) -> RerunMemory | None:
+        """Begin measuring a rerun (None when profiling is off)."""
+        if not self.enabled:
+            return None
+        self._ensure_tracing()
+        if self.baseline is None:
+            with self._lock:
+                if self.baseline is None:
+                    self.baseline = self._snapshot()
+        tracemalloc.reset_peak()
+        return RerunMemory(tracemalloc.get_traced_memory()[0])
+
+    def finish_run(self, run: RerunMemory | None):
+        """Record a finished rerun and check for growth."""
+        if run is None or not tracemalloc.is_tracing():
+            return
+        run.after, run.peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            self.reruns.append(run)
+        growth = self.growth()
+        if growth and not self.flagged:
+            logger.warning(
+                "Traced heap grew %.1f KiB over the last %d reruns; writing %s",
+                growth / 1024, GROWTH_WINDOW, self.report_path,
+            )
+            self.write_report()
+        # Report once per episode of growth
+        self.flagged = bool(growth)
+
+    def growth(self, window: int = GROWTH_WINDOW, threshold: int = GROWTH_THRESHOLD) -> float | None:
+        """Bytes the heap trended up over the last ``window`` reruns, if over ``threshold``."""
+        with self._lock:
+            afters = [run.after for run in self.reruns][-window:]
+        if len(afters) < window:
+            return None
+        trend = _slope(afters) * (window - 1)
+        return trend if trend > threshold else None
+
+    def summary(self) -> dict:
+        """Latest rerun and window-wide figures (bytes)."""
+        with self._lock:
+            reruns = list(self.reruns)
+        if not reruns:
+            return {}
+        last = reruns[-1]
+        return {
+            "reruns": len(reruns),
+            "current": last.after,
+            "last_peak": last.peak,
+            "last_retained": last.retained,
+            "max_peak": max(run.peak for run in reruns),
+            "growth": self.growth(),
+        }
+
+    # --- Caches ---
+    def track(self, name: str):
+        """Decorator recording what each call of a (cached) function keeps.
+
+        Put it under ``st.cache_*`` so it runs on misses only. A no-op when
+        profiling is off.
+        """
+        def decorate(func):
+            if not self.enabled:
+                return func
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                self._ensure_tracing()
+                before = tracemalloc.get_traced_memory()[0]
+                result = func(*args, **kwargs)
+                kept = tracemalloc.get_traced_memory()[0] - before
+                with self._lock:
+                    stats = self.caches.setdefault(name, {"misses": 0, "retained": 0, "largest": 0})
+                    stats["misses"] += 1
+                    stats["retained"] += kept
+                    stats["largest"] = max(stats["largest"], kept)
+                return result
+            return wrapper
+        return decorate
+
+    def cache_rows(self) -> list[dict]:
+        with self._lock:
+            caches = {name: dict(stats) for name, stats in self.caches.items()}
+        return [
+            {"Cache": name, "Misses": s["misses"], "Retained (KiB)": round(s["retained"] / 1024, 1),
+             "Largest miss (KiB)": round(s["largest"] / 1024, 1)}
+            for name, s in sorted(caches.items(), key=lambda item: -item[1]["retained"])
+        ]
+
+    # --- Reports ---
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, pattern) for pattern in IGNORED_FILES]
+        )
+
+    def report(self, limit: int = TOP_ALLOCATIONS) -> str:
+        """Top allocation sites now, and the biggest growth since the first rerun."""
+        if not tracemalloc.is_tracing():
+            return "tracemalloc is not tracing (set SWEEPSTAKE_MEMPROFILE=1)\n"
+        snapshot = self._snapshot()
+        lines = [f"Memory report {datetime.now(timezone.utc).isoformat()}"]
+        summary = self.summary()
+        if summary:
+            lines.append(
+                f"{summary['reruns']} reruns; traced heap {summary['current'] / 1024:.1f} KiB, "
+                f"last rerun peak {summary['last_peak'] / 1024:.1f} KiB, "
+                f"retained {summary['last_retained'] / 1024:+.1f} KiB"
+            )
+        lines += ["", f"Top {limit} allocation sites:"]
+        for stat in snapshot.statistics("lineno")[:limit]:
+            lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {stat.traceback[0]}")
+        if self.baseline is not None:
+            lines += ["", f"Top {limit} growth since the first rerun:"]
+            for stat in snapshot.compare_to(self.baseline, "lineno")[:limit]:
+                lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  {stat.traceback[0]}")
+        rows = self.cache_rows()
+        if rows:
+            lines += ["", "Caches (retained on misses):"]
+            for row in rows:
+                lines.append(f"  {row['Cache']:<24} {row['Misses']:6d} misses {row['Retained (KiB)']:10.1f} KiB")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: str | None = None) -> str:
+        """Write ``report()`` to ``path`` (default ``report_path``); returns the path."""
+        path = path or self.report_path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.report())
+        return path
+
+
+PROFILER = MemoryProfiler(_frames_setting())
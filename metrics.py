@@ -0,0 +1,214 @@
+"""In-process counters/histograms exposed in Prometheus text format.
+
+A deliberately small subset of the Prometheus data model (counters and
+histograms with labels) so there's no extra dependency. The fetch layer in
+``pulse_live`` records upstream health here; ``start_metrics_server``
+serves ``/metrics`` from a daemon thread for scraping.
+"""
+
+import bisect
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Latency buckets in seconds, tuned around the 10s request timeout.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        k + '="' + str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for k, v in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally split by labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts..., +Inf count, sum]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def count(self, **labels) -> int:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            state = self._values.get(key)
+            return sum(state[:-1]) if state else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(state[-1])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+UPSTREAM_REQUESTS = REGISTRY.register(Counter(
+    "sweepstake_upstream_requests",
+    "Pulse Live requests by endpoint and HTTP status (or 'timeout'/'error').",
+    ("endpoint", "status"),
+))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "sweepstake_upstream_request_duration_seconds",
+    "Pulse Live request latency by endpoint.",
+    ("endpoint",),
+))
+UPSTREAM_TIMEOUTS = REGISTRY.register(Counter(
+    "sweepstake_upstream_timeouts",
+    "Pulse Live requests that hit the client timeout.",
+    ("endpoint",),
+))
+UPSTREAM_BYTES = REGISTRY.register(Counter(
+    "sweepstake_upstream_response_bytes",
+    "Response body bytes downloaded from Pulse Live.",
+    ("endpoint",),
+))
+FALLBACK_ACTIVATIONS = REGISTRY.register(Counter(
+    "sweepstake_fallback_activations",
+    "Times the static fallback standings were used.",
+))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "sweepstake_cache_requests",
+    "Cache lookups by result: hit, miss, or stale (non-live data served).",
+    ("cache", "result"),
+))
+COALESCED_CALLS = REGISTRY.register(Counter(
+    "sweepstake_coalesced_calls",
+    "Upstream calls by single-flight result: leader (did the work) or shared (waited on it).",
+    ("call", "result"),
+))
+
+
+class CacheProbe:
+    """Tell hits from misses for a memoising decorator such as ``st.cache_data``.
+
+    Call ``miss()`` from inside the cached function body and wrap each
+    call site in ``lookup()``; if the body didn't run, it was a hit.
+    """
+
+    def __init__(self, cache: str):
+        self.cache = cache
+        self._local = threading.local()
+
+    def miss(self):
+        self._local.missed = True
+        CACHE_REQUESTS.inc(cache=self.cache, result="miss")
+
+    def stale(self):
+        CACHE_REQUESTS.inc(cache=self.cache, result="stale")
+
+    @contextmanager
+    def lookup(self):
+        self._local.missed = False
+        yield
+        if not self._local.missed:
+            CACHE_REQUESTS.inc(cache=self.cache, result="hit")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep scrapes out of the Streamlit log
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``/metrics`` on ``host:port`` from a daemon thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -0,0 +1,115 @@
+"""Leaderboard movement and head-to-head records, kept up to date incrementally.
+
+A ``MovementTracker`` holds, for every group at once, the totals from the
+latest two standings snapshots and a running head-to-head count (how many
+snapshots each player was ahead of each other player). New snapshots are
+folded in one at a time -- ``catch_up`` reads only what was appended to
+the snapshot store since the last call -- so a rerun costs a ``stat``
+rather than a pass over the whole season.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from scoring import PickMatrix
+from snapshot_store import SnapshotStore
+
+
+def ranks(totals: np.ndarray) -> np.ndarray:
+    """1-based ranks with ties sharing the better rank (as ``scoring.leaderboard``)."""
+    return 1 + (totals[None, :] > totals[:, None]).sum(axis=1)
+
+
+def rank_arrow(change: int) -> str:
+    """'▲2', '▼1' or '–' for a rank change (positive = moved up)."""
+    if change > 0:
+        return f"▲{change}"
+    if change < 0:
+        return f"▼{-change}"
+    return "–"
+
+
+class MovementTracker:
+    """Per-group movement and head-to-head, updated one snapshot at a time."""
+
+    def __init__(self, matrix: PickMatrix):
+        self.matrix = matrix
+        self._lock = threading.Lock()
+        self._feed_lock = threading.Lock()  # one catch_up at a time
+        self._reset()
+
+    def _reset(self):
+        self.snapshots = 0
+        self.offset = 0  # bytes of the snapshot file already folded in
+        self.latest: np.ndarray | None = None  # totals per slot
+        self.previous: np.ndarray | None = None
+        self.ahead = {
+            group_id: np.zeros((end - start, end - start), dtype=np.int32)
+            for group_id, (start, end) in self.matrix.group_slots.items()
+        }
+
+    def add(self, standings_df: pd.DataFrame) -> bool:
+        """Fold in one snapshot; False if it can't be scored."""
+        if "Points_Value" not in standings_df:
+            return False
+        totals = self.matrix.score_standings(standings_df)
+        with self._lock:
+            for group_id, (start, end) in self.matrix.group_slots.items():
+                group = totals[start:end]
+                self.ahead[group_id] += group[:, None] > group[None, :]
+            self.previous, self.latest = self.latest, totals
+            self.snapshots += 1
+        return True
+
+    def catch_up(self, store: SnapshotStore, season_label: str) -> int:
+        """Fold in the snapshots appended since the last call; returns how many."""
+        with self._feed_lock:
+            size = store.version(season_label)[0]
+            if size < self.offset:
+                # The file was replaced (e.g. restored from a backup): start over
+                with self._lock:
+                    self._reset()
+            if size == self.offset:
+                return 0
+            snapshots, offset = store.read_since(season_label, self.offset)
+            added = sum(self.add(df) for df in snapshots)
+            self.offset = offset
+            return added
+
+    def movement(self, group_id: str, scores: np.ndarray | None = None) -> pd.DataFrame:
+        """``Player``/``Rank``/``Rank_Change``/``Points_Change`` for one group.
+
+        ``scores`` (all slots, as from ``PickMatrix.score_standings``) is the
+        table being shown. Changes are against the latest snapshot, or the
+        one before it when ``scores`` match the latest (the usual case: the
+        shown table *is* the latest snapshot). Without history they're 0.
+        """
+        start, end = self.matrix.group_slots[group_id]
+        with self._lock:
+            latest, previous = self.latest, self.previous
+        current = scores if scores is not None else latest
+        if current is None:
+            current = np.zeros(self.matrix.n_slots, dtype=np.int64)
+        current = current[start:end]
+        baseline = latest[start:end] if latest is not None else None
+        if baseline is not None and np.array_equal(baseline, current):
+            baseline = previous[start:end] if previous is not None else None
+        if baseline is None:
+            baseline = current
+        now = ranks(current)
+        return pd.DataFrame({
+            "Player": self.matrix.slot_player[start:end],
+            "Rank": now,
+            "Rank_Change": ranks(baseline) - now,
+            "Points_Change": (current - baseline).astype(np.int64),
+        })
+
+    def head_to_head(self, group_id: str) -> pd.DataFrame:
+        """Snapshots in which the row player was ahead of the column player."""
+        start, end = self.matrix.group_slots[group_id]
+        players = self.matrix.slot_player[start:end]
+        with self._lock:
+            ahead = self.ahead[group_id].copy()
+        return pd.DataFrame(ahead, index=pd.Index(players, name="Player"), columns=players)
@@ -0,0 +1,192 @@
+"""Sweepstake groups and their picks, loaded from a config file or SQLite.
+
+``data/picks.json`` holds one or more groups::
+
+    {"default_group": "bottoms",
+     "groups": {"bottoms": {"name": "Bottoms Sweepstake", "stake": 5,
+                            "jackpot": 25, "picks": {"Vosey": ["Bournemouth", ...]}}}}
+
+For company-wide use with thousands of groups the same data can live in
+a SQLite database (``.db``/``.sqlite``) with ``groups`` and ``picks``
+tables. Either way the whole store is read once per process; a group
+page is then a dict lookup plus a slice of the shared score array built
+in ``scoring.py``.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+
+import pandas as pd
+
+PICKS_PATH = os.environ.get(
+    "SWEEPSTAKE_PICKS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "picks.json"),
+)
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    group_id TEXT PRIMARY KEY,
+    name TEXT,
+    season TEXT,
+    stake REAL,
+    jackpot REAL,
+    is_default INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS picks (
+    group_id TEXT NOT NULL REFERENCES groups(group_id),
+    player TEXT NOT NULL,
+    team TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    PRIMARY KEY (group_id, player, slot)
+);
+"""
+
+
+class UnknownGroupError(KeyError):
+    """Raised for a group id that isn't in the store."""
+
+
+def _normalise_group(group_id: str, group: dict) -> dict:
+    picks = group.get("picks") or {}
+    return {
+        "name": group.get("name") or group_id,
+        "season": group.get("season"),
+        "stake": group.get("stake"),
+        "jackpot": group.get("jackpot"),
+        # player -> list of team names, in pick order
+        "picks": {str(p): [str(t).strip() for t in teams] for p, teams in picks.items()},
+    }
+
+
+class PicksStore:
+    def __init__(self, groups: dict[str, dict] | None = None, default_group: str | None = None,
+                 path: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self.groups: dict[str, dict] = {
+            str(gid): _normalise_group(str(gid), g) for gid, g in (groups or {}).items()
+        }
+        self.default_group = default_group if default_group in self.groups else next(iter(self.groups), None)
+        self.version = 0  # bumped on every change, used as a cache key
+
+    @classmethod
+    def load(cls, path: str = PICKS_PATH) -> "PicksStore":
+        """Load a JSON config or SQLite database (chosen by file extension)."""
+        if path.lower().endswith(SQLITE_SUFFIXES):
+            return cls._load_sqlite(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                doc = json.load(f)
+        except FileNotFoundError:
+            return cls(path=path)
+        return cls(doc.get("groups", {}), doc.get("default_group"), path=path)
+
+    @classmethod
+    def _load_sqlite(cls, path: str) -> "PicksStore":
+        groups: dict[str, dict] = {}
+        default_group = None
+        with sqlite3.connect(path) as conn:
+            conn.executescript(SQLITE_SCHEMA)
+            for gid, name, season, stake, jackpot, is_default in conn.execute(
+                "SELECT group_id, name, season, stake, jackpot, is_default FROM groups"
+            ):
+                groups[gid] = {"name": name, "season": season, "stake": stake,
+                               "jackpot": jackpot, "picks": {}}
+                if is_default:
+                    default_group = gid
+            for gid, player, team in conn.execute(
+                "SELECT group_id, player, team FROM picks ORDER BY group_id, player, slot"
+            ):
+                if gid in groups:
+                    groups[gid]["picks"].setdefault(player, []).append(team)
+        return cls(groups, default_group, path=path)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __contains__(self, group_id) -> bool:
+        return group_id in self.groups
+
+    def group_ids(self) -> list[str]:
+        return list(self.groups)
+
+    def group(self, group_id: str | None = None) -> dict:
+        """The group's config (``name``, ``stake``, ``jackpot``, ``picks``)."""
+        group_id = group_id or self.default_group
+        try:
+            return self.groups[group_id]
+        except KeyError:
+            raise UnknownGroupError(group_id) from None
+
+    def picks_frame(self, group_id: str | None = None) -> pd.DataFrame:
+        """One row per pick with ``Player`` and ``Team`` columns."""
+        picks = self.group(group_id)["picks"]
+        rows = [(player, team) for player, teams in picks.items() for team in teams]
+        return pd.DataFrame(rows, columns=["Player", "Team"])
+
+    def set_group(self, group_id: str, group: dict):
+        """Add or replace a group (call ``save`` to persist)."""
+        with self._lock:
+            self.groups[str(group_id)] = _normalise_group(str(group_id), group)
+            if self.default_group is None:
+                self.default_group = str(group_id)
+            self.version += 1
+
+    def save(self, path: str | None = None):
+        """Write the store back in the format its path implies."""
+        path = path or self.path
+        if not path:
+            return
+        if path.lower().endswith(SQLITE_SUFFIXES):
+            self._save_sqlite(path)
+            return
+        with self._lock:
+            payload = json.dumps(
+                {"default_group": self.default_group, "groups": self.groups},
+                indent=2, ensure_ascii=False,
+            ) + "\n"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+    def _save_sqlite(self, path: str):
+        with self._lock, sqlite3.connect(path) as conn:
+            conn.executescript(SQLITE_SCHEMA)
+            conn.execute("DELETE FROM picks")
+            conn.execute("DELETE FROM groups")
+            conn.executemany(
+                "INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (gid, g["name"], g["season"], g["stake"], g["jackpot"], int(gid == self.default_group))
+                    for gid, g in self.groups.items()
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO picks VALUES (?, ?, ?, ?)",
+                [
+                    (gid, player, team, slot)
+                    for gid, g in self.groups.items()
+                    for player, teams in g["picks"].items()
+                    for slot, team in enumerate(teams)
+                ],
+            )
+
+
+_store: PicksStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_picks_store() -> PicksStore:
+    """The process-wide picks store, loaded on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PicksStore.load()
+    return _store
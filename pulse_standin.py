@@ -0,0 +1,292 @@
+"""Local stand-in for the Pulse Live API that replays recorded responses.
+
+Serves the endpoints ``pulse_live`` uses from the JSON files in
+``fixtures/pulselive/`` so the app, CLI and benchmarks can run without
+the network and without putting load on the real API. Point the app at
+it with ``SWEEPSTAKE_PULSE_URL`` (or ``--pulse-url`` on the CLIs)::
+
+    python pulse_standin.py --port 8766 &
+    SWEEPSTAKE_PULSE_URL=http://127.0.0.1:8766 streamlit run bottoms_sweepstake.py
+
+The recording can be reshaped into the other layouts the parsers accept
+(``SHAPES``: the season and team lists under ``compSeasons``/``teams``/
+``content`` or as bare lists, the fixture list (``matches``) under
+``fixtures``/``content`` or bare, the league table under ``tables`` or ``standings``, points
+under ``overall`` or in a ``stats`` dict or list), and the server can
+misbehave on purpose: a fixed delay plus random jitter per response, a
+seeded fraction of error responses, and ETags so that conditional
+requests get ``304 Not Modified``::
+
+    python pulse_standin.py --stats list --latency 0.2 --jitter 0.1 --error-rate 0.1
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pulselive")
+DEFAULT_PORT = 8766
+
+# (path pattern, fixture file, endpoint name for request counts)
+ROUTES = [
+    (re.compile(r"^/football/(competitions/1/)?compseasons$"), "compseasons.json", "compseasons"),
+    (re.compile(r"^/football/competitions/1/compseasons/\d+/teams$"), "teams.json", "teams"),
+    (re.compile(r"^/football/teams$"), "teams.json", "teams"),
+    (re.compile(r"^/football/standings$"), "standings.json", "standings"),
+    (re.compile(r"^/football/fixtures$"), "fixtures.json", "fixtures"),
+]
+
+# Response layouts each payload can be served in; the first is the recording's own
+SHAPES = {
+    "seasons": ("content", "compSeasons", "list"),
+    "teams": ("content", "teams", "list"),
+    "tables": ("tables", "standings"),
+    "stats": ("overall", "dict", "list"),
+    "matches": ("content", "fixtures", "list"),
+}
+
+
+def _dumps(doc) -> bytes:
+    return json.dumps(doc, separators=(",", ":")).encode()
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+
+
+def _reshape_list(doc: dict, shape: str):
+    """A ``{"content": [...]}`` page with its list under ``shape``, or bare."""
+    if shape == "list":
+        return doc["content"]
+    if shape != "content":
+        return {shape: doc["content"], **{k: v for k, v in doc.items() if k != "content"}}
+    return doc
+
+
+def _reshape_entry(entry: dict, shape: str) -> dict:
+    """Move an entry's points from ``overall`` into ``stats`` (goals stay put)."""
+    if shape == "overall":
+        return entry
+    overall = dict(entry.get("overall") or {})
+    points = overall.pop("points", 0)
+    stats = {"points": points} if shape == "dict" else [{"name": "points", "value": points}]
+    return {**entry, "overall": overall, "stats": stats}
+
+
+def _reshape_standings(doc: dict, tables: str, stats: str) -> dict:
+    reshaped = {k: v for k, v in doc.items() if k != "tables"}
+    reshaped[tables] = [
+        {**table, "entries": [_reshape_entry(e, stats) for e in table["entries"]]}
+        for table in doc["tables"]
+    ]
+    return reshaped
+
+
+class Recording:
+    """Recorded responses loaded once, reshaped, and kept as bytes with their ETags."""
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, seasons: str = "content",
+                 tables: str = "tables", stats: str = "overall", teams: str = "content",
+                 matches: str = "content"):
+        for option, value in (("seasons", seasons), ("tables", tables), ("stats", stats), ("teams", teams),
+                              ("matches", matches)):
+            if value not in SHAPES[option]:
+                raise ValueError(f"{option} shape must be one of {', '.join(SHAPES[option])}, not {value!r}")
+        self.fixtures_dir = fixtures_dir
+        self.bodies: dict[str, bytes] = {}
+        self.documents: dict[str, dict] = {}
+        for name in sorted(os.listdir(fixtures_dir)):
+            if name.endswith(".json"):
+                with open(os.path.join(fixtures_dir, name), "rb") as f:
+                    self.bodies[name] = f.read()
+        if seasons != "content" and "compseasons.json" in self.bodies:
+            self.bodies["compseasons.json"] = _dumps(_reshape_list(self.document("compseasons.json"), seasons))
+        if teams != "content" and "teams.json" in self.bodies:
+            self.bodies["teams.json"] = _dumps(_reshape_list(self.document("teams.json"), teams))
+        if (tables, stats) != ("tables", "overall") and "standings.json" in self.bodies:
+            self.bodies["standings.json"] = _dumps(_reshape_standings(self.document("standings.json"), tables, stats))
+        self.matches = matches
+        if matches != "content" and "fixtures.json" in self.bodies:
+            # Filtering by status works on the recorded page, so parse it first
+            self.bodies["fixtures.json"] = _dumps(_reshape_list(self.document("fixtures.json"), matches))
+        self.etags = {name: _etag(body) for name, body in self.bodies.items()}
+        self._fixtures_by_status: dict[str, tuple[bytes, str]] = {}
+
+    def document(self, name: str) -> dict:
+        if name not in self.documents:
+            self.documents[name] = json.loads(self.bodies[name])
+        return self.documents[name]
+
+    def response(self, name: str) -> tuple[bytes, str]:
+        """A recorded body and its ETag."""
+        return self.bodies[name], self.etags[name]
+
+    def fixtures(self, statuses: str | None) -> tuple[bytes, str]:
+        """The fixtures file filtered by ``statuses`` (e.g. 'U,L,C'), memoised."""
+        if not statuses:
+            return self.response("fixtures.json")
+        cached = self._fixtures_by_status.get(statuses)
+        if cached is None:
+            wanted = set(statuses.split(","))
+            doc = dict(self.document("fixtures.json"))
+            doc["content"] = [fx for fx in doc["content"] if fx.get("status") in wanted]
+            body = _dumps(_reshape_list(doc, self.matches))
+            cached = self._fixtures_by_status[statuses] = (body, _etag(body))
+        return cached
+
+
+class Behaviour:
+    """How the stand-in misbehaves: delays, random errors and ETags.
+
+    ``latency`` seconds are added to every response, plus up to
+    ``jitter`` more; a ``error_rate`` fraction of requests (drawn from a
+    generator seeded with ``seed``) get ``error_status`` instead of the
+    recording. With ``etags`` on, responses carry an ETag and a request
+    whose ``If-None-Match`` matches it gets ``304 Not Modified``.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, etags: bool = True, seed: int | None = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.etags = etags
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> tuple[float, bool]:
+        """The delay for one response and whether it fails."""
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = bool(self.error_rate) and self._rng.random() < self.error_rate
+        return delay, fail
+
+
+class _StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    recording: Recording = None
+    behaviour: Behaviour = None
+    requests: Counter = None
+    statuses: Counter = None
+
+    def _send(self, status: int, body: bytes = b"", etag: str | None = None):
+        self.statuses[status] += 1
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        for pattern, name, endpoint in ROUTES:
+            if pattern.match(url.path):
+                break
+        else:
+            self.requests["unknown"] += 1
+            self._send(404, b'{"error":"not found"}')
+            return
+        self.requests[endpoint] += 1
+        delay, fail = self.behaviour.draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            status = self.behaviour.error_status
+            self._send(status, _dumps({"error": f"stand-in error {status}"}))
+            return
+        if name == "fixtures.json":
+            body, etag = self.recording.fixtures(parse_qs(url.query).get("statuses", [None])[0])
+        else:
+            body, etag = self.recording.response(name)
+        if not self.behaviour.etags:
+            self._send(200, body)
+        elif self.headers.get("If-None-Match") == etag:
+            self._send(304, etag=etag)
+        else:
+            self._send(200, body, etag)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin(port: int = 0, host: str = "127.0.0.1", fixtures_dir: str = FIXTURES_DIR,
+                  seasons: str = "content", tables: str = "tables", stats: str = "overall",
+                  teams: str = "content", matches: str = "content", **behaviour) -> ThreadingHTTPServer:
+    """Serve the recording from a daemon thread.
+
+    ``seasons``/``tables``/``stats``/``teams``/``matches`` pick the response shapes (see
+    ``SHAPES``) and any other keyword goes to ``Behaviour``. The server's
+    ``requests`` attribute counts requests per endpoint, ``statuses``
+    counts responses per status code, and ``url`` is the base URL to hand
+    to ``SWEEPSTAKE_PULSE_URL``.
+    """
+    handler = type(
+        "StandinHandler",
+        (_StandinHandler,),
+        {
+            "recording": Recording(fixtures_dir, seasons, tables, stats, teams, matches),
+            "behaviour": Behaviour(**behaviour),
+            "requests": Counter(),
+            "statuses": Counter(),
+        },
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.requests = handler.requests
+    server.statuses = handler.statuses
+    server.url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, name="pulse-standin", daemon=True).start()
+    return server
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded Pulse Live responses locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="directory of recorded responses")
+    parser.add_argument("--seasons", choices=SHAPES["seasons"], default="content", help="season list layout")
+    parser.add_argument("--tables", choices=SHAPES["tables"], default="tables", help="standings tables key")
+    parser.add_argument("--stats", choices=SHAPES["stats"], default="overall", help="where entries keep points")
+    parser.add_argument("--teams", choices=SHAPES["teams"], default="content", help="team list layout")
+    parser.add_argument("--matches", choices=SHAPES["matches"], default="content", help="fixture list layout")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds, at random")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503, help="status code of the failures")
+    parser.add_argument("--no-etags", dest="etags", action="store_false", help="never answer 304")
+    parser.add_argument("--seed", type=int, help="seed for the jitter and errors")
+    args = parser.parse_args(argv)
+
+    server = start_standin(
+        args.port, args.host, args.fixtures, args.seasons, args.tables, args.stats, args.teams, args.matches,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        error_status=args.error_status, etags=args.etags, seed=args.seed,
+    )
+    print(f"Pulse Live stand-in on {server.url} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
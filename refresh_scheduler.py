@@ -0,0 +1,195 @@
+"""Matchday-aware refresh scheduling for the standings cache.
+
+Instead of a fixed TTL, standings are cached under a *refresh key* that
+rolls over often while matches are being played and rarely otherwise.
+The live windows come from the fixture kickoff times. A background
+prewarmer fetches the next key shortly before it becomes current, so a
+user rerun never has to wait on the upstream request itself.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+LIVE_INTERVAL = 60  # seconds between refreshes while a match is on
+IDLE_INTERVAL = 6 * 3600  # seconds between refreshes with no matches
+WINDOW_BEFORE_KICKOFF = 15 * 60  # start polling shortly before kickoff
+WINDOW_AFTER_KICKOFF = 150 * 60  # 90 mins + half-time + stoppage + table update
+PREWARM_LEAD = 30  # seconds before a refresh boundary to fetch the next key
+
+
+def _epoch(value) -> float:
+    """Return a POSIX timestamp for a datetime or number."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+class RefreshScheduler:
+    """Decide how stale the standings cache may be at any point in time.
+
+    Parameters
+    ----------
+    kickoffs : iterable of datetime or float
+        Kickoff times of the season's fixtures.
+    live_interval, idle_interval : int
+        Seconds between refreshes inside and outside match windows.
+    window_before, window_after : int
+        Seconds either side of a kickoff that count as "live".
+    """
+
+    def __init__(
+        self,
+        kickoffs=(),
+        live_interval: int = LIVE_INTERVAL,
+        idle_interval: int = IDLE_INTERVAL,
+        window_before: int = WINDOW_BEFORE_KICKOFF,
+        window_after: int = WINDOW_AFTER_KICKOFF,
+    ):
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+
+        # Merge overlapping windows (e.g. simultaneous 15:00 kickoffs)
+        windows: list[list[float]] = []
+        for k in sorted(_epoch(k) for k in kickoffs):
+            start, end = k - window_before, k + window_after
+            if windows and start <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end)
+            else:
+                windows.append([start, end])
+        self.windows = [tuple(w) for w in windows]
+        self._window_ends = [end for _, end in self.windows]
+
+    @classmethod
+    def from_fixtures(cls, fixtures, **kwargs):
+        """Build a scheduler from ``pulse_live.get_fixtures`` output."""
+        return cls((f["kickoff"] for f in fixtures if f.get("kickoff")), **kwargs)
+
+    def is_live(self, now=None) -> bool:
+        """Return True if ``now`` falls inside a match window."""
+        t = time.time() if now is None else _epoch(now)
+        return any(start <= t < end for start, end in self.windows)
+
+    def interval_at(self, now=None) -> int:
+        """Return the refresh interval in force at ``now``."""
+        return self.live_interval if self.is_live(now) else self.idle_interval
+
+    def next_transition(self, now=None) -> float | None:
+        """Return the next time a match window opens or closes after ``now``."""
+        t = time.time() if now is None else _epoch(now)
+        for start, end in self.windows:
+            if start > t:
+                return start
+            if end > t:
+                return end
+        return None
+
+    def refresh_key(self, now=None) -> str:
+        """Return the cache key for the standings that are current at ``now``.
+
+        The key changes at every refresh boundary, which is what actually
+        expires the cached standings. Idle keys also count the match windows
+        already over, so the first key after a window never matches one from
+        before it, even within the same idle interval.
+        """
+        t = time.time() if now is None else _epoch(now)
+        live = self.is_live(t)
+        interval = self.live_interval if live else self.idle_interval
+        if live:
+            return f"live-{interval}-{int(t // interval)}"
+        return f"idle-{interval}-{int(t // interval)}-w{bisect.bisect_right(self._window_ends, t)}"
+
+    def next_refresh(self, now=None) -> float:
+        """Return the timestamp of the next refresh boundary after ``now``."""
+        t = time.time() if now is None else _epoch(now)
+        interval = self.interval_at(t)
+        boundary = (t // interval + 1) * interval
+        transition = self.next_transition(t)
+        return min(boundary, transition) if transition is not None else boundary
+
+    def schedule(self, start=None, end=None) -> list[dict]:
+        """List every refresh between ``start`` and ``end`` (default: next 24h)."""
+        t = time.time() if start is None else _epoch(start)
+        stop = t + 24 * 3600 if end is None else _epoch(end)
+        rows = []
+        while True:
+            t = self.next_refresh(t)
+            if t >= stop:
+                break
+            rows.append(
+                {
+                    "at": datetime.fromtimestamp(t, tz=timezone.utc),
+                    "live": self.is_live(t),
+                    "interval": self.interval_at(t),
+                }
+            )
+        return rows
+
+    def request_budget(self, start=None, end=None, requests_per_refresh: int = 1) -> dict:
+        """Summarise the upstream requests the schedule costs over a period."""
+        rows = self.schedule(start, end)
+        live = sum(1 for r in rows if r["live"])
+        return {
+            "refreshes": len(rows),
+            "live_refreshes": live,
+            "idle_refreshes": len(rows) - live,
+            "upstream_requests": len(rows) * requests_per_refresh,
+        }
+
+
+class CachePrewarmer(threading.Thread):
+    """Daemon thread that warms the next refresh key before it goes live.
+
+    ``get_scheduler`` is called on every cycle so a rebuilt scheduler (e.g.
+    after fixtures are rescheduled) is picked up. ``warm`` receives the
+    upcoming refresh key and should populate the cache for it.
+    """
+
+    def __init__(self, get_scheduler, warm, lead: int = PREWARM_LEAD):
+        super().__init__(name="standings-prewarmer", daemon=True)
+        self.get_scheduler = get_scheduler
+        self.warm = warm
+        self.lead = lead
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                scheduler = self.get_scheduler()
+                boundary = scheduler.next_refresh()
+            except Exception:
+                logger.exception("Could not build the refresh schedule")
+                self._stop_event.wait(LIVE_INTERVAL)
+                continue
+
+            if self._stop_event.wait(max(0.0, boundary - self.lead - time.time())):
+                break
+            try:
+                self.warm(scheduler.refresh_key(boundary))
+            except Exception:
+                logger.exception("Prewarming the standings cache failed")
+            # Don't warm the same boundary twice
+            self._stop_event.wait(max(0.0, boundary - time.time()))
+
+
+def describe_schedule(scheduler: RefreshScheduler, hours: int = 24) -> list[dict]:
+    """Return the next ``hours`` of the schedule grouped into display rows."""
+    now = datetime.now(timezone.utc)
+    rows = []
+    for r in scheduler.schedule(now, now + timedelta(hours=hours)):
+        mode = "live" if r["live"] else "idle"
+        if rows and rows[-1]["Mode"] == mode:
+            rows[-1]["Until"] = r["at"]
+            rows[-1]["Refreshes"] += 1
+        else:
+            rows.append({"From": r["at"], "Until": r["at"], "Mode": mode, "Refreshes": 1})
+    return rows
@@ -0,0 +1,200 @@
+"""Shape-detecting extractors for Pulse Live standings and team payloads.
+
+Pulse Live has served the same data under several layouts over the years
+(``position`` vs ``rank``, ``team.name`` vs ``club.name``, points under
+``overall``, directly, or inside ``stats``). Rather than probing every
+alternative for every entry, we look at the first entry once, pick the
+key path that is actually present for each field, and compile a chain of
+``itemgetter`` calls for it. Entries that don't fit the compiled shape
+fall back to the defensive probe, so mixed payloads still parse.
+"""
+
+from operator import itemgetter
+
+import numpy as np
+
+# Candidate key paths per field, in order of preference.
+POSITION_PATHS = [("position",), ("rank",)]
+NAME_PATHS = [
+    ("team", "name"),
+    ("team", "club", "name"),
+    ("club", "name"),
+    ("team", "displayName"),
+]
+OPTA_PATHS = [("team", "altIds", "opta"), ("club", "altIds", "opta")]
+TEAM_ID_PATHS = [("team", "id"), ("club", "id")]
+POINTS_PATHS = [("overall", "points"), ("points",), ("stats", "points")]
+GOALS_FOR_PATHS = [("overall", "goalsFor")]
+GOALS_AGAINST_PATHS = [("overall", "goalsAgainst")]
+TEAM_LIST_NAME_PATHS = [("name",), ("team", "name"), ("club", "name"), ("displayName",)]
+
+STATS_POINT_NAMES = ("points", "pts", "Points")
+
+
+def _has_path(obj, path) -> bool:
+    for key in path:
+        if not isinstance(obj, dict) or obj.get(key) is None:
+            return False
+        obj = obj[key]
+    return True
+
+
+def _compile_path(path):
+    """Return a getter equivalent to ``lambda e: e[path[0]][path[1]]...``."""
+    getter = itemgetter(path[0])
+    for key in path[1:]:
+        getter = (lambda outer, inner: lambda e: inner(outer(e)))(getter, itemgetter(key))
+    return getter
+
+
+def _stats_list_points(e):
+    for it in e["stats"]:
+        if it.get("name") in STATS_POINT_NAMES:
+            return it.get("value") or it.get("displayValue")
+    raise KeyError("points")
+
+
+def _probe(e, paths, default=None):
+    """Slow path: try each candidate path until one yields a value."""
+    for path in paths:
+        if _has_path(e, path):
+            return _compile_path(path)(e)
+    return default
+
+
+def _detect(sample, paths, default=None):
+    """Compile the first candidate path present in ``sample``."""
+    for path in paths:
+        if _has_path(sample, path):
+            return _compile_path(path)
+    if default is not None:
+        return lambda e: default
+    return None
+
+
+class StandingsExtractor:
+    """Column extractor compiled for one standings payload layout."""
+
+    def __init__(self, sample: dict):
+        self.position = _detect(sample, POSITION_PATHS)
+        self.name = _detect(sample, NAME_PATHS)
+        self.opta = _detect(sample, OPTA_PATHS, default="")
+        self.team_id = _detect(sample, TEAM_ID_PATHS, default=0)
+        self.goals_for = _detect(sample, GOALS_FOR_PATHS, default=0)
+        self.goals_against = _detect(sample, GOALS_AGAINST_PATHS, default=0)
+        self.points = _detect(sample, POINTS_PATHS)
+        if self.points is None:
+            if isinstance(sample.get("stats"), list):
+                self.points = _stats_list_points
+            else:
+                self.points = lambda e: 0
+
+    @staticmethod
+    def _slow(e):
+        """Per-entry probe used when an entry doesn't match the compiled layout."""
+        pos = _probe(e, POSITION_PATHS)
+        name = _probe(e, NAME_PATHS)
+        if pos is None or name is None:
+            return None
+        points = _probe(e, POINTS_PATHS)
+        if points is None and isinstance(e.get("stats"), list):
+            try:
+                points = _stats_list_points(e)
+            except KeyError:
+                points = None
+        try:
+            points = int(points or 0)
+        except (TypeError, ValueError):
+            # Early-season/empty table case: default to zero
+            points = 0
+        try:
+            pos = int(pos)
+        except (TypeError, ValueError):
+            return None
+        return (
+            pos,
+            str(name).strip(),
+            str(_probe(e, OPTA_PATHS, "") or ""),
+            int(_probe(e, TEAM_ID_PATHS, 0) or 0),
+            points,
+            int(_probe(e, GOALS_FOR_PATHS, 0) or 0),
+            int(_probe(e, GOALS_AGAINST_PATHS, 0) or 0),
+        )
+
+    def extract(self, entries) -> dict[str, np.ndarray]:
+        """Fill typed column arrays from ``entries`` in a single pass.
+
+        Entries without a usable position or team name are dropped, as
+        before. Returns arrays keyed ``position``, ``name``, ``opta``,
+        ``team_id``, ``points``, ``goals_for`` and ``goals_against``.
+        """
+        n = len(entries)
+        position = np.zeros(n, dtype=np.int16)
+        points = np.zeros(n, dtype=np.int16)
+        goals_for = np.zeros(n, dtype=np.int16)
+        goals_against = np.zeros(n, dtype=np.int16)
+        team_id = np.zeros(n, dtype=np.int32)
+        name = np.empty(n, dtype=object)
+        opta = np.empty(n, dtype=object)
+        keep = np.ones(n, dtype=bool)
+
+        get_pos, get_name, get_opta = self.position, self.name, self.opta
+        get_id, get_points = self.team_id, self.points
+        get_gf, get_ga = self.goals_for, self.goals_against
+
+        for i, e in enumerate(entries):
+            try:
+                if get_pos is None or get_name is None:
+                    raise KeyError("layout")
+                position[i] = int(get_pos(e))
+                name[i] = get_name(e).strip()
+                opta[i] = str(get_opta(e) or "")
+                team_id[i] = int(get_id(e) or 0)
+                points[i] = int(get_points(e) or 0)
+                goals_for[i] = int(get_gf(e) or 0)
+                goals_against[i] = int(get_ga(e) or 0)
+            except (KeyError, TypeError, ValueError, AttributeError, IndexError):
+                row = self._slow(e)
+                if row is None:
+                    keep[i] = False
+                    continue
+                (position[i], name[i], opta[i], team_id[i],
+                 points[i], goals_for[i], goals_against[i]) = row
+
+        columns = {
+            "position": position,
+            "name": name,
+            "opta": opta,
+            "team_id": team_id,
+            "points": points,
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+        }
+        if not keep.all():
+            columns = {k: v[keep] for k, v in columns.items()}
+        return columns
+
+
+def extract_standings(entries) -> dict[str, np.ndarray] | None:
+    """Compile an extractor from the first entry and run it over ``entries``."""
+    if not entries:
+        return None
+    return StandingsExtractor(entries[0]).extract(entries)
+
+
+def extract_team_names(items) -> list[str]:
+    """Names from any of the team-list layouts, compiled from the first item."""
+    if not items:
+        return []
+    get_name = _detect(items[0], TEAM_LIST_NAME_PATHS)
+    names = []
+    for it in items:
+        try:
+            n = get_name(it) if get_name else None
+        except (KeyError, TypeError):
+            n = None
+        if n is None:
+            n = _probe(it, TEAM_LIST_NAME_PATHS)
+        if n:
+            names.append(str(n).strip())
+    return names
@@ -0,0 +1,226 @@
+"""Vectorised scoring of every sweepstake group against one standings table.
+
+All picks across all groups are flattened once into integer arrays:
+each (group, player) pair gets a *slot*, each pick records its slot and
+an index into a shared team vocabulary. Scoring a standings table is then
+a gather of per-team points followed by a single ``np.bincount`` -- one
+pass over all picks no matter how many groups there are. Slots of a
+group are contiguous, so a group's scores are a slice.
+
+Alternative scoring rules (``scoring_rules``) are scored together: the
+rules x teams points matrix times the teams x slots pick counts gives
+every slot's total under every rule in one matrix product.
+"""
+
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from scoring_rules import DEFAULT_RULE, ScoringRule, position_points, rule_team_points
+
+
+class PickMatrix:
+    """Flattened picks of many groups (built once per picks-store version)."""
+
+    def __init__(self, groups: dict[str, dict], canonical=None):
+        canonical = canonical or (lambda name: name)
+        team_index: dict[str, int] = {}
+        slot_player: list[str] = []
+        pick_slot: list[int] = []
+        pick_team: list[int] = []
+        self.group_slots: dict[str, tuple[int, int]] = {}
+
+        for group_id, group in groups.items():
+            start = len(slot_player)
+            for player, teams in group["picks"].items():
+                slot = len(slot_player)
+                slot_player.append(player)
+                for team in teams:
+                    team = canonical(team)
+                    pick_slot.append(slot)
+                    pick_team.append(team_index.setdefault(team, len(team_index)))
+            self.group_slots[group_id] = (start, len(slot_player))
+
+        self.teams = list(team_index)
+        self.team_index = team_index
+        self.slot_player = np.array(slot_player, dtype=object)
+        self.pick_slot = np.array(pick_slot, dtype=np.int32)
+        self.pick_team = np.array(pick_team, dtype=np.int32)
+
+    @property
+    def n_slots(self) -> int:
+        return len(self.slot_player)
+
+    def team_points(self, standings_df: pd.DataFrame, column: str = "Points_Value") -> np.ndarray:
+        """Points per vocabulary team; teams missing from the table score 0."""
+        points = np.zeros(len(self.teams), dtype=np.int32)
+        for team, value in zip(standings_df["Team"], standings_df[column]):
+            i = self.team_index.get(team)
+            if i is not None:
+                points[i] = value
+        return points
+
+    def score(self, team_points: np.ndarray) -> np.ndarray:
+        """Total points per slot for a per-team points vector."""
+        if not len(self.pick_slot):
+            return np.zeros(self.n_slots, dtype=np.int64)
+        totals = np.bincount(self.pick_slot, weights=team_points[self.pick_team], minlength=self.n_slots)
+        return totals.astype(np.int64)
+
+    def score_standings(self, standings_df: pd.DataFrame) -> np.ndarray:
+        """Score every slot of every group against one standings table."""
+        return self.score(self.team_points(standings_df))
+
+    @cached_property
+    def team_counts(self) -> np.ndarray:
+        """Teams x slots matrix: how many times each slot picked each team."""
+        counts = np.zeros((len(self.teams), self.n_slots), dtype=np.float64)
+        np.add.at(counts, (self.pick_team, self.pick_slot), 1)
+        return counts
+
+    def score_rules(self, standings_df: pd.DataFrame, rules: dict[str, ScoringRule] | None = None) -> np.ndarray:
+        """Rules x slots totals: every slot scored under every rule at once.
+
+        Teams missing from the table score 0 under every rule.
+        """
+        table_points = rule_team_points(standings_df, rules)
+        points = np.zeros((len(table_points), len(self.teams)), dtype=np.float64)
+        vocab = np.array([self.team_index.get(team, -1) for team in standings_df["Team"]], dtype=np.int64)
+        found = vocab >= 0
+        points[:, vocab[found]] = table_points[:, found]
+        return points @ self.team_counts
+
+    def group_totals(self, group_id: str, scores: np.ndarray) -> pd.DataFrame:
+        """``Player``/``Points_Value`` totals for one group, best first."""
+        start, end = self.group_slots[group_id]
+        totals = pd.DataFrame(
+            {"Player": self.slot_player[start:end], "Points_Value": scores[start:end]}
+        )
+        return totals.sort_values("Points_Value", ascending=False, kind="stable")
+
+    def group_rule_totals(self, group_id: str, rule_scores: np.ndarray, rule_names) -> pd.DataFrame:
+        """``Player`` plus one total column per rule for one group.
+
+        Sorted by the default rule's totals when present, else the first.
+        """
+        start, end = self.group_slots[group_id]
+        rule_names = list(rule_names)
+        totals = pd.DataFrame({"Player": self.slot_player[start:end]})
+        for name, scores in zip(rule_names, rule_scores):
+            totals[name] = scores[start:end]
+        if rule_names:
+            by = DEFAULT_RULE if DEFAULT_RULE in rule_names else rule_names[0]
+            totals = totals.sort_values(by, ascending=False, kind="stable")
+        return totals
+
+
+def rule_leaders(totals: pd.DataFrame) -> dict[str, list[str]]:
+    """For each rule column of ``group_rule_totals``, the player(s) on top."""
+    return {
+        name: totals.loc[totals[name] == totals[name].max(), "Player"].tolist()
+        for name in totals.columns.drop("Player")
+    }
+
+
+def score_history(matrix: PickMatrix, group_id: str, snapshots: list[pd.DataFrame]) -> pd.DataFrame:
+    """``Date``/``Player``/``Points_Value`` for a group, one point per day.
+
+    ``snapshots`` are standings frames with ``attrs['taken_at']`` (as from
+    ``SnapshotStore.history``), oldest first; the last one of each day wins.
+    """
+    by_day: dict[str, pd.DataFrame] = {}
+    for snapshot in snapshots:
+        if "Points_Value" in snapshot and snapshot.attrs.get("taken_at"):
+            by_day[snapshot.attrs["taken_at"][:10]] = snapshot
+    start, end = matrix.group_slots[group_id]
+    frames = [
+        pd.DataFrame({
+            "Date": day,
+            "Player": matrix.slot_player[start:end],
+            "Points_Value": matrix.score_standings(snapshot)[start:end],
+        })
+        for day, snapshot in by_day.items()
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["Date", "Player", "Points_Value"])
+    return pd.concat(frames, ignore_index=True)
+
+
+SCORE_COLUMNS = ["Points_Value", "Points_League", "Position"]
+
+
+def merge_standings(picks_df: pd.DataFrame, standings_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Attach standings to each pick.
+
+    Returns ``(merged, missing)``: picks whose team isn't in the table get
+    0 for position and points, and are listed in ``missing``.
+    """
+    merged = pd.merge(picks_df, standings_df, on="Team", how="left")
+    missing = merged.loc[merged["Position"].isna(), ["Player", "Team"]]
+    if missing.empty and all(pd.api.types.is_integer_dtype(merged[col]) for col in SCORE_COLUMNS):
+        return merged, missing  # already whole, finite numbers
+    for col in SCORE_COLUMNS:
+        merged[col] = pd.to_numeric(merged[col], errors="coerce")
+    # Keep values finite so charts and int() casts are happy
+    merged[SCORE_COLUMNS] = merged[SCORE_COLUMNS].replace([np.inf, -np.inf], np.nan).fillna(0)
+    for col in SCORE_COLUMNS:
+        # Missing teams made the column float; go back to the table's ints
+        if pd.api.types.is_integer_dtype(standings_df[col]) and (merged[col] % 1 == 0).all():
+            merged[col] = merged[col].astype(standings_df[col].dtype)
+    return merged, missing
+
+
+def leaderboard(totals: pd.DataFrame) -> pd.DataFrame:
+    """``Rank``/``Player``/``Points_Value`` with ties sharing the better rank."""
+    board = totals[["Player", "Points_Value"]]  # copy-on-write: totals is untouched
+    board["Points_Value"] = (
+        pd.to_numeric(board["Points_Value"], errors="coerce").replace([np.inf, -np.inf], np.nan).fillna(0)
+    )
+    board["Rank"] = board["Points_Value"].rank(method="min", ascending=False).astype(int)
+    return board.sort_values("Rank", kind="stable")[["Rank", "Player", "Points_Value"]]
+
+
+def player_cards(merged_df: pd.DataFrame) -> list[dict]:
+    """Per-player card data (teams with position and points), by player name."""
+    cards = []
+    for player, rows in merged_df.groupby("Player", sort=True):
+        teams = []
+        for row in rows.itertuples(index=False):
+            crest = getattr(row, "Crest_URL", None)
+            teams.append(
+                {
+                    "team": row.Team,
+                    "position": int(row.Position) or None,  # 0 = not in the table
+                    "points": int(row.Points_Value),
+                    "league_points": int(row.Points_League),
+                    "crest": crest if isinstance(crest, str) else None,
+                }
+            )
+        cards.append({"player": player, "total": sum(t["points"] for t in teams), "teams": teams})
+    return cards
+
+
+def position_conflicts(modified_positions: dict[str, int]) -> dict[int, list[str]]:
+    """Positions that more than one team was moved to in a what-if."""
+    by_position: dict[int, list[str]] = {}
+    for team, pos in modified_positions.items():
+        by_position.setdefault(pos, []).append(team)
+    return {pos: teams for pos, teams in by_position.items() if len(teams) > 1}
+
+
+def what_if_totals(merged_df: pd.DataFrame, modified_positions: dict[str, int]) -> pd.DataFrame:
+    """Player totals if the given teams finished in the given positions.
+
+    Only the moved teams are re-scored (``scoring_rules.position_points``);
+    every other pick keeps its current points.
+    """
+    picks = merged_df[["Player", "Team", "Points_Value"]]
+    moved = picks["Team"].map(modified_positions)
+    points = np.where(moved.notna(), position_points(moved.fillna(0)), picks["Points_Value"]).astype(np.int64)
+    # Sum per player (in order of appearance) with one bincount
+    codes, players = pd.factorize(picks["Player"])
+    totals = pd.DataFrame(
+        {"Player": players, "Points_Value": np.bincount(codes, weights=points, minlength=len(players)).astype(np.int64)}
+    )
+    return totals.sort_values("Points_Value", ascending=False, kind="stable")
@@ -0,0 +1,87 @@
+"""Scoring rules: how a team's place in the table turns into sweepstake points.
+
+A rule is a weighted sum of per-team *features* taken from the standings
+(inverse position, league points, goal difference). Every rule is
+evaluated at once: the rules x features weight matrix times the features
+x teams matrix gives a rules x teams points matrix, and multiplying that
+by the picks' slots x teams count matrix (``scoring.PickMatrix``) gives
+every player's total under every rule in one pass.
+
+The sweepstake itself scores with ``DEFAULT_RULE`` (1st = 20 points, 20th
+= 1 point); ``position_points`` is that rule for a bare position. To add
+a rule, add a ``ScoringRule`` to ``SCORING_RULES``.
+"""
+
+import numpy as np
+import pandas as pd
+
+LEAGUE_SIZE = 20
+FEATURES = ("inverse_position", "league_points", "goal_difference")
+
+
+def position_points(position):
+    """Sweepstake points for a league position (scalar, array or Series)."""
+    return LEAGUE_SIZE + 1 - position
+
+
+class ScoringRule:
+    """A named, weighted sum of standings features."""
+
+    def __init__(self, name: str, label: str, weights: dict[str, float], description: str = ""):
+        unknown = set(weights) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"unknown scoring features: {sorted(unknown)}")
+        self.name = name
+        self.label = label
+        self.weights = weights
+        self.description = description
+
+    def __repr__(self) -> str:
+        return f"ScoringRule({self.name!r}, {self.weights!r})"
+
+
+DEFAULT_RULE = "position"
+SCORING_RULES = {
+    rule.name: rule
+    for rule in (
+        ScoringRule("position", "Inverse position", {"inverse_position": 1},
+                    "1st = 20 points down to 20th = 1 point (the sweepstake's rule)"),
+        ScoringRule("league_points", "League points", {"league_points": 1},
+                    "The team's actual Premier League points"),
+        ScoringRule("goal_difference", "Goal difference", {"goal_difference": 1},
+                    "Goals scored minus goals conceded"),
+        ScoringRule("hybrid", "Hybrid", {"inverse_position": 1, "league_points": 0.5, "goal_difference": 0.25},
+                    "Inverse position + half the league points + a quarter of the goal difference"),
+    )
+}
+
+
+def rule_weights(rules: dict[str, ScoringRule] | None = None) -> np.ndarray:
+    """The rules x features weight matrix (rows in ``rules`` order)."""
+    rules = SCORING_RULES if rules is None else rules
+    return np.array([[rule.weights.get(f, 0) for f in FEATURES] for rule in rules.values()], dtype=np.float64)
+
+
+def standings_features(standings_df: pd.DataFrame) -> np.ndarray:
+    """The features x teams matrix for a standings table (rows in table order).
+
+    Columns a table doesn't have (the static fallback has no goals) count
+    as 0, and so does a position of 0 (the pre-season table), as in
+    ``Points_Value``.
+    """
+    def column(name):
+        if name not in standings_df:
+            return np.zeros(len(standings_df))
+        return pd.to_numeric(standings_df[name], errors="coerce").fillna(0).to_numpy(np.float64)
+
+    position = column("Position")
+    return np.vstack([
+        np.where(position > 0, position_points(position), 0),
+        column("Points_League"),
+        column("Goals_For") - column("Goals_Against"),
+    ])
+
+
+def rule_team_points(standings_df: pd.DataFrame, rules: dict[str, ScoringRule] | None = None) -> np.ndarray:
+    """The rules x teams points matrix for a standings table."""
+    return rule_weights(rules) @ standings_features(standings_df)
@@ -0,0 +1,335 @@
+"""Columnar, memory-mapped archive of past seasons (standings snapshots and picks).
+
+One file holds every archived season. A JSON header describes the
+seasons and where each column lives; the columns follow as raw,
+64-byte-aligned little-endian arrays::
+
+    SWPARCH1 | header length (uint64) | header JSON | column | column | ...
+
+Rows are grouped by season and then by snapshot, so a season -- or one
+snapshot of it -- is a contiguous slice of every column. The file is
+opened with ``np.memmap`` and columns are views into the mapping: reading
+a season copies nothing and touches only the pages it needs, and
+switching seasons in the app is slicing, not a network call or a pandas
+load. Only the 20-row table being shown becomes a DataFrame.
+
+Build or refresh it from the snapshot store and picks config::
+
+    python season_archive.py build     # add/refresh every season with snapshots
+    python season_archive.py list
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from picks_store import PICKS_PATH, PicksStore
+from pulse_live import SEASON_LABEL, crest_url
+from snapshot_store import DATA_DIR, SNAPSHOT_DIR, SnapshotStore
+from team_registry import get_registry
+
+ARCHIVE_PATH = os.path.join(DATA_DIR, "season_archive.bin")
+MAGIC = b"SWPARCH1"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+# Per standings row (one team in one snapshot)
+ROW_COLUMNS = {
+    "team": "<i2",
+    "position": "<i1",
+    "points_league": "<i2",
+    "goals_for": "<i2",
+    "goals_against": "<i2",
+    "points_value": "<i1",
+}
+# Per snapshot; row_start has one extra entry (the end of the last snapshot)
+SNAPSHOT_COLUMNS = {"taken_at": "<i8", "row_start": "<i8"}
+# Per pick
+PICK_COLUMNS = {"pick_group": "<i4", "pick_player": "<i4", "pick_team": "<i2"}
+FRAME_COLUMNS = {
+    "position": "Position",
+    "points_league": "Points_League",
+    "goals_for": "Goals_For",
+    "goals_against": "Goals_Against",
+    "points_value": "Points_Value",
+}
+
+
+class ArchiveFormatError(ValueError):
+    """The file isn't a season archive this version can read."""
+
+
+def _epoch(taken_at: str | None) -> int:
+    if not taken_at:
+        return 0
+    dt = datetime.fromisoformat(taken_at)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(int(epoch), tz=timezone.utc).isoformat()
+
+
+def archive_stamp(path: str = ARCHIVE_PATH) -> tuple[int, int] | None:
+    """``(size, mtime_ns)`` of the archive file, or None if there isn't one."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class SeasonView:
+    """One archived season: zero-copy views into the archive's columns."""
+
+    def __init__(self, archive: "SeasonArchive", label: str, meta: dict):
+        self.archive = archive
+        self.label = label
+        self.meta = meta
+        s0, s1 = meta["snapshots"]
+        self.taken_at = archive.column("taken_at")[s0:s1]
+        self._row_start = archive.column("row_start")[s0:s1 + 1]
+
+    def __len__(self) -> int:
+        return len(self.taken_at)
+
+    def _index(self, snapshot: int) -> int:
+        if not len(self):
+            raise ValueError(f"season {self.label!r} has no archived snapshots")
+        return range(len(self))[snapshot]
+
+    def dates(self) -> list[str]:
+        """ISO date (UTC) of each snapshot, oldest first."""
+        return [_iso(t)[:10] for t in self.taken_at]
+
+    def columns(self, snapshot: int = -1) -> dict[str, np.ndarray]:
+        """The row columns of one snapshot (views; nothing is copied).
+
+        Raises ValueError for a season with no snapshots.
+        """
+        i = self._index(snapshot)
+        start, end = int(self._row_start[i]), int(self._row_start[i + 1])
+        return {name: self.archive.column(name)[start:end] for name in ROW_COLUMNS}
+
+    def standings(self, snapshot: int = -1) -> pd.DataFrame:
+        """One snapshot as a standings frame (``attrs['source'] == 'archive'``)."""
+        cols = self.columns(snapshot)
+        teams = [self.archive.teams[code] for code in cols["team"]]
+        registry = get_registry()
+        df = pd.DataFrame({"Team": teams, **{FRAME_COLUMNS[c]: cols[c] for c in FRAME_COLUMNS}})
+        df["Crest_URL"] = [registry.crest(team) or crest_url(registry.opta_id(team)) for team in teams]
+        df = df.sort_values("Position", kind="stable").reset_index(drop=True)
+        df.attrs["source"] = "archive"
+        df.attrs["taken_at"] = _iso(self.taken_at[self._index(snapshot)])
+        return df
+
+    def daily_standings(self) -> list[pd.DataFrame]:
+        """The last snapshot of each day, oldest first (for history charts)."""
+        last_of_day = {day: i for i, day in enumerate(self.dates())}
+        return [self.standings(i) for i in last_of_day.values()]
+
+    def picks_store(self) -> PicksStore:
+        """The season's groups and picks as an in-memory (unsaved) store."""
+        p0, p1 = self.meta["picks"]
+        group_ids = list(self.meta["groups"])
+        groups = {gid: {**self.meta["groups"][gid], "picks": {}} for gid in group_ids}
+        for g, p, t in zip(self.archive.column("pick_group")[p0:p1], self.archive.column("pick_player")[p0:p1],
+                           self.archive.column("pick_team")[p0:p1]):
+            player = self.archive.players[p]
+            groups[group_ids[g]]["picks"].setdefault(player, []).append(self.archive.teams[t])
+        return PicksStore(groups, self.meta.get("default_group"))
+
+
+class SeasonArchive:
+    """A season archive file, memory-mapped read-only."""
+
+    def __init__(self, path: str = ARCHIVE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            head = f.read(len(MAGIC) + 8)
+            if len(head) < len(MAGIC) + 8 or head[:len(MAGIC)] != MAGIC:
+                raise ArchiveFormatError(f"{path} is not a season archive")
+            (header_len,) = struct.unpack("<Q", head[len(MAGIC):])
+            header = json.loads(f.read(header_len))
+        if header.get("version") != FORMAT_VERSION:
+            raise ArchiveFormatError(f"unsupported archive version {header.get('version')}")
+        self.header = header
+        self.teams: list[str] = header["teams"]
+        self.players: list[str] = header["players"]
+        self.stamp = archive_stamp(path)
+        self._map = np.memmap(path, dtype=np.uint8, mode="r")
+        self._columns: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, path: str = ARCHIVE_PATH) -> "SeasonArchive | None":
+        """The archive at ``path``, or None if there isn't a readable one."""
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    def column(self, name: str) -> np.ndarray:
+        """A whole column as a view into the mapping."""
+        col = self._columns.get(name)
+        if col is None:
+            spec = self.header["columns"][name]
+            dtype = np.dtype(spec["dtype"])
+            raw = self._map[spec["offset"]:spec["offset"] + spec["length"] * dtype.itemsize]
+            col = self._columns[name] = raw.view(dtype)
+        return col
+
+    def seasons(self) -> list[str]:
+        """Archived season labels, newest first."""
+        return sorted(self.header["seasons"], reverse=True)
+
+    def __contains__(self, label) -> bool:
+        return label in self.header["seasons"]
+
+    def season(self, label: str) -> SeasonView:
+        try:
+            return SeasonView(self, label, self.header["seasons"][label])
+        except KeyError:
+            raise KeyError(f"season {label!r} is not archived") from None
+
+
+def write_archive(path: str, seasons: dict[str, dict]):
+    """Write ``seasons`` to ``path`` atomically.
+
+    ``seasons`` maps a label to ``{"snapshots": [standings frames with
+    attrs['taken_at'], oldest first], "groups": {id: group},
+    "default_group": id}``.
+    """
+    canonical = get_registry().canonical
+    teams: dict[str, int] = {}
+    players: dict[str, int] = {}
+    dtypes = {**ROW_COLUMNS, **SNAPSHOT_COLUMNS, **PICK_COLUMNS}
+    cols: dict[str, list] = {name: [] for name in dtypes}
+    meta = {}
+
+    for label in sorted(seasons):
+        season = seasons[label]
+        s0, p0 = len(cols["taken_at"]), len(cols["pick_group"])
+        for df in season["snapshots"]:
+            if "Points_Value" not in df:
+                continue
+            df = df.sort_values("Position")
+            cols["taken_at"].append(_epoch(df.attrs.get("taken_at")))
+            cols["row_start"].append(len(cols["team"]))
+            cols["team"] += [teams.setdefault(canonical(t), len(teams)) for t in df["Team"]]
+            for col, name in FRAME_COLUMNS.items():
+                values = df[name] if name in df else pd.Series(0, index=df.index)
+                cols[col] += pd.to_numeric(values, errors="coerce").fillna(0).astype(int).tolist()
+        groups = season.get("groups", {})
+        for g, (gid, group) in enumerate(groups.items()):
+            for player, picked in group["picks"].items():
+                for team in picked:
+                    cols["pick_group"].append(g)
+                    cols["pick_player"].append(players.setdefault(player, len(players)))
+                    cols["pick_team"].append(teams.setdefault(canonical(team), len(teams)))
+        meta[label] = {
+            "snapshots": [s0, len(cols["taken_at"])],
+            "picks": [p0, len(cols["pick_group"])],
+            "groups": {gid: {k: v for k, v in group.items() if k != "picks"} for gid, group in groups.items()},
+            "default_group": season.get("default_group"),
+        }
+    cols["row_start"].append(len(cols["team"]))
+
+    # Lay the columns out after the header, each aligned
+    arrays = {name: np.asarray(cols[name], dtype=dtype) for name, dtype in dtypes.items()}
+    header = {"version": FORMAT_VERSION, "teams": list(teams), "players": list(players),
+              "seasons": meta, "columns": {}}
+
+    def layout(start: int) -> int:
+        offset = start
+        for name, array in arrays.items():
+            offset = -(-offset // ALIGN) * ALIGN
+            header["columns"][name] = {"dtype": array.dtype.str, "offset": offset, "length": len(array)}
+            offset += array.nbytes
+        return offset
+
+    # The header's size depends on the offsets it records; iterate until stable
+    start = 0
+    while True:
+        layout(start)
+        header_bytes = json.dumps(header, separators=(",", ":")).encode()
+        needed = -(-(len(MAGIC) + 8 + len(header_bytes)) // ALIGN) * ALIGN
+        if needed == start:
+            break
+        start = needed
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(MAGIC + struct.pack("<Q", len(header_bytes)) + header_bytes)
+        for name, array in arrays.items():
+            f.write(b"\0" * (header["columns"][name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp, path)
+
+
+def collect_seasons(snapshots: SnapshotStore, store: PicksStore, archive: SeasonArchive | None = None,
+                    current_season: str = SEASON_LABEL) -> dict[str, dict]:
+    """Seasons from the snapshot store, plus any already archived.
+
+    A season's picks are the groups whose ``season`` matches (groups
+    without one belong to ``current_season``). Seasons only in the old
+    archive are carried over unchanged.
+    """
+    seasons = {}
+    if archive is not None:
+        for label in archive.seasons():
+            view = archive.season(label)
+            picks = view.picks_store()
+            seasons[label] = {
+                "snapshots": [view.standings(i) for i in range(len(view))],
+                "groups": picks.groups,
+                "default_group": picks.default_group,
+            }
+    for label in snapshots.seasons():
+        groups = {gid: g for gid, g in store.groups.items() if (g.get("season") or current_season) == label}
+        previous = seasons.get(label, {})
+        seasons[label] = {
+            "snapshots": snapshots.history(label),
+            "groups": groups or previous.get("groups", {}),
+            "default_group": (store.default_group if store.default_group in groups else next(iter(groups), None))
+            if groups else previous.get("default_group"),
+        }
+    return seasons
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or inspect the columnar season archive.")
+    parser.add_argument("command", choices=["build", "list"])
+    parser.add_argument("--archive", default=ARCHIVE_PATH)
+    parser.add_argument("--snapshots", default=SNAPSHOT_DIR, help="snapshot store directory")
+    parser.add_argument("--picks", default=PICKS_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        seasons = collect_seasons(SnapshotStore(args.snapshots), PicksStore.load(args.picks),
+                                  SeasonArchive.open(args.archive))
+        write_archive(args.archive, seasons)
+        print(f"Archived {len(seasons)} season(s) to {args.archive}", file=sys.stderr)
+
+    archive = SeasonArchive.open(args.archive)
+    if archive is None:
+        print(f"No season archive at {args.archive}", file=sys.stderr)
+        return 1
+    for label in archive.seasons():
+        view = archive.season(label)
+        span = f"{view.dates()[0]} to {view.dates()[-1]}" if len(view) else "no snapshots"
+        print(f"{label}: {len(view)} snapshot(s), {span}, {len(view.meta['groups'])} group(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
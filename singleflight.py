@@ -0,0 +1,80 @@
+"""Process-wide single-flight coalescing of duplicate upstream calls.
+
+When the standings cache expires with many sessions open, every rerun
+would otherwise start its own fetch chain at the same moment. A
+``SingleFlight`` lets the first caller for a key (the *leader*) do the
+work while concurrent callers for the same key wait on its future and
+receive the same result -- or the same exception. Once the call
+finishes the key is forgotten, so the next caller starts a fresh call;
+caching stays the job of the layers above.
+
+Results are shared between callers, so treat them as read-only.
+"""
+
+import functools
+import inspect
+import threading
+from concurrent.futures import Future
+
+from metrics import COALESCED_CALLS
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key. Thread-safe."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key, fn, *args, **kwargs):
+        """Return ``fn(*args, **kwargs)``, sharing one call among concurrent callers."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            COALESCED_CALLS.inc(call=self.name, result="shared")
+            return future.result()
+
+        COALESCED_CALLS.inc(call=self.name, result="leader")
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+def coalesce(name: str):
+    """Decorator: coalesce concurrent calls with equal (hashable) arguments.
+
+    The wrapped function's ``SingleFlight`` is available as ``.flight``.
+    """
+    flight = SingleFlight(name)
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Bind with defaults so f() and f(default_value) share a key
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return flight.do(tuple(bound.arguments.items()), fn, *args, **kwargs)
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
@@ -0,0 +1,125 @@
+"""Append-only store of live standings snapshots, one JSON Lines file per season.
+
+A snapshot is only written when the table content actually changes, so
+the files grow by one line per real update rather than per refresh. The
+latest snapshot is what the app serves while Pulse Live is unavailable.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+import pandas as pd
+
+DATA_DIR = os.environ.get(
+    "SWEEPSTAKE_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+)
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshots")
+
+# Columns that define the table's content (crests etc. are derived)
+CONTENT_COLUMNS = ["Position", "Team", "Points_League", "Goals_For", "Goals_Against"]
+
+
+def season_slug(season_label: str) -> str:
+    """'2025/26' -> '2025-26' (safe as a file name)."""
+    return str(season_label).replace("/", "-").strip()
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """Stable hash of the table content, independent of row order."""
+    cols = [c for c in CONTENT_COLUMNS if c in df.columns]
+    rows = df[cols].sort_values("Position").astype(str).values.tolist()
+    return hashlib.sha256(json.dumps([cols, rows]).encode()).hexdigest()[:16]
+
+
+class SnapshotStore:
+    def __init__(self, root: str = SNAPSHOT_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._last_hash: dict[str, str] = {}
+
+    def path(self, season_label: str) -> str:
+        return os.path.join(self.root, f"{season_slug(season_label)}.jsonl")
+
+    def _read_lines(self, season_label: str) -> list[str]:
+        try:
+            with open(self.path(season_label), encoding="utf-8") as f:
+                return [line for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def append(self, season_label: str, df: pd.DataFrame, taken_at: datetime | None = None) -> bool:
+        """Store ``df`` if its content differs from the latest snapshot.
+
+        Returns True if a new snapshot was written.
+        """
+        digest = content_hash(df)
+        with self._lock:
+            last = self._last_hash.get(season_label)
+            if last is None:
+                lines = self._read_lines(season_label)
+                last = json.loads(lines[-1])["hash"] if lines else ""
+            if digest == last:
+                self._last_hash[season_label] = digest
+                return False
+
+            taken_at = taken_at or datetime.now(timezone.utc)
+            record = {
+                "taken_at": taken_at.isoformat(),
+                "hash": digest,
+                "rows": json.loads(df.to_json(orient="records")),
+            }
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.path(season_label), "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            self._last_hash[season_label] = digest
+            return True
+
+    @staticmethod
+    def _to_frame(record: dict) -> pd.DataFrame:
+        df = pd.DataFrame(record["rows"])
+        df.attrs["taken_at"] = record["taken_at"]
+        return df
+
+    def latest(self, season_label: str) -> pd.DataFrame | None:
+        """The most recent snapshot (``attrs['taken_at']`` set), or None."""
+        lines = self._read_lines(season_label)
+        return self._to_frame(json.loads(lines[-1])) if lines else None
+
+    def seasons(self) -> list[str]:
+        """Labels of the seasons with snapshots ('2025-26.jsonl' -> '2025/26')."""
+        try:
+            names = sorted(os.listdir(self.root))
+        except FileNotFoundError:
+            return []
+        return [name[:-len(".jsonl")].replace("-", "/", 1) for name in names if name.endswith(".jsonl")]
+
+    def version(self, season_label: str) -> tuple[int, int]:
+        """Changes whenever the season's file does; cheap enough for cache keys."""
+        try:
+            st = os.stat(self.path(season_label))
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_size, st.st_mtime_ns)
+
+    def history(self, season_label: str) -> list[pd.DataFrame]:
+        """Every snapshot of a season, oldest first."""
+        return [self._to_frame(json.loads(line)) for line in self._read_lines(season_label)]
+
+    def read_since(self, season_label: str, offset: int = 0) -> tuple[list[pd.DataFrame], int]:
+        """Snapshots appended after byte ``offset``, and the offset to pass next time.
+
+        Only complete lines are read, so a snapshot being written is picked
+        up on the next call.
+        """
+        try:
+            with open(self.path(season_label), "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], offset
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode("utf-8").splitlines()
+        return [self._to_frame(json.loads(line)) for line in lines if line.strip()], offset + end
@@ -0,0 +1,243 @@
+"""Static HTML/JSON export of the leaderboard for office screens.
+
+Writes ``index.html`` and ``data.json`` for one group into an output
+directory that any web server or CDN can serve. An export is only
+regenerated when its inputs change (standings content hash, the group's
+picks, headshot files); otherwise the run is a no-op. Every file is
+written atomically, and headshots and crests are stored under
+content-hashed names (``assets/Vosey.3f2a9c01de.png``), so they can be
+cached forever and a page never references a half-written asset.
+
+    python static_export.py -o site/            # cron: cheap when nothing changed
+    python static_export.py -o site/ --offline  # from the last snapshot
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from headshots import HEADSHOT_DIR, headshot_path
+from picks_store import PICKS_PATH, PicksStore
+from pulse_live import SEASON_LABEL, fetch
+from scoring import PickMatrix
+from snapshot_store import content_hash
+from sweepstake_cli import load_standings, score_group, write_atomic
+from team_registry import get_registry
+
+MANIFEST = "manifest.json"
+EXPORT_VERSION = 1  # bump when the page layout changes to force a rebuild
+PAGE_REFRESH = 300  # seconds between reloads on an office screen
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    """'Vosey.png' + bytes -> 'Vosey.<hash>.png'."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{_digest(data)}{ext.lower()}"
+
+
+def _write_asset(out_dir: str, name: str, data: bytes) -> str:
+    """Store an asset under its content-hashed name; returns the relative URL."""
+    rel = f"assets/{hashed_name(name, data)}"
+    path = os.path.join(out_dir, rel)
+    if not os.path.exists(path):  # same name == same bytes
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; the site is served as-is
+        os.replace(tmp, path)
+    return rel
+
+
+def _download_crest(url: str) -> bytes | None:
+    try:
+        r = fetch(url, "crest")
+        r.raise_for_status()
+        return r.content
+    except Exception:
+        return None
+
+
+def input_fingerprint(standings_df: pd.DataFrame, group: dict, headshots: dict[str, str | None]) -> str:
+    """Hash of everything the export depends on."""
+    stats = {
+        player: [os.path.getsize(path), os.path.getmtime(path)] if path else None
+        for player, path in sorted(headshots.items())
+    }
+    payload = json.dumps(
+        [EXPORT_VERSION, content_hash(standings_df), group, stats], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def read_manifest(out_dir: str) -> dict:
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _render_page(title: str, season: str, generated_at: str, data: dict) -> str:
+    esc = html.escape
+    board_rows = "\n".join(
+        f"<tr><td>{r['Rank']}</td><td>"
+        + (f'<img class="face" src="{esc(data["headshots"][r["Player"]])}" alt="">' if data["headshots"].get(r["Player"]) else "")
+        + f"{esc(r['Player'])}</td><td>{r['Points_Value']}</td></tr>"
+        for r in data["leaderboard"]
+    )
+    cards = []
+    for card in data["cards"]:
+        teams = "".join(
+            "<li>"
+            + (f'<img class="crest" src="{esc(t["crest"])}" alt="">' if t.get("crest") else "")
+            + f"{esc(t['team'])} &middot; {t['position'] or 'N/A'} &middot; {t['points']} pts</li>"
+            for t in card["teams"]
+        )
+        face = data["headshots"].get(card["player"])
+        img = f'<img class="face" src="{esc(face)}" alt="">' if face else ""
+        cards.append(
+            f'<div class="card">{img}<h3>{esc(card["player"])}</h3><ul>{teams}</ul>'
+            f"<p><b>Total: {card['total']} points</b></p></div>"
+        )
+    table_rows = "\n".join(
+        f"<tr><td>{r['Position']}</td><td>"
+        + (f'<img class="crest" src="{esc(r["Crest_URL"])}" alt="">' if r.get("Crest_URL") else "")
+        + f"{esc(r['Team'])}</td><td>{r['Points_League']}</td><td>{r['Points_Value']}</td></tr>"
+        for r in data["standings"]
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8">
+<meta http-equiv="refresh" content="{PAGE_REFRESH}">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{esc(title)} {esc(season)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }} td, th {{ padding: 4px 10px; border-bottom: 1px solid #ddd; }}
+.cards {{ display: flex; flex-wrap: wrap; gap: 1em; }}
+.card {{ border: 1px solid #ddd; border-radius: 6px; padding: 1em; min-width: 200px; }}
+.face {{ width: 40px; height: 40px; border-radius: 50%; object-fit: cover; vertical-align: middle; margin-right: 6px; }}
+.crest {{ width: 20px; vertical-align: middle; margin-right: 4px; }}
+</style></head>
+<body>
+<h1>&#9917; {esc(title)}</h1>
+<p>Premier League {esc(season)} season &middot; updated {esc(generated_at)}</p>
+<h2>Leaderboard</h2>
+<table><tr><th>Rank</th><th>Player</th><th>Points</th></tr>
+{board_rows}
+</table>
+<h2>Player Team Selections</h2>
+<div class="cards">{''.join(cards)}</div>
+<h2>Premier League Standings</h2>
+<table><tr><th>Pos</th><th>Team</th><th>League Points</th><th>Sweepstake Points</th></tr>
+{table_rows}
+</table>
+</body></html>
+"""
+
+
+def export_site(out_dir: str, standings_df: pd.DataFrame, store: PicksStore, group_id: str | None = None,
+                season: str = SEASON_LABEL, force: bool = False, headshot_dir: str = HEADSHOT_DIR,
+                download=_download_crest) -> bool:
+    """Write the export for ``group_id`` if its inputs changed; True if written."""
+    group_id = group_id or store.default_group
+    group = store.group(group_id)
+    headshots = {player: headshot_path(player, headshot_dir) for player in group["picks"]}
+    fingerprint = input_fingerprint(standings_df, group, headshots)
+    manifest = read_manifest(out_dir)
+    if not force and manifest.get("fingerprint") == fingerprint:
+        return False
+
+    matrix = PickMatrix({group_id: group}, canonical=get_registry().canonical)
+    results = score_group(store, matrix, matrix.score_standings(standings_df), group_id, standings_df, {})
+
+    # Content-hashed assets; crest downloads are remembered across runs
+    crests = dict(manifest.get("crests", {}))
+    for url in standings_df.get("Crest_URL", pd.Series(dtype=object)).dropna().unique():
+        if url not in crests:
+            data = download(url)
+            if data is not None:
+                crests[url] = _write_asset(out_dir, os.path.basename(url.split("?")[0]), data)
+    face_urls = {}
+    for player, path in headshots.items():
+        if path:
+            with open(path, "rb") as f:
+                face_urls[player] = _write_asset(out_dir, os.path.basename(path), f.read())
+
+    cols = [c for c in ["Position", "Team", "Points_League", "Points_Value", "Crest_URL"] if c in standings_df]
+    standings = json.loads(standings_df[cols].sort_values("Position").to_json(orient="records"))
+    for row in standings:
+        if row.get("Crest_URL"):
+            row["Crest_URL"] = crests.get(row["Crest_URL"], row["Crest_URL"])
+    cards = results["cards"]
+    for card in cards:
+        for team in card["teams"]:
+            if team.get("crest"):
+                team["crest"] = crests.get(team["crest"], team["crest"])
+
+    generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    data = {
+        "group": group_id,
+        "name": group["name"],
+        "season": season,
+        "source": standings_df.attrs.get("source"),
+        "generated_at": generated_at,
+        "leaderboard": json.loads(results["leaderboard"].to_json(orient="records")),
+        "cards": cards,
+        "standings": standings,
+        "headshots": face_urls,
+    }
+    write_atomic(os.path.join(out_dir, "data.json"), json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    write_atomic(os.path.join(out_dir, "index.html"), _render_page(group["name"], season, generated_at, data))
+    # Manifest last: a crash mid-export means the next run retries
+    write_atomic(
+        os.path.join(out_dir, MANIFEST),
+        json.dumps({"fingerprint": fingerprint, "generated_at": generated_at, "crests": crests}, indent=2) + "\n",
+    )
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the leaderboard as a static site.")
+    parser.add_argument("-o", "--output-dir", required=True)
+    parser.add_argument("--season", default=SEASON_LABEL)
+    parser.add_argument("--picks", default=PICKS_PATH)
+    parser.add_argument("--group", help="group id (default: the store's default group)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--standings", help="read standings from a CSV/JSON file instead of fetching")
+    source.add_argument("--offline", action="store_true", help="use the last saved snapshot, no network")
+    parser.add_argument("--pulse-url", help="Pulse Live base URL (e.g. a local pulse_standin.py)")
+    args = parser.parse_args(argv)
+
+    store = PicksStore.load(args.picks)
+    if args.group and args.group not in store:
+        parser.error(f"unknown group {args.group!r}")
+    try:
+        standings_df, messages = load_standings(args)
+    except ValueError as e:
+        parser.error(str(e))
+    for level, message in messages:
+        print(f"{level}: {message}", file=sys.stderr)
+    if standings_df is None or standings_df.empty:
+        print("Could not load league standings.", file=sys.stderr)
+        return 1
+
+    written = export_site(args.output_dir, standings_df, store, args.group, args.season, force=args.force)
+    print(f"{'Exported' if written else 'Unchanged'}: {args.output_dir}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""Read-only JSON API for the standings and leaderboards.
+
+Serves ``/standings``, ``/leaderboard`` and ``/players/{name}`` (plus
+``?group=<id>``) from state that is computed once per standings change,
+not per request. Response bodies are serialized once, gzipped once and
+tagged with an ETag; requests are then a dict lookup, an ``If-None-Match``
+comparison and a write. Nothing here touches Streamlit.
+
+Run it with::
+
+    python sweepstake_api.py --port 8765
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pandas as pd
+
+from picks_store import PICKS_PATH, PicksStore, get_picks_store
+from pulse_live import SEASON_LABEL, get_fixtures, resolve_comp_season
+from refresh_scheduler import IDLE_INTERVAL, LIVE_INTERVAL, RefreshScheduler
+from scoring import PickMatrix
+from snapshot_store import content_hash
+from sweepstake_cli import load_standings, score_group
+from team_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+STANDINGS_COLUMNS = [
+    "Position", "Team", "Points_League", "Goals_For", "Goals_Against", "Points_Value", "Crest_URL",
+]
+
+
+class Response(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+
+def make_response(payload) -> Response:
+    """Serialize, compress and tag a payload once."""
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    etag = '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+    return Response(body, gzip.compress(body, compresslevel=6, mtime=0), etag)
+
+
+class _Generation:
+    """Everything derived from one standings table, plus memoised responses."""
+
+    def __init__(self, store: PicksStore, season: str, standings_df: pd.DataFrame):
+        self.store = store
+        self.season = season
+        self.standings_df = standings_df
+        self.source = standings_df.attrs.get("source")
+        self.updated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.matrix = PickMatrix(store.groups, canonical=get_registry().canonical)
+        self.scores = self.matrix.score_standings(standings_df)
+        self.responses: dict[tuple, Response | None] = {}
+        self._groups: dict[str, dict] = {}
+
+    def _meta(self) -> dict:
+        return {"season": self.season, "source": self.source, "updated_at": self.updated_at}
+
+    def group_results(self, group_id: str) -> dict:
+        results = self._groups.get(group_id)
+        if results is None:
+            results = self._groups[group_id] = score_group(
+                self.store, self.matrix, self.scores, group_id, self.standings_df, {}
+            )
+        return results
+
+    def build(self, route: str, group_id: str, player: str | None) -> Response | None:
+        if route == "standings":
+            cols = [c for c in STANDINGS_COLUMNS if c in self.standings_df.columns]
+            rows = json.loads(self.standings_df[cols].sort_values("Position").to_json(orient="records"))
+            return make_response({**self._meta(), "standings": rows})
+        results = self.group_results(group_id)
+        group = {"group": group_id, "name": self.store.group(group_id)["name"]}
+        if route == "leaderboard":
+            rows = json.loads(results["leaderboard"].to_json(orient="records"))
+            return make_response({**self._meta(), **group, "leaderboard": rows})
+        for card in results["cards"]:
+            if card["player"].casefold() == player.casefold():
+                return make_response({**self._meta(), **group, **card})
+        return None
+
+
+class ApiState:
+    """Current API state; swapped wholesale when the standings change."""
+
+    def __init__(self, store: PicksStore, season: str = SEASON_LABEL):
+        self.store = store
+        self.season = season
+        self.standings_hash: str | None = None
+        self._gen: _Generation | None = None
+        self._lock = threading.Lock()
+
+    def update(self, standings_df: pd.DataFrame) -> bool:
+        """Rebuild from ``standings_df`` if its content changed; True if it did."""
+        if standings_df is None or standings_df.empty:
+            return False
+        digest = content_hash(standings_df)
+        with self._lock:
+            if digest == self.standings_hash and self._gen and self._gen.source == standings_df.attrs.get("source"):
+                return False
+            gen = _Generation(self.store, self.season, standings_df)
+            # Warm the hot paths so the first requests don't pay for them
+            gen.responses[("standings", None, None)] = gen.build("standings", None, None)
+            default = self.store.default_group
+            if default:
+                gen.responses[("leaderboard", default, None)] = gen.build("leaderboard", default, None)
+            self._gen, self.standings_hash = gen, digest
+            return True
+
+    @property
+    def ready(self) -> bool:
+        return self._gen is not None
+
+    def get(self, route: str, group_id: str | None = None, player: str | None = None) -> Response | None:
+        """The response for a route, or None for an unknown group/player."""
+        gen = self._gen  # one read: a concurrent update can't mix generations
+        if gen is None:
+            return None
+        if route != "standings":
+            group_id = group_id or self.store.default_group
+            if group_id not in self.store:
+                return None
+        key = (route, group_id if route != "standings" else None, player.casefold() if player else None)
+        try:
+            return gen.responses[key]
+        except KeyError:
+            response = gen.build(route, group_id, player)
+            # Misses aren't cached: any name can be requested from outside
+            if response is not None:
+                gen.responses[key] = response
+            return response
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive for dashboards polling in a loop
+    server_version = "SweepstakeAPI/1"
+    # Headers and body go out in one buffered write (flushed per request)
+    # with TCP_NODELAY, avoiding Nagle/delayed-ACK stalls on keep-alive
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    state: ApiState = None
+    max_age = 60
+
+    def _send(self, status: int, response: Response | None = None, head: bool = False):
+        self.send_response(status)
+        if response is None:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_header("ETag", response.etag)
+        self.send_header("Cache-Control", f"public, max-age={self.max_age}")
+        self.send_header("Vary", "Accept-Encoding")
+        if status == 304:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = response.body
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = response.gzipped
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _route(self, head: bool = False):
+        url = urlsplit(self.path)
+        parts = [unquote(p) for p in url.path.split("/") if p]
+        group_id = parse_qs(url.query).get("group", [None])[0]
+        if parts == ["standings"]:
+            route, player = "standings", None
+        elif parts == ["leaderboard"]:
+            route, player = "leaderboard", None
+        elif len(parts) == 2 and parts[0] == "players":
+            route, player = "players", parts[1]
+        else:
+            self._send(404)
+            return
+        if not self.state.ready:
+            self._send(503)
+            return
+        response = self.state.get(route, group_id, player)
+        if response is None:
+            self._send(404)
+        elif response.etag in self.headers.get("If-None-Match", ""):
+            self._send(304, response)
+        else:
+            self._send(200, response, head=head)
+
+    def do_GET(self):
+        self._route()
+
+    def do_HEAD(self):
+        self._route(head=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandingsRefresher(threading.Thread):
+    """Refetch standings on the matchday-aware schedule and update the state."""
+
+    def __init__(self, state: ApiState, load, get_scheduler):
+        super().__init__(name="api-refresher", daemon=True)
+        self.state = state
+        self.load = load
+        self.get_scheduler = get_scheduler
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def refresh(self) -> bool:
+        standings_df, messages = self.load()
+        for level, message in messages:
+            logger.log(logging.WARNING if level in ("warning", "error") else logging.INFO, message)
+        changed = self.state.update(standings_df)
+        if changed:
+            logger.info("Standings changed; API state rebuilt (%s)", self.state.standings_hash)
+        return changed
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+                delay = self.get_scheduler().next_refresh() - time.time()
+            except Exception:
+                logger.exception("Refreshing the API state failed; serving the previous state")
+                delay = LIVE_INTERVAL
+            self._stop_event.wait(max(1.0, delay))
+
+
+def start_api_server(state: ApiState, port: int = DEFAULT_PORT, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``state`` on ``host:port`` from a daemon thread."""
+    handler = type("ApiHandler", (_ApiHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="api-server", daemon=True).start()
+    return server
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Serve the sweepstake as a read-only JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--season", default=SEASON_LABEL)
+    parser.add_argument("--picks", default=PICKS_PATH)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--standings", help="serve standings from a CSV/JSON file")
+    source.add_argument("--offline", action="store_true", help="serve the last saved snapshot")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    store = get_picks_store() if args.picks == PICKS_PATH else PicksStore.load(args.picks)
+    state = ApiState(store, args.season)
+
+    _fixtures = {"at": 0.0, "list": []}
+
+    def get_scheduler() -> RefreshScheduler:
+        if args.standings or args.offline:
+            return RefreshScheduler([])
+        if time.time() - _fixtures["at"] > IDLE_INTERVAL:
+            comp_id = resolve_comp_season(args.season)
+            _fixtures["list"] = get_fixtures(comp_id) if comp_id else []
+            _fixtures["at"] = time.time()
+        return RefreshScheduler.from_fixtures(_fixtures["list"])
+
+    refresher = StandingsRefresher(state, lambda: load_standings(args), get_scheduler)
+    try:
+        refresher.refresh()
+    except ValueError as e:  # an unusable --standings file
+        parser.error(str(e))
+    refresher.start()
+    server = start_api_server(state, args.port, args.host)
+    logger.info("Serving on http://%s:%d (Ctrl+C to stop)", args.host, server.server_address[1])
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        refresher.stop()
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""Headless sweepstake run for cron and other systems.
+
+Fetches (or loads) the standings, scores one or all groups and writes the
+leaderboard, player cards and optional what-if results as JSON, CSV or
+HTML. Uses the same fetch and scoring code as the Streamlit app but
+imports neither Streamlit nor Altair.
+
+Examples::
+
+    python sweepstake_cli.py                          # JSON to stdout
+    python sweepstake_cli.py --format csv -o out/     # leaderboard.csv, cards.csv
+    python sweepstake_cli.py --all-groups -o out/     # out/<group>/...
+    python sweepstake_cli.py --what-if "Burnley=10" --what-if "Leeds United=12"
+    python sweepstake_cli.py --offline                # last snapshot, no network
+"""
+
+import argparse
+import html
+import io
+import json
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from frames import compact_picks, compact_standings
+from picks_store import PICKS_PATH, PicksStore
+from pulse_live import (
+    SEASON_LABEL,
+    SNAPSHOTS,
+    crest_url,
+    get_fallback_standings,
+    get_premier_league_standings,
+    set_base_url,
+)
+from scoring import PickMatrix, leaderboard, merge_standings, player_cards, position_conflicts, what_if_totals
+from scoring_rules import position_points
+from team_registry import get_registry
+
+FORMATS = ("json", "csv", "html")
+# Columns a --standings file must have; the rest are derived like the Pulse path does
+REQUIRED_COLUMNS = ("Position", "Team")
+# Optional numeric columns, 0 when a file leaves them out
+DEFAULT_ZERO_COLUMNS = ("Points_League", "Goals_For", "Goals_Against")
+
+
+def load_standings(args) -> tuple[pd.DataFrame, list[tuple[str, str]]]:
+    """Standings from a file, the snapshot store (--offline) or Pulse Live."""
+    standings_df, messages = _read_standings(args)
+    return compact_standings(standings_df), messages
+
+
+def read_standings_file(path: str) -> pd.DataFrame:
+    """A standings table from CSV/JSON, with the columns scoring reads filled in.
+
+    Only ``Position`` and ``Team`` are required (ValueError otherwise);
+    ``Points_Value`` and ``Crest_URL`` are derived, and league points and
+    goals default to 0.
+    """
+    if path.lower().endswith(".csv"):
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_json(path, orient="records")
+    missing = [c for c in REQUIRED_COLUMNS if c not in df]
+    if missing:
+        raise ValueError(f"{path} has no {', '.join(missing)} column(s)")
+    position = pd.to_numeric(df["Position"], errors="coerce").fillna(0).astype(int)
+    registry = get_registry()
+    df["Position"] = position
+    df["Team"] = [registry.canonical(team) for team in df["Team"]]
+    for col in DEFAULT_ZERO_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int) if col in df else 0
+    if "Points_Value" not in df:
+        # Pre-season rows (position 0) score nothing, as in the live table
+        df["Points_Value"] = position_points(position).where(position > 0, 0)
+    if "Crest_URL" not in df:
+        df["Crest_URL"] = [crest_url(registry.opta_id(team)) for team in df["Team"]]
+    df.attrs["source"] = "file"
+    return df
+
+
+def _read_standings(args) -> tuple[pd.DataFrame, list[tuple[str, str]]]:
+    if args.standings:
+        return read_standings_file(args.standings), []
+    if args.offline:
+        df = SNAPSHOTS.latest(args.season)
+        if df is not None:
+            df.attrs["source"] = "snapshot"
+            return df, [("info", f"Using snapshot from {df.attrs['taken_at']}.")]
+        return get_fallback_standings(), [("warning", "No snapshot saved yet; using fallback standings.")]
+    if getattr(args, "pulse_url", None):
+        set_base_url(args.pulse_url)
+    return get_premier_league_standings(args.season)
+
+
+def parse_what_if(values: list[str]) -> dict[str, int]:
+    """``["Burnley=10", ...]`` -> ``{"Burnley": 10}`` (names canonicalised)."""
+    moves = {}
+    for value in values or []:
+        team, sep, pos = value.rpartition("=")
+        if not sep or not team.strip():
+            raise ValueError(f"expected TEAM=POSITION, got {value!r}")
+        pos = int(pos)
+        if not 1 <= pos <= 20:
+            raise ValueError(f"position for {team.strip()} must be 1-20, got {pos}")
+        moves[get_registry().canonical(team)] = pos
+    return moves
+
+
+def score_group(store: PicksStore, matrix: PickMatrix, scores, group_id: str,
+                standings_df: pd.DataFrame, moves: dict[str, int]) -> dict[str, pd.DataFrame | list]:
+    """Leaderboard, cards and what-if results for one group."""
+    picks_df = compact_picks(store.picks_frame(group_id), get_registry().canonical)
+    merged_df, _ = merge_standings(picks_df, standings_df)
+    results = {
+        "leaderboard": leaderboard(matrix.group_totals(group_id, scores)),
+        "cards": player_cards(merged_df),
+    }
+    if moves:
+        results["what_if"] = leaderboard(what_if_totals(merged_df, moves))
+    return results
+
+
+def _cards_frame(cards: list[dict]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"player": c["player"], "total": c["total"], **team} for c in cards for team in c["teams"]]
+    )
+
+
+def _as_frame(value) -> pd.DataFrame:
+    return _cards_frame(value) if isinstance(value, list) else value
+
+
+def _as_records(value):
+    if isinstance(value, list):
+        return value
+    return json.loads(value.to_json(orient="records"))
+
+
+def render(name: str, value, fmt: str, title: str = "") -> str:
+    """One result (``leaderboard``, ``cards`` or ``what_if``) in ``fmt``."""
+    if fmt == "json":
+        return json.dumps(_as_records(value), indent=2, ensure_ascii=False) + "\n"
+    frame = _as_frame(value)
+    if fmt == "csv":
+        buf = io.StringIO()
+        frame.to_csv(buf, index=False)
+        return buf.getvalue()
+    heading = html.escape(f"{title} {name.replace('_', ' ')}".strip())
+    return (
+        f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{heading}</title></head>\n"
+        f"<body><h1>{heading}</h1>\n{frame.to_html(index=False, escape=True)}\n</body></html>\n"
+    )
+
+
+def write_atomic(path: str, text: str):
+    """Write via a temp file + rename so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.chmod(tmp, 0o644)  # mkstemp creates 0600; outputs are meant to be served/shared
+    os.replace(tmp, path)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Score the sweepstake without Streamlit.")
+    parser.add_argument("--season", default=SEASON_LABEL, help="season label, e.g. 2025/26")
+    parser.add_argument("--picks", default=PICKS_PATH, help="picks config (.json) or database (.db)")
+    groups = parser.add_mutually_exclusive_group()
+    groups.add_argument("--group", help="group id (default: the store's default group)")
+    groups.add_argument("--all-groups", action="store_true", help="score every group")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--standings", help="read standings from a CSV/JSON file instead of fetching")
+    source.add_argument("--offline", action="store_true", help="use the last saved snapshot, no network")
+    parser.add_argument("--pulse-url", help="Pulse Live base URL (e.g. a local pulse_standin.py)")
+    parser.add_argument("--what-if", action="append", metavar="TEAM=POS", help="move a team (repeatable)")
+    parser.add_argument("--format", choices=FORMATS, default="json")
+    parser.add_argument("-o", "--output-dir", help="write files here instead of printing to stdout")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        moves = parse_what_if(args.what_if)
+    except ValueError as e:
+        parser.error(str(e))
+    conflicts = position_conflicts(moves)
+    if conflicts:
+        parser.error("; ".join(f"position {p} given to {', '.join(t)}" for p, t in conflicts.items()))
+
+    store = PicksStore.load(args.picks)
+    if not len(store):
+        print(f"No sweepstake groups in {args.picks}", file=sys.stderr)
+        return 1
+    if args.group and args.group not in store:
+        parser.error(f"unknown group {args.group!r} (have: {', '.join(store.group_ids())})")
+    group_ids = store.group_ids() if args.all_groups else [args.group or store.default_group]
+
+    try:
+        standings_df, messages = load_standings(args)
+    except ValueError as e:
+        parser.error(str(e))
+    for level, message in messages:
+        print(f"{level}: {message}", file=sys.stderr)
+    if standings_df is None or standings_df.empty:
+        print("Could not load league standings.", file=sys.stderr)
+        return 1
+
+    # Every group scored in one pass against the shared table
+    matrix = PickMatrix(store.groups, canonical=get_registry().canonical)
+    scores = matrix.score_standings(standings_df)
+    results = {gid: score_group(store, matrix, scores, gid, standings_df, moves) for gid in group_ids}
+
+    if args.output_dir:
+        for gid, group_results in results.items():
+            out_dir = os.path.join(args.output_dir, gid) if args.all_groups else args.output_dir
+            for name, value in group_results.items():
+                text = render(name, value, args.format, store.group(gid)["name"])
+                write_atomic(os.path.join(out_dir, f"{name}.{args.format}"), text)
+        return 0
+
+    if args.format == "json":
+        doc = {
+            "season": args.season,
+            "source": standings_df.attrs.get("source"),
+            "groups": {
+                gid: {name: _as_records(value) for name, value in group_results.items()}
+                for gid, group_results in results.items()
+            },
+        }
+        sys.stdout.write(json.dumps(doc, indent=2, ensure_ascii=False) + "\n")
+    else:
+        # CSV/HTML on stdout: just the leaderboard of each group
+        for gid, group_results in results.items():
+            sys.stdout.write(render("leaderboard", group_results["leaderboard"], args.format, store.group(gid)["name"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Persisted registry of Premier League teams keyed by Pulse Live team id.
+
+Each team stores its canonical name (as Pulse Live currently spells it),
+known aliases, Opta id (used for badge URLs) and crest URL. The registry
+starts from the tracked seed ``data/team_registry.json`` and learns from
+every standings response: new teams, renamed teams and missing Opta ids
+are recorded and written to ``REGISTRY_PATH`` under the data directory,
+never to the seed. Lookups go through a name index built once per load,
+so resolving a pick or a crest is a single dict access.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+
+from snapshot_store import DATA_DIR
+
+CREST_URL_TEMPLATE = "https://resources.premierleague.com/premierleague/badges/50/{}.png"
+
+SEED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "team_registry.json")
+# What the registry has learned at runtime (kept apart from the tracked seed)
+REGISTRY_PATH = os.path.join(DATA_DIR, "team_registry.learned.json")
+
+
+def _read_teams(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("teams", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def name_key(name: str) -> str:
+    """Normalise a team name for lookups ('Brighton & Hove Albion' == 'brighton and hove albion')."""
+    key = str(name).casefold().replace("&", " and ")
+    key = re.sub(r"\b(a?fc)\b", " ", key)
+    return " ".join(re.sub(r"[^\w' ]", " ", key).split())
+
+
+class TeamRegistry:
+    def __init__(self, teams: dict | None = None, path: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        # pulse id (str) -> {"name", "aliases", "opta", "crest"}
+        self.teams: dict[str, dict] = {str(k): dict(v) for k, v in (teams or {}).items()}
+        self._index: dict[str, str] = {}
+        self._rebuild_index()
+
+    @classmethod
+    def load(cls, path: str = REGISTRY_PATH) -> "TeamRegistry":
+        """The bundled seed overlaid with what was learned and saved to ``path``."""
+        teams = _read_teams(SEED_PATH)
+        teams.update(_read_teams(path))
+        return cls(teams, path=path)
+
+    def _rebuild_index(self):
+        index = {}
+        for pulse_id, team in self.teams.items():
+            for alias in [team["name"], *team.get("aliases", [])]:
+                index[name_key(alias)] = pulse_id
+        self._index = index  # swapped in one assignment for lock-free readers
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def lookup(self, name: str) -> dict | None:
+        """The registry entry for a name or alias, or None."""
+        pulse_id = self._index.get(name_key(name))
+        return self.teams.get(pulse_id) if pulse_id is not None else None
+
+    def canonical(self, name: str) -> str:
+        """The canonical name for ``name``; unknown names are returned stripped."""
+        team = self.lookup(name)
+        return team["name"] if team else str(name).strip()
+
+    def opta_id(self, name: str) -> str | None:
+        team = self.lookup(name)
+        return team.get("opta") if team else None
+
+    def crest(self, name: str) -> str | None:
+        team = self.lookup(name)
+        return team.get("crest") if team else None
+
+    def learn(self, pulse_id, name: str, opta: str | None = None) -> bool:
+        """Record what an API response says about a team; True if anything changed."""
+        if not pulse_id or not name:
+            return False
+        pulse_id, name = str(int(pulse_id)), str(name).strip()
+        with self._lock:
+            team = self.teams.get(pulse_id)
+            if team is None:
+                team = self.teams[pulse_id] = {"name": name, "aliases": [], "opta": None, "crest": None}
+                changed = True
+            else:
+                changed = False
+            if team["name"] != name:
+                # The API's spelling wins; keep the old one as an alias
+                team["aliases"] = sorted((set(team.get("aliases", [])) | {team["name"]}) - {name})
+                team["name"] = name
+                changed = True
+            if opta and team.get("opta") != opta:
+                team["opta"] = opta
+                team["crest"] = CREST_URL_TEMPLATE.format(opta)
+                changed = True
+            if changed:
+                self._rebuild_index()
+            return changed
+
+    def learn_many(self, rows) -> bool:
+        """``learn`` for each ``(pulse_id, name, opta)``; True if anything changed."""
+        changed = False
+        for pulse_id, name, opta in rows:
+            changed |= self.learn(pulse_id, name, opta)
+        return changed
+
+    def save(self, path: str | None = None):
+        """Write the registry atomically (temp file + rename)."""
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            payload = json.dumps({"version": 1, "teams": self.teams}, indent=2, ensure_ascii=False) + "\n"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+
+_registry: TeamRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> TeamRegistry:
+    """The process-wide registry, loaded on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TeamRegistry.load()
+    return _registry
@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path so we can import the benchmark modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import micro  # noqa: E402
+
+
+class TestMicroBenchmarks(unittest.TestCase):
+
+    def test_every_benchmark_runs(self):
+        for name, spec in micro.BENCHMARKS.items():
+            with self.subTest(name):
+                self.assertIsNotNone(spec["setup"]())
+
+    def test_compseason_benchmark_resolves_the_premier_league_season(self):
+        # The recording mixes competitions; other cups share the label
+        self.assertEqual(micro.BENCHMARKS["compseason_resolution"]["setup"]()(), 777)
+
+    def test_every_benchmark_has_a_baseline(self):
+        self.assertEqual(set(micro.load_baselines()), set(micro.BENCHMARKS))
+
+    def test_compare_flags_paths_over_budget(self):
+        results = {"calibration": 1.0, "benchmarks": {
+            "what_if": {"seconds": 1.0, "normalized": 1.4},
+            "leaderboard_rank": {"seconds": 1.0, "normalized": 1.6},
+            "image_base64": {"seconds": 1.0, "normalized": 1.0},
+        }}
+        baselines = {"what_if": {"normalized": 1.0}, "leaderboard_rank": {"normalized": 1.0}}
+        status = {row["name"]: row["status"] for row in micro.compare(results, baselines)}
+        self.assertEqual(status, {"what_if": "ok", "leaderboard_rank": "slow", "image_base64": "new"})
+
+    def test_update_round_trips(self):
+        results = micro.run_benchmarks(["image_base64"], min_time=0.001, repeat=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baselines.json")
+            micro.save_baselines(results, path)
+            rows = micro.compare(results, micro.load_baselines(path))
+        self.assertEqual(rows[0]["status"], "ok")
+        self.assertAlmostEqual(rows[0]["ratio"], 1.0, places=3)
+
+    @unittest.skipUnless(os.environ.get("SWEEPSTAKE_BENCH"), "set SWEEPSTAKE_BENCH=1 to enforce the budgets")
+    def test_within_budget(self):
+        rows = micro.compare(micro.run_benchmarks(), micro.load_baselines())
+        slow = [f"{row['name']} {row['ratio']:.2f}x" for row in rows if row["status"] == "slow"]
+        self.assertEqual(slow, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
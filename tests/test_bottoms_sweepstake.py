@@ -1,16 +1,23 @@
 import unittest
 import pandas as pd
+import socket
 import sys
 import os
 
 # Add parent directory to path so we can import the main module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import pulse_live  # noqa: E402
 from bottoms_sweepstake import (  # noqa: E402
+    STANDINGS_CACHE,
     _normalize_comp_id,
     season_start_year_from_label,
     get_player_picks,
+    load_fixtures,
+    load_standings,
+    start_metrics_endpoint,
 )
+from pulse_standin import start_standin  # noqa: E402
 
 
 class TestBottomsSweepstakeHelpers(unittest.TestCase):
@@ -36,6 +43,39 @@ class TestBottomsSweepstakeHelpers(unittest.TestCase):
         self.assertListEqual(list(df.columns), ["Player", "Team"])
         self.assertFalse(df.empty)
 
+    def test_unavailable_standings_are_not_cached(self):
+        server = start_standin(error_rate=1.0, error_status=404)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(pulse_live.set_base_url, pulse_live.BASE_URL)
+        pulse_live.set_base_url(server.url)
+        for _ in range(2):
+            with STANDINGS_CACHE.lookup():
+                standings_df, _ = load_standings("1901/02", "retry-test")
+            self.assertIn(standings_df.attrs["source"], ("snapshot", "fallback"))
+            self.assertTrue(STANDINGS_CACHE._local.missed)
+
+    def test_empty_fixtures_are_not_cached(self):
+        self.addCleanup(pulse_live.set_base_url, pulse_live.BASE_URL)
+        down = start_standin(error_rate=1.0, error_status=404)
+        up = start_standin()
+        for server in (down, up):
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+        pulse_live.set_base_url(down.url)
+        self.assertEqual(load_fixtures("2025/26"), [])
+        pulse_live.set_base_url(up.url)
+        self.assertTrue(load_fixtures("2025/26"))
+
+    def test_metrics_port_in_use(self):
+        taken = socket.socket()
+        self.addCleanup(taken.close)
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+        with self.assertLogs("bottoms_sweepstake", "WARNING"):
+            self.assertIsNone(start_metrics_endpoint(port))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import data_hash, history_spec, rankings_spec  # noqa: E402
+from scoring import PickMatrix, score_history  # noqa: E402
+
+
+def totals(ann=20, bob=12):
+    return pd.DataFrame({"Player": ["Ann", "Bob"], "Points_Value": [ann, bob]})
+
+
+def snapshot(taken_at, arsenal, chelsea):
+    df = pd.DataFrame({"Team": ["Arsenal", "Chelsea"], "Points_Value": [arsenal, chelsea]})
+    df.attrs["taken_at"] = taken_at
+    return df
+
+
+class TestCharts(unittest.TestCase):
+
+    def test_data_hash_tracks_content_not_index(self):
+        self.assertEqual(data_hash(totals()), data_hash(totals().set_axis([5, 6])))
+        self.assertNotEqual(data_hash(totals()), data_hash(totals(bob=13)))
+        self.assertNotEqual(data_hash(totals()), data_hash(totals().rename(columns={"Player": "Name"})))
+
+    def test_rankings_spec(self):
+        spec = rankings_spec(totals(), "Player Rankings", "blues")
+        self.assertEqual(spec["data"]["values"], [{"Player": "Ann", "Points_Value": 20}, {"Player": "Bob", "Points_Value": 12}])
+        self.assertEqual(spec["encoding"]["y"]["sort"], "-x")
+        self.assertEqual(spec["encoding"]["color"]["scale"], {"scheme": "blues"})
+        self.assertNotIn("scale", spec["encoding"]["x"])
+
+    def test_rankings_spec_all_zero_gets_a_domain(self):
+        spec = rankings_spec(totals(0, 0))
+        self.assertEqual(spec["encoding"]["x"]["scale"], {"domain": [0, 1]})
+
+    def test_score_history_keeps_last_snapshot_per_day(self):
+        matrix = PickMatrix({"g": {"picks": {"Ann": ["Arsenal"], "Bob": ["Chelsea"]}}})
+        history = score_history(matrix, "g", [
+            snapshot("2025-09-01T10:00:00+00:00", 20, 19),
+            snapshot("2025-09-01T18:00:00+00:00", 19, 20),
+            snapshot("2025-09-08T18:00:00+00:00", 18, 17),
+        ])
+        self.assertEqual(history["Date"].tolist(), ["2025-09-01", "2025-09-01", "2025-09-08", "2025-09-08"])
+        self.assertEqual(history["Points_Value"].tolist(), [19, 20, 18, 17])
+        spec = history_spec(history)
+        self.assertEqual(len(spec["data"]["values"]), 4)
+        self.assertEqual(spec["encoding"]["x"]["type"], "temporal")
+
+    def test_score_history_empty(self):
+        matrix = PickMatrix({"g": {"picks": {"Ann": ["Arsenal"]}}})
+        self.assertTrue(score_history(matrix, "g", []).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
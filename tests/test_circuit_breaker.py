@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=3, base_delay=10, max_delay=100, clock=self.clock, rng=lambda: 1.0
+        )
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        for _ in range(2):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_half_open_allows_single_probe(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 10
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_backs_off_exponentially(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.retry_at, 10)
+        self.clock.now = 10
+        self.breaker.allow()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.retry_at, 30)  # 10 + 20
+
+    def test_jitter_stays_within_half_to_full_delay(self):
+        breaker = CircuitBreaker(failure_threshold=1, base_delay=10, clock=self.clock, rng=lambda: 0.0)
+        breaker.record_failure()
+        self.assertEqual(breaker.retry_at, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
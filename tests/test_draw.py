@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draw import (  # noqa: E402
+    DrawError,
+    append_log,
+    apply_draws,
+    draw_group,
+    draw_groups,
+    expected_totals,
+    read_log,
+    verify_draw,
+)
+from picks_store import PicksStore  # noqa: E402
+
+# Team N is forecast to finish Nth
+FORECAST = {f"Team {i:02d}": float(i) for i in range(1, 21)}
+TOP_SIX = {f"Team {i:02d}" for i in range(1, 7)}
+PLAYERS = ["Ann", "Bob", "Cat", "Dan", "Eve", "Fay", "Gus", "Hal", "Ivy", "Jo"]
+
+
+class TestDrawGroup(unittest.TestCase):
+
+    def test_same_seed_same_draw(self):
+        self.assertEqual(draw_group(PLAYERS, FORECAST, 1), draw_group(PLAYERS, FORECAST, 1))
+        draws = {str(sorted(map(sorted, draw_group(PLAYERS, FORECAST, seed).values()))) for seed in range(10)}
+        self.assertGreater(len(draws), 1)
+
+    def test_constraints(self):
+        for seed in range(20):
+            for players in (PLAYERS, PLAYERS[:6], PLAYERS[:3]):
+                picks = draw_group(players, FORECAST, seed)
+                self.assertEqual(list(picks), players)
+                drawn = [team for teams in picks.values() for team in teams]
+                self.assertEqual(len(drawn), 2 * len(players))
+                self.assertEqual(len(set(drawn)), len(drawn))
+                for teams in picks.values():
+                    self.assertLessEqual(len(TOP_SIX.intersection(teams)), 1)
+
+    def test_balanced(self):
+        for seed in range(20):
+            totals = expected_totals(draw_group(PLAYERS, FORECAST, seed), FORECAST)
+            # All 20 teams are used, so every player can get exactly 21
+            self.assertLessEqual(max(totals.values()) - min(totals.values()), 2)
+        totals = expected_totals(draw_group(PLAYERS, FORECAST, 3, tolerance=0), FORECAST)
+        self.assertEqual(set(totals.values()), {21.0})
+
+    def test_unranked_teams_score_zero(self):
+        forecast = {**FORECAST, "Team 20": 0.0, "Team 19": -1.0}
+        totals = expected_totals({"Ann": ["Team 20", "Team 19"], "Bob": ["Team 01"]}, forecast)
+        self.assertEqual(totals, {"Ann": 0.0, "Bob": 20.0})
+
+    def test_impossible_draws(self):
+        with self.assertRaises(DrawError):
+            draw_group(PLAYERS + ["Kit"], FORECAST, 1)
+        with self.assertRaises(DrawError):
+            draw_group(["Ann", "Ann"], FORECAST, 1)
+        # One top-14 team each leaves 7 + 6 teams for the 14 picks seven players need
+        with self.assertRaises(DrawError):
+            draw_group(PLAYERS[:7], FORECAST, 1, top_teams=14)
+        self.assertEqual(draw_group([], FORECAST, 1), {})
+
+
+class TestDrawBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.groups = {f"g{i}": {"name": f"Group {i}", "players": PLAYERS[:2 + i % 9]} for i in range(300)}
+        self.records = draw_groups(self.groups, FORECAST, seed=42)
+
+    def test_groups_are_seeded_independently(self):
+        again = draw_groups({"g7": self.groups["g7"]}, FORECAST, seed=42)
+        self.assertEqual(again["g7"]["picks"], self.records["g7"]["picks"])
+        self.assertNotEqual(draw_groups(self.groups, FORECAST, seed=43)["g9"]["picks"], self.records["g9"]["picks"])
+
+    def test_audit_log_replays(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "draws.jsonl")
+            append_log(self.records, path)
+            logged = read_log(path)
+        self.assertEqual(len(logged), 300)
+        self.assertTrue(all(verify_draw(record) for record in logged))
+        tampered = dict(logged[0], picks={player: ["Team 01", "Team 02"] for player in logged[0]["players"]})
+        self.assertFalse(verify_draw(tampered))
+
+    def test_apply_to_picks_store(self):
+        store = PicksStore({})
+        apply_draws(store, self.groups, self.records, season="2026/27")
+        self.assertEqual(len(store), 300)
+        group = store.group("g3")
+        self.assertEqual(group["name"], "Group 3")
+        self.assertEqual(group["season"], "2026/27")
+        self.assertEqual(group["picks"], self.records["g3"]["picks"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frames import compact_picks, compact_standings, team_dtype  # noqa: E402
+from scoring import merge_standings, what_if_totals  # noqa: E402
+
+
+def _standings():
+    df = pd.DataFrame(
+        {
+            "Position": [1, 2, 3],
+            "Team": ["Arsenal", "Chelsea", "Liverpool"],
+            "Team_ID": pd.Series(["t3", "t8", "t14"], dtype=object),
+            "Points_League": [9, 6, 3],
+            "Goals_For": [7, 5, 2],
+            "Goals_Against": [1, 3, 6],
+            "Crest_URL": pd.Series(["a.png", "c.png", "l.png"], dtype=object),
+            "Points_Value": [20, 19, 18],
+        }
+    )
+    df.attrs["source"] = "live"
+    return df
+
+
+class TestCompactFrames(unittest.TestCase):
+
+    def test_standings_dtypes(self):
+        df = compact_standings(_standings())
+        self.assertEqual(df["Position"].dtype, "int8")
+        self.assertEqual(df["Points_Value"].dtype, "int8")
+        self.assertEqual(df["Points_League"].dtype, "int16")
+        self.assertIsInstance(df["Team"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["Crest_URL"].dtype, pd.StringDtype)
+        self.assertEqual(df.attrs["source"], "live")
+        self.assertEqual(df["Team"].tolist(), ["Arsenal", "Chelsea", "Liverpool"])
+
+    def test_ints_that_do_not_fit_are_left_alone(self):
+        df = _standings()
+        df["Goals_For"] = [7, None, 2]
+        df["Points_League"] = [40000, 6, 3]
+        compact = compact_standings(df)
+        self.assertEqual(compact["Goals_For"].tolist()[0], 7)
+        self.assertTrue(compact["Goals_For"].isna().iloc[1])
+        self.assertEqual(compact["Points_League"].tolist(), [40000, 6, 3])
+
+    def test_team_dtype_includes_unknown_teams_and_is_shared(self):
+        dtype = team_dtype(["Nowhere FC"])
+        self.assertIn("Nowhere FC", dtype.categories)
+        self.assertIn("Arsenal", dtype.categories)
+        self.assertIs(team_dtype(["Nowhere FC"]), dtype)
+
+    def test_picks_are_canonical_and_categorical(self):
+        picks = pd.DataFrame({"Player": ["Bob", "Ann"], "Team": ["arsenal fc", "Chelsea"]})
+        df = compact_picks(picks, canonical=lambda name: "Arsenal" if "arsenal" in name else name)
+        self.assertEqual(df["Team"].tolist(), ["Arsenal", "Chelsea"])
+        self.assertIsInstance(df["Player"].dtype, pd.CategoricalDtype)
+        self.assertEqual(picks["Team"].tolist(), ["arsenal fc", "Chelsea"])  # input untouched
+
+    def test_merge_keeps_compact_dtypes(self):
+        standings = compact_standings(_standings())
+        picks = compact_picks(pd.DataFrame({"Player": ["Ann", "Bob"], "Team": ["Chelsea", "Arsenal"]}))
+        merged, missing = merge_standings(picks, standings)
+        self.assertTrue(missing.empty)
+        self.assertIsInstance(merged["Team"].dtype, pd.CategoricalDtype)
+        self.assertEqual(merged["Points_Value"].dtype, "int8")
+
+    def test_merge_with_missing_team_restores_ints(self):
+        standings = compact_standings(_standings())
+        picks = compact_picks(pd.DataFrame({"Player": ["Ann", "Ann"], "Team": ["Chelsea", "Nowhere FC"]}))
+        merged, missing = merge_standings(picks, standings)
+        self.assertEqual(missing["Team"].tolist(), ["Nowhere FC"])
+        self.assertEqual(merged["Points_Value"].dtype, "int8")
+        self.assertEqual(merged["Points_Value"].tolist(), [19, 0])
+        totals = what_if_totals(merged, {"Nowhere FC": 1})
+        self.assertEqual(totals["Points_Value"].tolist(), [39])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import json
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from json_stream import ArrayNotFound, iter_array_items, iter_array_objects  # noqa: E402
+
+PAYLOAD = {
+    "pageInfo": {"page": 0, "numEntries": 3},
+    "content": [
+        {"label": "2025/26", "id": 777, "tags": ["a", "]"]},
+        {"label": "2024/25 é", "id": 719.0},
+        {"label": "2023/24", "id": 578, "nested": {"content": [1, 2]}},
+    ],
+}
+
+
+TABLES = {
+    "compSeason": {"id": 777},
+    "tables": [
+        {"entries": [{"position": 1, "team": {"name": "Ann"}}], "type": "HOME"},
+        {"stage": {"type": "total"}, "entries": [{"position": 1}, {"position": 2, "note": "]}"}]},
+    ],
+}
+
+
+def chunked(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonStream(unittest.TestCase):
+
+    def test_items_survive_any_chunk_boundary(self):
+        text = json.dumps(PAYLOAD, ensure_ascii=False)
+        for size in (1, 2, 7, 64, 4096):
+            items = list(iter_array_items(chunked(text, size), ("compSeasons", "content")))
+            self.assertListEqual(items, PAYLOAD["content"], msg=f"chunk size {size}")
+
+    def test_top_level_array(self):
+        text = json.dumps(PAYLOAD["content"])
+        self.assertEqual(len(list(iter_array_items(chunked(text, 5), ("content",)))), 3)
+
+    def test_missing_key_returns_full_text(self):
+        text = json.dumps({"tables": []})
+        with self.assertRaises(ArrayNotFound) as ctx:
+            list(iter_array_items(chunked(text, 3), ("entries",)))
+        self.assertEqual(json.loads(ctx.exception.text), {"tables": []})
+
+    def test_items_are_yielded_before_the_body_ends(self):
+        def chunks():
+            yield b'{"entries": [{"position": 1}, '
+            raise AssertionError("read past the first record")
+
+        self.assertEqual(next(iter_array_items(chunks(), ("entries",))), {"position": 1})
+
+    def test_truncated_body_raises(self):
+        with self.assertRaises(ValueError):
+            list(iter_array_items([b'{"entries": [{"position": 1}, {"posi'], ("entries",)))
+
+    def test_objects_stream_their_nested_array(self):
+        text = json.dumps(TABLES)
+        for size in (1, 7, 64):
+            tables = list(iter_array_objects(chunked(text, size), ("tables",), "entries", lambda e: e["position"]))
+            self.assertListEqual(
+                tables,
+                [
+                    {"entries": [1], "type": "HOME"},
+                    {"stage": {"type": "total"}, "entries": [1, 2]},
+                ],
+                msg=f"chunk size {size}",
+            )
+
+    def test_objects_are_yielded_before_the_body_ends(self):
+        def chunks():
+            yield b'{"tables": [{"entries": [{"position": 1}], "type": "TOTAL"}, '
+            raise AssertionError("read past the first table")
+
+        self.assertEqual(
+            next(iter_array_objects(chunks(), ("tables",))),
+            {"entries": [{"position": 1}], "type": "TOTAL"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
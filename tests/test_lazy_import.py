@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+import subprocess
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lazy_import import LazyModule  # noqa: E402
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_after(imports: str, modules: tuple) -> list:
+    code = f"import sys; {imports}; print(','.join(m for m in {modules!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO, capture_output=True, text=True, check=True)
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+class TestLazyModule(unittest.TestCase):
+
+    def test_imports_on_first_attribute_access(self):
+        sys.modules.pop("colorsys", None)
+        colorsys = LazyModule("colorsys")
+        self.assertFalse(colorsys.loaded)
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertTrue(colorsys.loaded)
+        self.assertIn("colorsys", sys.modules)
+
+    def test_missing_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            LazyModule("colorsys").no_such_function
+
+    def test_data_modules_do_not_import_requests(self):
+        loaded = _loaded_after("import pulse_live, sweepstake_cli, static_export", ("requests", "altair"))
+        self.assertEqual(loaded, [])
+
+    def test_app_imports_do_not_import_altair_or_requests(self):
+        sys.path.append(os.path.join(REPO, "benchmarks"))
+        import micro
+
+        loaded = _loaded_after("import " + ", ".join(micro.app_imports()), ("requests", "altair"))
+        self.assertEqual(loaded, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from live_table import LiveTable, LiveTableWorker  # noqa: E402
+
+
+def make_standings():
+    return pd.DataFrame(
+        {
+            "Position": [1, 2, 3],
+            "Team": ["Arsenal", "Chelsea", "Everton"],
+            "Points_League": [10, 9, 9],
+            "Goals_For": [8, 6, 5],
+            "Goals_Against": [2, 3, 3],
+        }
+    )
+
+
+class TestLiveTable(unittest.TestCase):
+
+    def test_goal_updates_are_applied_as_deltas(self):
+        table = LiveTable(make_standings())
+        self.assertTrue(table.apply_score(1, "Everton", "Arsenal", 0, 0))
+        self.assertListEqual(table.points.tolist(), [11, 9, 10])
+
+        # Everton score: the draw becomes a win, not an extra result
+        self.assertTrue(table.apply_score(1, "Everton", "Arsenal", 1, 0))
+        self.assertListEqual(table.points.tolist(), [10, 9, 12])
+        self.assertListEqual(table.goals_for.tolist(), [8, 6, 6])
+        self.assertListEqual(table.goals_against.tolist(), [3, 3, 3])
+
+        # Same score again is a no-op
+        self.assertFalse(table.apply_score(1, "Everton", "Arsenal", 1, 0))
+
+    def test_frame_is_reranked(self):
+        table = LiveTable(make_standings())
+        table.apply_score(7, "Everton", "Chelsea", 2, 0)
+        df = table.to_frame()
+        self.assertListEqual(df["Team"].tolist(), ["Everton", "Arsenal", "Chelsea"])
+        self.assertListEqual(df["Points_Value"].tolist(), [20, 19, 18])
+
+    def test_worker_publishes_new_versions_only_on_change(self):
+        fixtures = [{"id": 1, "home": "Chelsea", "away": "Arsenal", "home_score": 0, "away_score": 0}]
+        worker = LiveTableWorker(lambda: ("k", make_standings()), lambda: fixtures)
+        self.assertTrue(worker.poll_once())
+        self.assertFalse(worker.poll_once())
+        fixtures[0]["home_score"] = 1
+        self.assertTrue(worker.poll_once())
+        version, frame = worker.snapshot()
+        self.assertEqual(version, 2)
+        self.assertEqual(frame.iloc[0]["Team"], "Chelsea")
+
+    def test_worker_canonicalises_names_and_counts_this_poll(self):
+        fixtures = [{"id": 1, "home": "Chelsea FC", "away": "The Arsenal", "home_score": 2, "away_score": 0}]
+        aliases = {"Chelsea FC": "Chelsea", "The Arsenal": "Arsenal"}
+        worker = LiveTableWorker(lambda: ("k", make_standings()), lambda: fixtures,
+                                 canonical=lambda name: aliases.get(name, name))
+        worker.poll_once()
+        self.assertEqual(worker.snapshot()[1].iloc[0]["Team"], "Chelsea")
+        self.assertEqual((worker.matches_in_play, worker.fixtures_applied), (1, 1))
+
+        # Full time: no longer in play, but its result stays applied
+        fixtures.clear()
+        worker.poll_once()
+        self.assertEqual((worker.matches_in_play, worker.fixtures_applied), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+import tempfile
+import tracemalloc
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mem_profile import GROWTH_WINDOW, MemoryProfiler, RerunMemory  # noqa: E402
+
+
+class TestMemoryProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.was_tracing = tracemalloc.is_tracing()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.profiler = MemoryProfiler(frames=1, report_path=os.path.join(self.tmp.name, "report.txt"))
+
+    def tearDown(self):
+        if not self.was_tracing:
+            tracemalloc.stop()
+        self.tmp.cleanup()
+
+    def test_disabled_is_a_no_op(self):
+        profiler = MemoryProfiler(frames=0)
+
+        def load():
+            return 1
+        self.assertIsNone(profiler.start_run())
+        self.assertIs(profiler.track("x")(load), load)
+
+    def test_rerun_records_peak_and_retained(self):
+        run = self.profiler.start_run()
+        kept = [bytearray(256 * 1024)]
+        temp = bytearray(1024 * 1024)
+        del temp
+        self.profiler.finish_run(run)
+        summary = self.profiler.summary()
+        self.assertEqual(summary["reruns"], 1)
+        self.assertGreaterEqual(summary["last_retained"], 256 * 1024)
+        self.assertGreaterEqual(summary["last_peak"] - run.before, 1024 * 1024)
+        self.assertIsNone(summary["growth"])
+        del kept
+
+    def test_track_records_cache_misses(self):
+        @self.profiler.track("blobs")
+        def load(size):
+            return bytearray(size)
+
+        blobs = [load(64 * 1024), load(128 * 1024)]
+        (row,) = self.profiler.cache_rows()
+        self.assertEqual(row["Cache"], "blobs")
+        self.assertEqual(row["Misses"], 2)
+        self.assertGreaterEqual(row["Retained (KiB)"], 192)
+        self.assertGreaterEqual(row["Largest miss (KiB)"], 128)
+        del blobs
+
+    def test_growth_is_flagged_and_reported(self):
+        self.profiler.start_run()  # starts tracing and takes the baseline
+        for i in range(GROWTH_WINDOW):
+            run = RerunMemory(0)
+            self.profiler.reruns.append(run)
+            run.after = i * 100 * 1024  # ~2 MiB over the window
+        self.assertGreater(self.profiler.growth(), 1024 * 1024)
+        leak = [bytearray(1024) for _ in range(500)]
+        self.profiler.finish_run(self.profiler.start_run())
+        self.assertTrue(self.profiler.flagged)
+        with open(self.profiler.report_path, encoding="utf-8") as f:
+            report = f.read()
+        self.assertIn("Top 25 allocation sites", report)
+        self.assertIn("growth since the first rerun", report)
+        self.assertIn("test_mem_profile.py", report)
+        del leak
+
+    def test_flat_heap_is_not_flagged(self):
+        for _ in range(GROWTH_WINDOW):
+            run = RerunMemory(0)
+            run.after = 5 * 1024 * 1024
+            self.profiler.reruns.append(run)
+        self.assertIsNone(self.profiler.growth())
+
+
+if __name__ == "__main__":
+    unittest.main()
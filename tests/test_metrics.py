@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+import urllib.request
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import (  # noqa: E402
+    CacheProbe,
+    Counter,
+    Histogram,
+    Registry,
+    start_metrics_server,
+)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_counter_and_histogram_exposition(self):
+        registry = Registry()
+        requests_total = registry.register(Counter("up_requests", "Requests.", ("endpoint", "status")))
+        latency = registry.register(Histogram("up_latency_seconds", "Latency.", ("endpoint",), buckets=(0.1, 1.0)))
+        requests_total.inc(endpoint="standings", status=200)
+        requests_total.inc(endpoint="standings", status=200)
+        latency.observe(0.05, endpoint="standings")
+        latency.observe(0.5, endpoint="standings")
+
+        text = registry.render()
+        self.assertIn("# TYPE up_requests counter", text)
+        self.assertIn('up_requests_total{endpoint="standings",status="200"} 2', text)
+        self.assertIn('up_latency_seconds_bucket{endpoint="standings",le="0.1"} 1', text)
+        self.assertIn('up_latency_seconds_bucket{endpoint="standings",le="+Inf"} 2', text)
+        self.assertIn('up_latency_seconds_count{endpoint="standings"} 2', text)
+
+    def test_cache_probe_counts_hits_and_misses(self):
+        probe = CacheProbe("test_cache_probe")
+        with probe.lookup():
+            probe.miss()
+        with probe.lookup():
+            pass
+        from metrics import CACHE_REQUESTS
+        self.assertEqual(CACHE_REQUESTS.value(cache="test_cache_probe", result="miss"), 1)
+        self.assertEqual(CACHE_REQUESTS.value(cache="test_cache_probe", result="hit"), 1)
+
+    def test_metrics_endpoint(self):
+        server = start_metrics_server(0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as resp:
+                self.assertEqual(resp.status, 200)
+                self.assertIn("sweepstake_fallback_activations", resp.read().decode())
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from movement import MovementTracker, rank_arrow, ranks  # noqa: E402
+from scoring import PickMatrix  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+GROUPS = {
+    "office": {"picks": {"Ann": ["Arsenal"], "Bob": ["Chelsea"], "Cat": ["Everton"]}},
+    "pub": {"picks": {"Dan": ["Chelsea"], "Eve": ["Arsenal"]}},
+}
+
+
+def make_standings(order):
+    """A table with ``order`` as 1st, 2nd, 3rd."""
+    return pd.DataFrame({
+        "Position": [1, 2, 3],
+        "Team": list(order),
+        "Points_League": [9, 6, 3],
+        "Points_Value": [20, 19, 18],
+    })
+
+
+class TestMovementTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = MovementTracker(PickMatrix(GROUPS))
+
+    def test_ranks_share_ties(self):
+        self.assertEqual(ranks(np.array([5, 9, 5, 1])).tolist(), [2, 1, 2, 4])
+        self.assertEqual([rank_arrow(c) for c in (2, -1, 0)], ["▲2", "▼1", "–"])
+
+    def test_movement_since_previous_snapshot(self):
+        self.tracker.add(make_standings(["Arsenal", "Chelsea", "Everton"]))
+        self.tracker.add(make_standings(["Everton", "Arsenal", "Chelsea"]))
+        move = self.tracker.movement("office").set_index("Player")
+        self.assertEqual(move.loc["Cat", "Rank"], 1)
+        self.assertEqual(move.loc["Cat", "Rank_Change"], 2)
+        self.assertEqual(move.loc["Cat", "Points_Change"], 2)
+        self.assertEqual(move.loc["Bob", "Rank_Change"], -1)
+
+        # A shown table that differs from the latest snapshot is compared with it
+        live = self.tracker.matrix.score_standings(make_standings(["Chelsea", "Everton", "Arsenal"]))
+        move = self.tracker.movement("office", live).set_index("Player")
+        self.assertEqual(move.loc["Bob", "Rank_Change"], 2)
+        self.assertEqual(move.loc["Cat", "Rank_Change"], -1)
+
+    def test_no_history(self):
+        move = self.tracker.movement("pub")
+        self.assertEqual(move["Rank_Change"].tolist(), [0, 0])
+        self.assertEqual(move["Points_Change"].tolist(), [0, 0])
+
+    def test_head_to_head_accumulates(self):
+        self.tracker.add(make_standings(["Arsenal", "Chelsea", "Everton"]))
+        self.tracker.add(make_standings(["Chelsea", "Arsenal", "Everton"]))
+        self.tracker.add(make_standings(["Arsenal", "Everton", "Chelsea"]))
+        h2h = self.tracker.head_to_head("office")
+        self.assertEqual(h2h.loc["Ann", "Bob"], 2)
+        self.assertEqual(h2h.loc["Bob", "Ann"], 1)
+        self.assertEqual(h2h.loc["Ann", "Cat"], 3)
+        self.assertEqual(h2h.loc["Cat", "Bob"], 1)
+        self.assertEqual(self.tracker.head_to_head("pub").loc["Eve", "Dan"], 2)
+
+    def test_catch_up_reads_only_new_snapshots(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SnapshotStore(tmp)
+            start = datetime(2025, 9, 1, tzinfo=timezone.utc)
+            store.append("2025/26", make_standings(["Arsenal", "Chelsea", "Everton"]), start)
+            self.assertEqual(self.tracker.catch_up(store, "2025/26"), 1)
+            self.assertEqual(self.tracker.catch_up(store, "2025/26"), 0)
+            store.append("2025/26", make_standings(["Everton", "Chelsea", "Arsenal"]), start + timedelta(days=1))
+            self.assertEqual(self.tracker.catch_up(store, "2025/26"), 1)
+            self.assertEqual(self.tracker.snapshots, 2)
+            self.assertEqual(self.tracker.head_to_head("office").loc["Ann", "Cat"], 1)
+
+            # A replaced (shorter) file starts the tracker over
+            os.remove(store.path("2025/26"))
+            store = SnapshotStore(tmp)
+            store.append("2025/26", make_standings(["Chelsea", "Arsenal", "Everton"]), start)
+            self.assertEqual(self.tracker.catch_up(store, "2025/26"), 1)
+            self.assertEqual(self.tracker.snapshots, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from picks_store import PICKS_PATH, PicksStore, UnknownGroupError  # noqa: E402
+
+GROUPS = {
+    "office": {"name": "Office", "stake": 2, "picks": {"Ann": ["Arsenal", "Everton"], "Bob": ["Chelsea"]}},
+    "pub": {"name": "Pub", "picks": {"Cat": ["Burnley"]}},
+}
+
+
+class TestPicksStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_bundled_config_has_default_group(self):
+        store = PicksStore.load(PICKS_PATH)
+        picks = store.picks_frame()
+        self.assertEqual(list(picks.columns), ["Player", "Team"])
+        self.assertEqual(len(picks), 12)
+        self.assertEqual(picks["Player"].nunique(), 6)
+
+    def test_group_lookup(self):
+        store = PicksStore(GROUPS, default_group="pub")
+        self.assertEqual(store.group()["name"], "Pub")
+        self.assertEqual(store.picks_frame("office").values.tolist(),
+                         [["Ann", "Arsenal"], ["Ann", "Everton"], ["Bob", "Chelsea"]])
+        with self.assertRaises(UnknownGroupError):
+            store.group("nope")
+
+    def test_json_and_sqlite_round_trip(self):
+        store = PicksStore(GROUPS, default_group="pub")
+        for name in ("picks.json", "picks.db"):
+            path = os.path.join(self.tmp.name, name)
+            store.save(path)
+            loaded = PicksStore.load(path)
+            self.assertEqual(loaded.groups, store.groups, name)
+            self.assertEqual(loaded.default_group, "pub", name)
+
+    def test_set_group_bumps_version(self):
+        store = PicksStore()
+        self.assertIsNone(store.default_group)
+        store.set_group("new", {"picks": {"Dan": ["Fulham"]}})
+        self.assertEqual(store.version, 1)
+        self.assertEqual(store.default_group, "new")
+        self.assertEqual(store.group("new")["name"], "new")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import unittest
+import sys
+import os
+import json
+import time
+import urllib.error
+import urllib.request
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_live  # noqa: E402
+from json_stream import iter_array_items  # noqa: E402
+from pulse_standin import SHAPES, start_standin  # noqa: E402
+from schema_extractor import extract_standings  # noqa: E402
+
+
+class TestPulseStandin(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = start_standin()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def get(self, path):
+        with urllib.request.urlopen(self.server.url + path, timeout=5) as r:
+            return json.load(r)
+
+    def test_recorded_routes(self):
+        seasons = self.get("/football/competitions/1/compseasons?page=0&pageSize=120")["content"]
+        self.assertEqual(len(seasons), 360)
+        current = [s for s in seasons if s["isCurrent"]]
+        self.assertEqual([(s["label"], s["id"]) for s in current], [("2025/26", 777.0)])
+
+        table = self.get("/football/standings?compSeasons=777&altIds=true&detail=2")["tables"][0]
+        self.assertEqual(len(table["entries"]), 20)
+        self.assertEqual(len(self.get("/football/teams?comps=1&compSeasons=777")["content"]), 20)
+        self.assertEqual(self.server.requests["standings"], 1)
+
+    def test_fixtures_filtered_by_status(self):
+        every = self.get("/football/fixtures?comps=1&compSeasons=777")["content"]
+        upcoming = self.get("/football/fixtures?comps=1&compSeasons=777&statuses=U")["content"]
+        self.assertEqual(len(every), 380)
+        self.assertTrue(0 < len(upcoming) < 380)
+        self.assertEqual({fx["status"] for fx in upcoming}, {"U"})
+
+    def test_unknown_path(self):
+        with self.assertRaises(urllib.error.HTTPError) as cm:
+            self.get("/football/nope")
+        self.assertEqual(cm.exception.code, 404)
+
+
+class TestStandinShapes(unittest.TestCase):
+    """Every layout the stand-in serves parses to the same data."""
+
+    def serve(self, **shape):
+        server = start_standin(**shape)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_season_list_shapes(self):
+        for shape in SHAPES["seasons"]:
+            with self.subTest(seasons=shape):
+                url = self.serve(seasons=shape).url + "/football/competitions/1/compseasons"
+                streamed = pulse_live._season_items(pulse_live.fetch(url, "compseasons", stream=True))
+                parsed = pulse_live._season_items_from_json(pulse_live.fetch(url, "compseasons").json())
+                for items in (streamed, parsed):
+                    self.assertEqual(len(items), 360)
+                    self.assertIn(("2025/26", 777.0), [(s["label"], s["id"]) for s in items if s["isCurrent"]])
+
+    def test_standings_shapes(self):
+        expected = None
+        for tables in SHAPES["tables"]:
+            for stats in SHAPES["stats"]:
+                with self.subTest(tables=tables, stats=stats):
+                    url = self.serve(tables=tables, stats=stats).url + "/football/standings?compSeasons=777"
+                    js = pulse_live.fetch(url, "standings").json()
+                    entries = (js.get("tables") or js.get("standings"))[0]["entries"]
+                    r = pulse_live.fetch(url, "standings", stream=True)
+                    streamed = list(iter_array_items(pulse_live.iter_body(r, "standings"), ("entries",)))
+                    for rows in (entries, streamed):
+                        columns = extract_standings([pulse_live._project_entry(e) for e in rows])
+                        got = list(zip(columns["name"], columns["points"], columns["goals_for"]))
+                        expected = expected or got
+                        self.assertEqual(got, expected)
+        self.assertGreater(sum(points for _, points, _ in expected), 0)
+
+    def test_team_list_shapes(self):
+        previous = pulse_live.BASE_URL
+        self.addCleanup(pulse_live.set_base_url, previous)
+        for shape in SHAPES["teams"]:
+            with self.subTest(teams=shape):
+                pulse_live.set_base_url(self.serve(teams=shape).url)
+                self.assertEqual(len(pulse_live.get_comp_season_teams(777)), 20)
+
+    def test_fixture_list_shapes(self):
+        previous = pulse_live.BASE_URL
+        self.addCleanup(pulse_live.set_base_url, previous)
+        expected = None
+        for shape in SHAPES["matches"]:
+            with self.subTest(matches=shape):
+                pulse_live.set_base_url(self.serve(matches=shape).url)
+                for statuses in ("U,L,C", "C"):
+                    fixtures = pulse_live.get_fixtures(777, statuses)
+                    self.assertTrue(fixtures)
+                    if statuses == "U,L,C":
+                        expected = expected or fixtures
+                        self.assertEqual(fixtures, expected)
+
+    def test_unknown_shape(self):
+        with self.assertRaises(ValueError):
+            start_standin(stats="nested")
+
+
+class TestStandinBehaviour(unittest.TestCase):
+
+    def serve(self, **behaviour):
+        server = start_standin(**behaviour)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_latency(self):
+        server = self.serve(latency=0.2)
+        start = time.perf_counter()
+        with urllib.request.urlopen(server.url + "/football/teams", timeout=5) as r:
+            r.read()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+    def test_seeded_errors(self):
+        def statuses(seed):
+            server = self.serve(error_rate=0.5, error_status=502, seed=seed)
+            for _ in range(40):
+                try:
+                    urllib.request.urlopen(server.url + "/football/teams", timeout=5).close()
+                except urllib.error.HTTPError as e:
+                    self.assertEqual(e.code, 502)
+            return dict(server.statuses)
+
+        first = statuses(7)
+        self.assertEqual(first, statuses(7))
+        self.assertTrue(first[502] and first[200])
+        self.assertEqual(self.serve(error_rate=1.0).statuses, {})
+
+    def test_not_modified(self):
+        server = self.serve()
+        url = server.url + "/football/standings?compSeasons=777"
+        first = pulse_live.fetch(url, "standings")
+        etag = first.headers["ETag"]
+        again = pulse_live.fetch(url, "standings", etag=etag)
+        self.assertEqual((again.status_code, again.content), (304, b""))
+        self.assertEqual(pulse_live.fetch(url, "standings", etag='"stale"').content, first.content)
+        self.assertEqual(server.statuses[304], 1)
+
+        plain = self.serve(etags=False)
+        r = pulse_live.fetch(plain.url + "/football/standings", "standings", etag=etag)
+        self.assertEqual(r.status_code, 200)
+        self.assertNotIn("ETag", r.headers)
+
+    def test_fixtures_reused_on_304(self):
+        server = self.serve()
+        previous = pulse_live.BASE_URL
+        pulse_live.set_base_url(server.url + "/")
+        self.addCleanup(pulse_live.set_base_url, previous)
+        first = pulse_live.get_fixtures(777, "C")
+        self.assertTrue(first)
+        self.assertEqual(pulse_live.get_fixtures(777, "C"), first)
+        self.assertEqual(dict(server.statuses), {200: 1, 304: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
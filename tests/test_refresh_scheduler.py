@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+from datetime import datetime, timezone
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from refresh_scheduler import RefreshScheduler  # noqa: E402
+
+KICKOFF = datetime(2025, 8, 16, 14, 0, tzinfo=timezone.utc).timestamp()
+
+
+class TestRefreshScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = RefreshScheduler(
+            [KICKOFF, KICKOFF],  # simultaneous kickoffs share one window
+            live_interval=60,
+            idle_interval=3600,
+            window_before=600,
+            window_after=7200,
+        )
+
+    def test_windows_merge_and_liveness(self):
+        self.assertEqual(self.scheduler.windows, [(KICKOFF - 600, KICKOFF + 7200)])
+        self.assertTrue(self.scheduler.is_live(KICKOFF + 60))
+        self.assertFalse(self.scheduler.is_live(KICKOFF - 601))
+        self.assertEqual(self.scheduler.interval_at(KICKOFF), 60)
+        self.assertEqual(self.scheduler.interval_at(KICKOFF + 7200), 3600)
+
+    def test_refresh_key_rolls_over_at_next_refresh(self):
+        now = KICKOFF + 30
+        boundary = self.scheduler.next_refresh(now)
+        self.assertEqual(boundary, KICKOFF + 60)
+        self.assertEqual(self.scheduler.refresh_key(now), self.scheduler.refresh_key(boundary - 1))
+        self.assertNotEqual(self.scheduler.refresh_key(now), self.scheduler.refresh_key(boundary))
+
+    def test_idle_key_changes_across_a_match_window(self):
+        scheduler = RefreshScheduler([KICKOFF], window_before=600, window_after=7200)  # 6h idle
+        before, after = KICKOFF - 1200, KICKOFF + 7200 + 1200
+        # 13:40 and 16:20 share a 6h idle bucket, but not the same standings
+        self.assertEqual(int(before // scheduler.idle_interval), int(after // scheduler.idle_interval))
+        self.assertNotEqual(scheduler.refresh_key(before), scheduler.refresh_key(after))
+        self.assertEqual(scheduler.refresh_key(before), scheduler.refresh_key(KICKOFF - 601))
+        self.assertEqual(scheduler.refresh_key(after), scheduler.refresh_key(KICKOFF + 7200))
+
+    def test_next_refresh_stops_at_window_start(self):
+        before = KICKOFF - 601
+        self.assertEqual(self.scheduler.next_refresh(before), KICKOFF - 600)
+
+    def test_request_budget(self):
+        budget = self.scheduler.request_budget(KICKOFF - 600, KICKOFF + 7200)
+        self.assertEqual(budget["live_refreshes"], 129)
+        self.assertEqual(budget["idle_refreshes"], 0)
+        self.assertEqual(budget["upstream_requests"], 129)
+
+
+if __name__ == "__main__":
+    unittest.main()
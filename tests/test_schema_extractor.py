@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+import json
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pulse_live import _league_entries, _league_table  # noqa: E402
+from schema_extractor import extract_standings, extract_team_names  # noqa: E402
+
+
+def overall_entry(pos, name, points, opta="t3"):
+    return {
+        "position": pos,
+        "team": {"name": name, "id": pos, "altIds": {"opta": opta}},
+        "overall": {"points": points, "goalsFor": 10 + pos, "goalsAgainst": 5},
+    }
+
+
+class TestSchemaExtractor(unittest.TestCase):
+
+    def test_overall_layout(self):
+        cols = extract_standings([overall_entry(1, "Arsenal", 30), overall_entry(2, " Chelsea ", 28, "t8")])
+        self.assertListEqual(cols["position"].tolist(), [1, 2])
+        self.assertListEqual(cols["name"].tolist(), ["Arsenal", "Chelsea"])
+        self.assertListEqual(cols["opta"].tolist(), ["t3", "t8"])
+        self.assertListEqual(cols["points"].tolist(), [30, 28])
+        self.assertListEqual(cols["goals_for"].tolist(), [11, 12])
+        self.assertEqual(cols["position"].dtype.name, "int16")
+
+    def test_rank_club_and_stats_layouts(self):
+        dict_stats = [{"rank": "3", "club": {"name": "Everton"}, "stats": {"points": 7}}]
+        cols = extract_standings(dict_stats)
+        self.assertListEqual(cols["position"].tolist(), [3])
+        self.assertListEqual(cols["name"].tolist(), ["Everton"])
+        self.assertListEqual(cols["points"].tolist(), [7])
+        self.assertListEqual(cols["opta"].tolist(), [""])
+
+        list_stats = [{"position": 4, "team": {"name": "Fulham"}, "stats": [{"name": "pts", "value": 5}]}]
+        self.assertListEqual(extract_standings(list_stats)["points"].tolist(), [5])
+
+    def test_mixed_entries_fall_back_and_bad_entries_are_dropped(self):
+        entries = [
+            overall_entry(1, "Arsenal", 30),
+            {"rank": 2, "club": {"name": "Chelsea"}, "points": 28},
+            {"position": 3, "team": {}},  # no name
+            {"position": "n/a", "team": {"name": "Everton"}},  # bad position
+        ]
+        cols = extract_standings(entries)
+        self.assertListEqual(cols["name"].tolist(), ["Arsenal", "Chelsea"])
+        self.assertListEqual(cols["points"].tolist(), [30, 28])
+
+    def test_empty_entries(self):
+        self.assertIsNone(extract_standings([]))
+
+    def test_team_names(self):
+        self.assertListEqual(extract_team_names([{"name": "Arsenal"}, {"club": {"name": "Chelsea"}}]), ["Arsenal", "Chelsea"])
+        self.assertListEqual(extract_team_names([{"team": {"name": " Everton "}}]), ["Everton"])
+
+
+class TestLeagueTable(unittest.TestCase):
+    """The league (TOTAL) table is picked even when it isn't listed first."""
+
+    def payload(self, key="tables"):
+        home = {"type": "HOME", "entries": [overall_entry(1, "Everton", 12)]}
+        total = {"stage": {"type": "TOTAL"}, "entries": [overall_entry(1, "Arsenal", 30), overall_entry(2, "Chelsea", 28)]}
+        away = {"type": "AWAY", "entries": [overall_entry(1, "Fulham", 9)]}
+        return {"compSeason": {"id": 777}, key: [home, total, away]}
+
+    def test_streamed_entries(self):
+        for key in ("tables", "standings"):
+            body = json.dumps(self.payload(key)).encode()
+            chunks = [body[i:i + 50] for i in range(0, len(body), 50)]
+            names = extract_standings(_league_entries(chunks))["name"].tolist()
+            self.assertListEqual(names, ["Arsenal", "Chelsea"])
+
+    def test_untyped_tables_use_the_first(self):
+        body = json.dumps({"tables": [{"entries": [overall_entry(1, "Everton", 12)]}, {"entries": []}]})
+        self.assertListEqual(extract_standings(_league_entries([body]))["name"].tolist(), ["Everton"])
+
+    def test_full_parse(self):
+        self.assertEqual(_league_table(self.payload()["tables"])["stage"]["type"], "TOTAL")
+        self.assertIsNone(_league_table([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
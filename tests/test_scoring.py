@@ -0,0 +1,127 @@
+import unittest
+import sys
+import os
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring import (  # noqa: E402
+    PickMatrix,
+    leaderboard,
+    merge_standings,
+    player_cards,
+    position_conflicts,
+    rule_leaders,
+    what_if_totals,
+)
+from scoring_rules import SCORING_RULES, ScoringRule  # noqa: E402
+
+STANDINGS = pd.DataFrame(
+    {"Team": ["Arsenal", "Chelsea", "Everton"], "Points_Value": [20, 19, 5]}
+)
+
+# Position 1 = 20 points; goal difference Arsenal +20, Chelsea +5, Everton -10
+RULE_STANDINGS = pd.DataFrame({
+    "Team": ["Arsenal", "Chelsea", "Everton"],
+    "Position": [1, 2, 20],
+    "Points_League": [50, 40, 22],
+    "Goals_For": [30, 25, 10],
+    "Goals_Against": [10, 20, 20],
+    "Points_Value": [20, 19, 1],
+})
+
+
+class TestPickMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = PickMatrix(
+            {
+                "office": {"picks": {"Ann": ["Arsenal", "Everton"], "Bob": ["Chelsea", "Leeds"]}},
+                "pub": {"picks": {"Cat": ["arsenal"], "Dan": []}},
+            },
+            canonical=lambda name: name.title(),
+        )
+
+    def test_slots_are_contiguous_per_group(self):
+        self.assertEqual(self.matrix.group_slots, {"office": (0, 2), "pub": (2, 4)})
+        self.assertEqual(self.matrix.teams, ["Arsenal", "Everton", "Chelsea", "Leeds"])
+
+    def test_scores_all_groups_in_one_pass(self):
+        scores = self.matrix.score_standings(STANDINGS)
+        # Leeds isn't in the table and scores 0; Dan has no picks
+        self.assertEqual(scores.tolist(), [25, 19, 20, 0])
+
+    def test_group_totals_sorted(self):
+        scores = self.matrix.score_standings(STANDINGS)
+        totals = self.matrix.group_totals("office", scores)
+        self.assertEqual(totals.values.tolist(), [["Ann", 25], ["Bob", 19]])
+
+    def test_empty(self):
+        matrix = PickMatrix({})
+        self.assertEqual(len(matrix.score_standings(STANDINGS)), 0)
+        self.assertEqual(matrix.score_rules(RULE_STANDINGS).shape, (len(SCORING_RULES), 0))
+
+    def test_scores_every_rule_in_one_pass(self):
+        scores = self.matrix.score_rules(RULE_STANDINGS)
+        self.assertEqual(scores.shape, (len(SCORING_RULES), 4))
+        by_rule = dict(zip(SCORING_RULES, scores.tolist()))
+        # Default rule matches the Points_Value scoring
+        self.assertEqual(by_rule["position"], self.matrix.score_standings(RULE_STANDINGS).tolist())
+        self.assertEqual(by_rule["league_points"], [72, 40, 50, 0])
+        self.assertEqual(by_rule["goal_difference"], [10, 5, 20, 0])
+        self.assertEqual(by_rule["hybrid"], [21 + 36 + 2.5, 19 + 20 + 1.25, 20 + 25 + 5, 0])
+
+    def test_preseason_position_rule_matches_points_value(self):
+        preseason = RULE_STANDINGS.assign(Position=0, Points_League=0, Goals_For=0, Goals_Against=0, Points_Value=0)
+        by_rule = dict(zip(SCORING_RULES, self.matrix.score_rules(preseason).tolist()))
+        self.assertEqual(by_rule["position"], self.matrix.score_standings(preseason).tolist())
+        self.assertEqual(by_rule["position"], [0, 0, 0, 0])
+
+    def test_custom_rules(self):
+        rules = {"double": ScoringRule("double", "Double", {"inverse_position": 2})}
+        self.assertEqual(self.matrix.score_rules(RULE_STANDINGS, rules).tolist(), [[42, 38, 40, 0]])
+        with self.assertRaises(ValueError):
+            ScoringRule("bad", "Bad", {"corners": 1})
+
+    def test_group_rule_totals_and_leaders(self):
+        scores = self.matrix.score_rules(RULE_STANDINGS)
+        totals = self.matrix.group_rule_totals("office", scores, SCORING_RULES)
+        self.assertEqual(totals.columns.tolist(), ["Player", *SCORING_RULES])
+        self.assertEqual(totals["Player"].tolist(), ["Ann", "Bob"])
+        self.assertEqual(rule_leaders(totals), {name: ["Ann"] for name in SCORING_RULES})
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestScoringHelpers(unittest.TestCase):
+
+    def setUp(self):
+        picks = pd.DataFrame(
+            {"Player": ["Ann", "Ann", "Bob"], "Team": ["Arsenal", "Leeds", "Chelsea"]}
+        )
+        standings = STANDINGS.assign(Position=[1, 2, 16], Points_League=[30, 28, 10])
+        self.merged, self.missing = merge_standings(picks, standings)
+
+    def test_merge_fills_missing_teams(self):
+        self.assertEqual(self.missing.values.tolist(), [["Ann", "Leeds"]])
+        leeds = self.merged[self.merged["Team"] == "Leeds"].iloc[0]
+        self.assertEqual((leeds["Position"], leeds["Points_Value"]), (0, 0))
+
+    def test_leaderboard_ties_share_rank(self):
+        board = leaderboard(pd.DataFrame({"Player": ["A", "B", "C"], "Points_Value": [5, 9, 5]}))
+        self.assertEqual(board.values.tolist(), [[1, "B", 9], [2, "A", 5], [2, "C", 5]])
+
+    def test_player_cards(self):
+        cards = player_cards(self.merged)
+        self.assertEqual([c["player"] for c in cards], ["Ann", "Bob"])
+        self.assertEqual(cards[0]["total"], 20)
+        self.assertIsNone(cards[0]["teams"][1]["position"])
+
+    def test_what_if(self):
+        self.assertEqual(position_conflicts({"Arsenal": 3, "Chelsea": 3, "Leeds": 1}), {3: ["Arsenal", "Chelsea"]})
+        totals = what_if_totals(self.merged, {"Leeds": 1, "Arsenal": 20})
+        self.assertEqual(totals.values.tolist(), [["Ann", 21], ["Bob", 19]])
@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from picks_store import PicksStore  # noqa: E402
+from season_archive import SeasonArchive, collect_seasons, write_archive  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+def make_standings(arsenal_points=10):
+    return pd.DataFrame({
+        "Position": [1, 2, 3],
+        "Team": ["Arsenal", "Chelsea", "Fulham"],
+        "Points_League": [arsenal_points, 9, 4],
+        "Points_Value": [20, 19, 18],
+    })
+
+
+GROUPS = {
+    "old": {"name": "Old Sweep", "season": "2024/25", "picks": {"Ann": ["Arsenal", "Fulham"]}},
+    "new": {"name": "New Sweep", "picks": {"Bob": ["Chelsea"], "Cat": ["Arsenal"]}},
+}
+
+
+class TestSeasonArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshots = SnapshotStore(os.path.join(self.tmp.name, "snapshots"))
+        self.path = os.path.join(self.tmp.name, "season_archive.bin")
+        self.snapshots.append("2024/25", make_standings(10), datetime(2025, 1, 1, tzinfo=timezone.utc))
+        self.snapshots.append("2024/25", make_standings(13), datetime(2025, 1, 8, tzinfo=timezone.utc))
+        self.snapshots.append("2025/26", make_standings(3), datetime(2025, 9, 1, tzinfo=timezone.utc))
+        store = PicksStore(GROUPS, "new")
+        write_archive(self.path, collect_seasons(self.snapshots, store, current_season="2025/26"))
+        self.archive = SeasonArchive.open(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_seasons_newest_first(self):
+        self.assertListEqual(self.archive.seasons(), ["2025/26", "2024/25"])
+        self.assertIn("2024/25", self.archive)
+        self.assertNotIn("2019/20", self.archive)
+
+    def test_columns_are_views_into_the_mapping(self):
+        cols = self.archive.season("2024/25").columns(0)
+        for col in cols.values():
+            self.assertFalse(col.flags.owndata)
+            self.assertIsInstance(col.base, np.memmap)
+
+    def test_standings_snapshot(self):
+        view = self.archive.season("2024/25")
+        self.assertEqual(len(view), 2)
+        self.assertListEqual(view.dates(), ["2025-01-01", "2025-01-08"])
+        latest = view.standings()
+        self.assertEqual(latest.attrs["source"], "archive")
+        self.assertListEqual(latest["Team"].tolist(), ["Arsenal", "Chelsea", "Fulham"])
+        self.assertListEqual(latest["Points_League"].tolist(), [13, 9, 4])
+        self.assertListEqual(view.standings(0)["Points_League"].tolist(), [10, 9, 4])
+
+    def test_picks_follow_group_season(self):
+        old = self.archive.season("2024/25").picks_store()
+        self.assertListEqual(old.group_ids(), ["old"])
+        self.assertDictEqual(old.group("old")["picks"], {"Ann": ["Arsenal", "Fulham"]})
+        new = self.archive.season("2025/26").picks_store()
+        self.assertEqual(new.default_group, "new")
+        self.assertDictEqual(new.group()["picks"], {"Bob": ["Chelsea"], "Cat": ["Arsenal"]})
+
+    def test_rebuild_keeps_seasons_no_longer_in_the_store(self):
+        empty = SnapshotStore(os.path.join(self.tmp.name, "empty"))
+        write_archive(self.path, collect_seasons(empty, PicksStore({}), self.archive))
+        rebuilt = SeasonArchive.open(self.path)
+        self.assertListEqual(rebuilt.seasons(), ["2025/26", "2024/25"])
+        pd.testing.assert_frame_equal(
+            rebuilt.season("2024/25").standings(), self.archive.season("2024/25").standings()
+        )
+
+    def test_empty_season(self):
+        path = os.path.join(self.tmp.name, "empty.bin")
+        write_archive(path, {"2023/24": {"snapshots": [], "groups": {}}, "2024/25": {"snapshots": [make_standings()]}})
+        view = SeasonArchive.open(path).season("2023/24")
+        self.assertEqual((len(view), view.dates(), view.daily_standings()), (0, [], []))
+        with self.assertRaisesRegex(ValueError, "no archived snapshots"):
+            view.standings()
+        self.assertEqual(len(SeasonArchive.open(path).season("2024/25").standings()), 3)
+
+    def test_open_rejects_other_files(self):
+        other = os.path.join(self.tmp.name, "other.bin")
+        with open(other, "wb") as f:
+            f.write(b"not an archive")
+        self.assertIsNone(SeasonArchive.open(other))
+        self.assertIsNone(SeasonArchive.open(os.path.join(self.tmp.name, "missing.bin")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import COALESCED_CALLS  # noqa: E402
+from singleflight import SingleFlight, coalesce  # noqa: E402
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def run_concurrently(self, fn, n=8):
+        barrier = threading.Barrier(n)
+        results, errors = [], []
+
+        def call():
+            barrier.wait()
+            try:
+                results.append(fn())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results, errors
+
+    def test_concurrent_callers_share_one_call(self):
+        calls = []
+
+        @coalesce("test_share")
+        def slow(label="2025/26"):
+            calls.append(label)
+            time.sleep(0.2)
+            return {"label": label}
+
+        # Mix positional and defaulted calls: both bind to the same key
+        variants = iter([slow, lambda: slow("2025/26")] * 4)
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                fn = next(variants)
+            return fn()
+
+        results, errors = self.run_concurrently(call)
+        self.assertEqual((len(calls), errors), (1, []))
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(COALESCED_CALLS.value(call="test_share", result="shared"), 7)
+        self.assertEqual(slow.flight.in_flight(), 0)
+
+        # Finished calls aren't cached: the next caller runs again
+        slow()
+        self.assertEqual(len(calls), 2)
+
+    def test_exception_is_shared(self):
+        flight = SingleFlight("test_error")
+        calls = []
+
+        def boom():
+            calls.append(1)
+            time.sleep(0.2)
+            raise RuntimeError("upstream down")
+
+        results, errors = self.run_concurrently(lambda: flight.do("k", boom), n=4)
+        self.assertEqual((len(calls), len(results), len(errors)), (1, 0, 4))
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight("test_keys")
+        self.assertEqual(flight.do("a", lambda: 1), 1)
+        self.assertEqual(flight.do("b", lambda: 2), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+def make_standings(arsenal_points=10):
+    return pd.DataFrame(
+        {"Position": [1, 2], "Team": ["Arsenal", "Chelsea"], "Points_League": [arsenal_points, 9]}
+    )
+
+
+class TestSnapshotStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_only_changed_content_is_appended(self):
+        self.assertTrue(self.store.append("2025/26", make_standings()))
+        self.assertFalse(self.store.append("2025/26", make_standings()))
+        self.assertTrue(self.store.append("2025/26", make_standings(13)))
+        self.assertEqual(len(self.store.history("2025/26")), 2)
+
+    def test_latest_round_trips(self):
+        self.assertIsNone(self.store.latest("2025/26"))
+        self.store.append("2025/26", make_standings(13))
+        latest = self.store.latest("2025/26")
+        self.assertListEqual(latest["Points_League"].tolist(), [13, 9])
+        self.assertIn("taken_at", latest.attrs)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "2025-26.jsonl")))
+
+    def test_version_changes_on_append(self):
+        self.assertEqual(self.store.version("2025/26"), (0, 0))
+        self.store.append("2025/26", make_standings())
+        first = self.store.version("2025/26")
+        self.store.append("2025/26", make_standings(13))
+        self.assertNotEqual(self.store.version("2025/26"), first)
+
+    def test_read_since_returns_only_complete_new_lines(self):
+        self.assertEqual(self.store.read_since("2025/26"), ([], 0))
+        self.store.append("2025/26", make_standings())
+        first, offset = self.store.read_since("2025/26")
+        self.assertEqual(len(first), 1)
+        self.store.append("2025/26", make_standings(13))
+        with open(self.store.path("2025/26"), "a", encoding="utf-8") as f:
+            f.write('{"taken_at": ')  # a snapshot still being written
+        new, offset = self.store.read_since("2025/26", offset)
+        self.assertEqual([df["Points_League"].tolist() for df in new], [[13, 9]])
+        self.assertEqual(self.store.read_since("2025/26", offset), ([], offset))
+
+
+if __name__ == "__main__":
+    unittest.main()
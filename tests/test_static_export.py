@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from picks_store import PicksStore  # noqa: E402
+from static_export import export_site, hashed_name  # noqa: E402
+
+CREST = "https://example.com/badges/t3.png"
+
+
+def standings(first="Arsenal"):
+    teams = [first] + [t for t in ["Arsenal", "Burnley", "Chelsea"] if t != first]
+    return pd.DataFrame(
+        {
+            "Position": [1, 2, 3],
+            "Team": teams,
+            "Points_League": [9, 6, 3],
+            "Points_Value": [20, 19, 18],
+            "Crest_URL": [CREST, None, None],
+        }
+    )
+
+
+class TestStaticExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, "site")
+        self.faces = os.path.join(self.tmp.name, "faces")
+        os.makedirs(self.faces)
+        with open(os.path.join(self.faces, "Ann.png"), "wb") as f:
+            f.write(b"ann-face")
+        self.store = PicksStore({"g": {"name": "Office", "picks": {"Ann": ["Arsenal"], "Bob": ["Burnley"]}}})
+        self.downloads = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def download(self, url):
+        self.downloads.append(url)
+        return b"crest-bytes"
+
+    def export(self, df, **kwargs):
+        return export_site(self.out, df, self.store, headshot_dir=self.faces, download=self.download, **kwargs)
+
+    def test_export_writes_hashed_assets(self):
+        self.assertTrue(self.export(standings()))
+        with open(os.path.join(self.out, "data.json")) as f:
+            data = json.load(f)
+        face = data["headshots"]["Ann"]
+        self.assertEqual(face, "assets/" + hashed_name("Ann.png", b"ann-face"))
+        self.assertTrue(os.path.exists(os.path.join(self.out, face)))
+        for name in (face, "data.json"):
+            self.assertEqual(os.stat(os.path.join(self.out, name)).st_mode & 0o777, 0o644)
+        self.assertEqual(data["standings"][0]["Crest_URL"], "assets/" + hashed_name("t3.png", b"crest-bytes"))
+        self.assertEqual(data["leaderboard"][0]["Player"], "Ann")
+        with open(os.path.join(self.out, "index.html")) as f:
+            self.assertIn(face, f.read())
+        self.assertEqual([n for n in os.listdir(self.out) if n.endswith(".tmp")], [])
+
+    def test_regenerates_only_on_change(self):
+        self.assertTrue(self.export(standings()))
+        self.assertFalse(self.export(standings()))
+        self.assertTrue(self.export(standings(first="Burnley")))
+        self.assertTrue(self.export(standings(first="Burnley"), force=True))
+        self.assertEqual(self.downloads, [CREST])  # crest remembered in the manifest
+
+
+if __name__ == "__main__":
+    unittest.main()
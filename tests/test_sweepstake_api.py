@@ -0,0 +1,102 @@
+import unittest
+import sys
+import os
+import gzip
+import http.client
+import json
+
+import pandas as pd
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from picks_store import PicksStore  # noqa: E402
+from sweepstake_api import ApiState, start_api_server  # noqa: E402
+
+TEAMS = ["Arsenal", "Burnley", "Chelsea", "Everton"]
+
+
+def standings(order=TEAMS):
+    df = pd.DataFrame(
+        {
+            "Position": range(1, len(order) + 1),
+            "Team": order,
+            "Points_League": [30, 20, 10, 5],
+            "Points_Value": [20 - i for i in range(len(order))],
+        }
+    )
+    df.attrs["source"] = "live"
+    return df
+
+
+class TestSweepstakeApi(unittest.TestCase):
+
+    def setUp(self):
+        store = PicksStore(
+            {
+                "a": {"name": "Group A", "picks": {"Ann": ["Arsenal", "Burnley"], "Bob": ["Chelsea", "Everton"]}},
+                "b": {"name": "Group B", "picks": {"Cat": ["Everton"]}},
+            }
+        )
+        self.state = ApiState(store, "2025/26")
+        self.assertTrue(self.state.update(standings()))
+        self.server = start_api_server(self.state, port=0)
+        self.conn = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=5)
+
+    def tearDown(self):
+        self.conn.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get(self, path, **headers):
+        self.conn.request("GET", path, headers=headers)
+        r = self.conn.getresponse()
+        return r, r.read()
+
+    def test_routes(self):
+        r, body = self.get("/standings")
+        self.assertEqual(r.status, 200)
+        self.assertEqual([row["Team"] for row in json.loads(body)["standings"]], TEAMS)
+
+        r, body = self.get("/leaderboard")
+        doc = json.loads(body)
+        self.assertEqual((doc["group"], doc["leaderboard"][0]["Player"]), ("a", "Ann"))
+
+        r, body = self.get("/leaderboard?group=b")
+        self.assertEqual(json.loads(body)["leaderboard"], [{"Rank": 1, "Player": "Cat", "Points_Value": 17}])
+
+        r, body = self.get("/players/ann")
+        self.assertEqual(json.loads(body)["total"], 39)
+
+        for path in ("/players/nobody", "/leaderboard?group=zzz", "/nope"):
+            r, _ = self.get(path)
+            self.assertEqual(r.status, 404, path)
+
+    def test_etag_and_gzip(self):
+        r, body = self.get("/leaderboard")
+        etag = r.getheader("ETag")
+        r, empty = self.get("/leaderboard", **{"If-None-Match": etag})
+        self.assertEqual((r.status, empty), (304, b""))
+
+        r, zipped = self.get("/leaderboard", **{"Accept-Encoding": "gzip"})
+        self.assertEqual(r.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(zipped), body)
+
+    def test_unknown_players_are_not_cached(self):
+        cached = len(self.state._gen.responses)
+        for i in range(50):
+            self.assertIsNone(self.state.get("players", player=f"nobody{i}"))
+        self.assertEqual(len(self.state._gen.responses), cached)
+        self.assertIsNotNone(self.state.get("players", player="Ann"))
+        self.assertEqual(len(self.state._gen.responses), cached + 1)
+
+    def test_update_only_on_change(self):
+        before = self.state.get("leaderboard")
+        self.assertFalse(self.state.update(standings()))
+        self.assertIs(self.state.get("leaderboard"), before)  # same pre-serialized body
+        self.assertTrue(self.state.update(standings(TEAMS[::-1])))
+        self.assertNotEqual(self.state.get("leaderboard").etag, before.etag)
+
+
+if __name__ == "__main__":
+    unittest.main()
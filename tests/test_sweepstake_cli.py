@@ -0,0 +1,110 @@
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sweepstake_cli  # noqa: E402
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STANDINGS = [
+    {"Position": i + 1, "Team": team, "Points_League": 40 - 2 * i, "Points_Value": 20 - i}
+    for i, team in enumerate(
+        ["Arsenal", "Burnley", "Chelsea", "Everton", "Fulham", "Leeds United", "Sunderland"]
+    )
+]
+PICKS = {
+    "default_group": "a",
+    "groups": {
+        "a": {"name": "Group A", "picks": {"Ann": ["Arsenal", "Leeds United"], "Bob": ["Burnley", "Everton"]}},
+        "b": {"name": "Group B", "picks": {"Cat": ["Chelsea", "Fulham"], "Dan": ["Sunderland"]}},
+    },
+}
+
+
+class TestSweepstakeCli(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.standings = os.path.join(self.tmp.name, "standings.json")
+        self.picks = os.path.join(self.tmp.name, "picks.json")
+        with open(self.standings, "w") as f:
+            json.dump(STANDINGS, f)
+        with open(self.picks, "w") as f:
+            json.dump(PICKS, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, *args):
+        out, err = StringIO(), StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = sweepstake_cli.main(["--picks", self.picks, "--standings", self.standings, *args])
+        return code, out.getvalue()
+
+    def test_json_to_stdout(self):
+        code, out = self.run_cli("--what-if", "Everton=1")
+        self.assertEqual(code, 0)
+        doc = json.loads(out)
+        group = doc["groups"]["a"]
+        self.assertEqual(group["leaderboard"][0], {"Rank": 1, "Player": "Bob", "Points_Value": 36})
+        self.assertEqual(group["cards"][1]["total"], 36)
+        self.assertEqual(group["what_if"][0], {"Rank": 1, "Player": "Bob", "Points_Value": 39})
+
+    def test_all_groups_to_files(self):
+        out_dir = os.path.join(self.tmp.name, "out")
+        code, _ = self.run_cli("--all-groups", "--format", "csv", "-o", out_dir)
+        self.assertEqual(code, 0)
+        self.assertEqual(sorted(os.listdir(out_dir)), ["a", "b"])
+        with open(os.path.join(out_dir, "b", "leaderboard.csv")) as f:
+            self.assertEqual(f.read().splitlines(), ["Rank,Player,Points_Value", "1,Cat,34", "2,Dan,14"])
+        self.assertEqual(os.stat(os.path.join(out_dir, "b", "leaderboard.csv")).st_mode & 0o777, 0o644)
+
+    def test_minimal_standings_files(self):
+        csv_path = os.path.join(self.tmp.name, "standings.csv")
+        json_path = os.path.join(self.tmp.name, "minimal.json")
+        with open(csv_path, "w") as f:
+            f.write("Position,Team\n")
+            f.writelines(f"{r['Position']},{r['Team']}\n" for r in STANDINGS)
+        with open(json_path, "w") as f:
+            json.dump([{"Position": r["Position"], "Team": r["Team"]} for r in STANDINGS], f)
+        for path in (csv_path, json_path):
+            out = StringIO()
+            with redirect_stdout(out), redirect_stderr(StringIO()):
+                code = sweepstake_cli.main(["--picks", self.picks, "--standings", path])
+            self.assertEqual(code, 0)
+            group = json.loads(out.getvalue())["groups"]["a"]
+            self.assertEqual(group["leaderboard"], [{"Rank": 1, "Player": "Bob", "Points_Value": 36},
+                                                    {"Rank": 2, "Player": "Ann", "Points_Value": 35}])
+
+            df = sweepstake_cli.read_standings_file(path)
+            self.assertEqual(df["Points_Value"].tolist(), [20 - i for i in range(len(STANDINGS))])
+            self.assertEqual(df["Points_League"].tolist(), [0] * len(STANDINGS))
+            self.assertIn("Crest_URL", df)
+
+    def test_rejects_standings_without_required_columns(self):
+        csv_path = os.path.join(self.tmp.name, "standings.csv")
+        with open(csv_path, "w") as f:
+            f.write("Team,Points_League\nArsenal,40\n")
+        with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+            sweepstake_cli.main(["--picks", self.picks, "--standings", csv_path])
+
+    def test_rejects_conflicting_what_if(self):
+        with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+            self.run_cli("--what-if", "Everton=1", "--what-if", "Fulham=1")
+
+    def test_imports_no_streamlit_or_altair(self):
+        code = "import sys, sweepstake_cli; print(any(m.split('.')[0] in ('streamlit', 'altair') for m in sys.modules))"
+        out = subprocess.run([sys.executable, "-c", code], cwd=REPO, capture_output=True, text=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
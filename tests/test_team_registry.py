@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team_registry import REGISTRY_PATH, SEED_PATH, TeamRegistry, name_key  # noqa: E402
+
+
+class TestTeamRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "team_registry.json")
+        self.registry = TeamRegistry.load(self.path)  # falls back to the seed
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_name_key_normalises_spelling(self):
+        self.assertEqual(name_key("Brighton & Hove Albion"), name_key("brighton and hove albion"))
+        self.assertEqual(name_key("AFC Bournemouth"), name_key("Bournemouth"))
+
+    def test_seed_lookup_and_aliases(self):
+        self.assertTrue(os.path.exists(SEED_PATH))
+        self.assertEqual(self.registry.canonical("Brighton and Hove Albion"), "Brighton & Hove Albion")
+        self.assertEqual(self.registry.canonical("Spurs"), "Tottenham Hotspur")
+        self.assertEqual(self.registry.opta_id("Chelsea"), "t8")
+        # Ipswich no longer shares Chelsea's Opta id
+        self.assertNotEqual(self.registry.opta_id("Ipswich Town"), "t8")
+        self.assertEqual(self.registry.canonical(" Unknown FC "), "Unknown FC")
+
+    def test_learn_and_persist(self):
+        self.assertFalse(self.registry.learn(1, "Arsenal", "t3"))
+        self.assertTrue(self.registry.learn(999, "Wrexham", "t999"))
+        self.assertTrue(self.registry.learn(999, "Wrexham AFC Official"))
+        self.assertEqual(self.registry.canonical("Wrexham"), "Wrexham AFC Official")
+        self.registry.save()
+
+        reloaded = TeamRegistry.load(self.path)
+        self.assertEqual(reloaded.crest("Wrexham"), "https://resources.premierleague.com/premierleague/badges/50/t999.png")
+        self.assertEqual(reloaded.canonical("Spurs"), "Tottenham Hotspur")
+
+    def test_save_leaves_the_seed_alone(self):
+        with open(SEED_PATH, "rb") as f:
+            seed = f.read()
+        self.registry.learn(999, "Wrexham", "t999")
+        self.registry.save()
+        with open(SEED_PATH, "rb") as f:
+            self.assertEqual(f.read(), seed)
+        self.assertNotEqual(os.path.abspath(REGISTRY_PATH), os.path.abspath(SEED_PATH))
+
+
+if __name__ == "__main__":
+    unittest.main()
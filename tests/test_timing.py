@@ -0,0 +1,43 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path so we can import the main module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timing  # noqa: E402
+
+
+class TestTiming(unittest.TestCase):
+
+    def setUp(self):
+        timing.ROLLING.clear()
+
+    def test_spans_reach_run_and_rolling_window(self):
+        run = timing.start_run()
+        with timing.span("stage_a"):
+            pass
+        with timing.span("stage_a"):
+            pass
+        self.assertEqual([stage for stage, _ in run.spans], ["stage_a", "stage_a"])
+        self.assertIn("stage_a", run.totals())
+        self.assertEqual(timing.ROLLING.summary()[0]["Samples"], 2)
+
+    def test_percentiles_use_nearest_rank(self):
+        rolling = timing.RollingTimings(window=100)
+        for ms in range(1, 101):
+            rolling.record("x", ms / 1000)
+        pct = rolling.percentiles("x")
+        self.assertAlmostEqual(pct[50], 0.050)
+        self.assertAlmostEqual(pct[95], 0.095)
+        self.assertAlmostEqual(pct[99], 0.099)
+
+    def test_window_is_bounded(self):
+        rolling = timing.RollingTimings(window=3)
+        for s in (10.0, 1.0, 2.0, 3.0):
+            rolling.record("x", s)
+        self.assertEqual(rolling.percentiles("x", qs=(100,))[100], 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
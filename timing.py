@@ -0,0 +1,114 @@
+"""Stage timing spans for app reruns.
+
+Wrap a stage in ``with span("stage_name"):`` to time it. Every span feeds
+a process-wide rolling window (``ROLLING``) used for p50/p95/p99, and, if
+a rerun has called ``start_run()``, that rerun's own ``RunTimings`` too.
+Spans opened outside a rerun (e.g. the prewarm thread) only reach the
+rolling window, which is what lets upstream latency and app-side cost be
+told apart.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+WINDOW_SIZE = 500  # samples kept per stage
+PERCENTILES = (50, 95, 99)
+
+_current_run: ContextVar = ContextVar("timing_run", default=None)
+
+
+def _percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-q * len(sorted_values) // 100))  # ceil without floats
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class RunTimings:
+    """Spans recorded during a single rerun, in the order they finished."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: list[tuple[str, float]] = []
+
+    def add(self, stage: str, seconds: float):
+        self.spans.append((stage, seconds))
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def totals(self) -> dict[str, float]:
+        """Seconds per stage, summing stages that ran more than once."""
+        totals: dict[str, float] = {}
+        for stage, seconds in self.spans:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+
+class RollingTimings:
+    """Thread-safe rolling window of span durations per stage."""
+
+    def __init__(self, window: int = WINDOW_SIZE):
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentiles(self, stage: str, qs=PERCENTILES) -> dict[int, float | None]:
+        with self._lock:
+            values = sorted(self._samples.get(stage, ()))
+        return {q: _percentile(values, q) for q in qs}
+
+    def summary(self) -> list[dict]:
+        """One row per stage with the sample count and percentiles in ms."""
+        with self._lock:
+            stages = {stage: sorted(samples) for stage, samples in self._samples.items()}
+        rows = []
+        for stage, values in sorted(stages.items()):
+            row = {"Stage": stage, "Samples": len(values)}
+            for q in PERCENTILES:
+                row[f"p{q} (ms)"] = round(_percentile(values, q) * 1000, 2)
+            rows.append(row)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+ROLLING = RollingTimings()
+
+
+def start_run() -> RunTimings:
+    """Begin collecting spans for the current rerun (thread/context local)."""
+    run = RunTimings()
+    _current_run.set(run)
+    return run
+
+
+def current_run() -> RunTimings | None:
+    return _current_run.get()
+
+
+@contextmanager
+def span(stage: str):
+    """Time the enclosed block under ``stage``; also usable as a decorator."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        ROLLING.record(stage, elapsed)
+        run = _current_run.get()
+        if run is not None:
+            run.add(stage, elapsed)